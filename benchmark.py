@@ -0,0 +1,480 @@
+# benchmark.py
+
+import gc
+import sys
+import json
+import time
+import asyncio
+import argparse
+import platform
+import threading
+import tracemalloc
+from typing import Any, Callable
+
+from looperation import Operator, Superator, Executor, Signal
+
+ITERATIONS = 100_000
+
+class Parking(Signal):
+    """A resume signal that records when the loop of an operator parks on it."""
+
+    def __init__(self, value: bool = False) -> None:
+        """
+        Defines the attributes of the signal.
+
+        :param value: The initial value of the signal.
+        """
+
+        super().__init__(value=value)
+
+        self.parked: float | None = None
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+        Records the first time the loop waits, and blocks until the signal is set.
+
+        :param timeout: The maximum amount of seconds to wait.
+
+        :return: The value of the signal.
+        """
+
+        if self.parked is None:
+            self.parked = time.perf_counter()
+
+        return super().wait(timeout)
+
+def stop_all(operators: list[Operator]) -> None:
+    """
+    Stops operators and waits for their threads to exit.
+
+    :param operators: The operators to stop.
+    """
+
+    processes = [operator._operation_process for operator in operators]
+
+    for operator in operators:
+        operator.stop()
+
+    for process in processes:
+        if isinstance(process, threading.Thread):
+            process.join()
+
+def counting_operator(operation, iterations: int) -> tuple[Operator, list[int]]:
+    """
+    Creates an operator that stops itself after a number of iterations.
+
+    :param operation: The operation to wrap.
+    :param iterations: The amount of iterations to run.
+
+    :return: The operator and its counter.
+    """
+
+    counter = [0]
+
+    operator = Operator()
+
+    if asyncio.iscoroutinefunction(operation):
+        async def counted() -> None:
+            await operation()
+
+            counter[0] += 1
+
+            if counter[0] >= iterations:
+                operator.stop()
+
+    else:
+        def counted() -> None:
+            operation()
+
+            counter[0] += 1
+
+            if counter[0] >= iterations:
+                operator.stop()
+
+    operator.operation = counted
+
+    return operator, counter
+
+def measure_loop(operation, iterations: int = ITERATIONS, force_async: bool = False) -> float:
+    """
+    Measures the time of a single loop iteration of an operator.
+
+    :param operation: The operation to run.
+    :param iterations: The amount of iterations to run.
+    :param force_async: The value to run a synchronous operation through the event loop.
+
+    :return: The amount of microseconds per iteration.
+    """
+
+    operator, counter = counting_operator(operation, iterations)
+
+    start = time.perf_counter()
+
+    if force_async:
+        operator.prepare(block=True)
+        operator._operating = True
+
+        asyncio.run(operator.async_operation_loop())
+
+    else:
+        operator.run(block=True)
+
+    return (time.perf_counter() - start) / counter[0] * 1e6
+
+def measure_operate(operation, iterations: int = ITERATIONS // 10) -> float:
+    """
+    Measures the time of a standalone call to the operation of an operator.
+
+    :param operation: The operation to run.
+    :param iterations: The amount of calls to make.
+
+    :return: The amount of microseconds per call.
+    """
+
+    operator = Operator(operation=operation)
+
+    start = time.perf_counter()
+
+    for _ in range(iterations):
+        operator.operate()
+
+    return (time.perf_counter() - start) / iterations * 1e6
+
+def summarize(values: list[float]) -> dict[str, float | None]:
+    """
+    Summarizes a list of measurements.
+
+    :param values: The measurements.
+
+    :return: The summary of the values.
+    """
+
+    if not values:
+        return {"count": 0, "mean": None, "p50": None, "p99": None, "max": None}
+
+    ordered = sorted(values)
+
+    return {
+        "count": len(ordered),
+        "mean": sum(ordered) / len(ordered),
+        "p50": ordered[len(ordered) // 2],
+        "p99": ordered[min(int(len(ordered) * 0.99), len(ordered) - 1)],
+        "max": ordered[-1]
+    }
+
+def benchmark_overhead(iterations: int) -> dict[str, Any]:
+    """
+    Measures the overhead and the maximum rate of no-op operations.
+
+    :param iterations: The amount of iterations to run.
+
+    :return: The results of the benchmark.
+    """
+
+    def sync_operation() -> None:
+        pass
+
+    async def async_operation() -> None:
+        pass
+
+    results = {
+        "loop_sync_us": measure_loop(sync_operation, iterations),
+        "loop_sync_event_loop_us": measure_loop(
+            sync_operation, iterations, force_async=True
+        ),
+        "loop_async_us": measure_loop(async_operation, iterations),
+        "operate_sync_us": measure_operate(sync_operation, iterations // 10),
+        "operate_async_us": measure_operate(async_operation, iterations // 100)
+    }
+
+    results["max_rate_sync"] = 1e6 / results["loop_sync_us"]
+    results["max_rate_async"] = 1e6 / results["loop_async_us"]
+
+    return results
+
+def benchmark_jitter(delay: float, ticks: int, rate: bool) -> dict[str, Any]:
+    """
+    Measures the deviation of iteration start times from their schedule.
+
+    :param delay: The delay between iterations.
+    :param ticks: The amount of iterations to measure.
+    :param rate: The value to run in a fixed rate.
+
+    :return: The results of the benchmark.
+    """
+
+    starts: list[float] = []
+
+    operator = Operator(delay=delay, rate=rate)
+
+    def operation() -> None:
+        starts.append(time.perf_counter())
+
+        if len(starts) > ticks:
+            operator.stop()
+
+    operator.operation = operation
+    operator.run(block=True)
+
+    intervals = [
+        abs((end - start) - delay) * 1e6
+        for start, end in zip(starts, starts[1:])
+    ]
+
+    drift = ((starts[-1] - starts[0]) - delay * (len(starts) - 1)) * 1e6
+
+    return {
+        "delay": delay,
+        "rate": rate,
+        "jitter_us": summarize(intervals),
+        "drift_us": drift
+    }
+
+def benchmark_control(samples: int) -> dict[str, Any]:
+    """
+    Measures the time until the loop reacts to pause, unpause and stop.
+
+    :param samples: The amount of measurements of each action.
+
+    :return: The results of the benchmark.
+    """
+
+    pauses: list[float] = []
+    unpauses: list[float] = []
+    stops: list[float] = []
+
+    for _ in range(samples):
+        calls: list[float] = []
+
+        resumed = Parking(value=True)
+
+        operator = Operator(operation=lambda: calls.append(time.perf_counter()), delay=0.001)
+        operator._resumed = resumed
+        operator.run()
+
+        time.sleep(0.01)
+
+        start = time.perf_counter()
+        operator.pause()
+
+        while resumed.parked is None:
+            time.sleep(0)
+
+        pauses.append((resumed.parked - start) * 1e6)
+
+        calls.clear()
+
+        start = time.perf_counter()
+        operator.unpause()
+
+        while not calls:
+            time.sleep(0)
+
+        unpauses.append((calls[0] - start) * 1e6)
+
+        process = operator._operation_process
+
+        operator.delay = 1
+
+        time.sleep(0.01)
+
+        start = time.perf_counter()
+        operator.stop()
+        process.join()
+
+        stops.append((time.perf_counter() - start) * 1e6)
+
+    return {
+        "pause_us": summarize(pauses),
+        "unpause_us": summarize(unpauses),
+        "stop_us": summarize(stops)
+    }
+
+def benchmark_paused_cpu(count: int, duration: float) -> dict[str, Any]:
+    """
+    Measures the cpu time used by paused operators.
+
+    :param count: The amount of paused operators.
+    :param duration: The amount of seconds to measure.
+
+    :return: The results of the benchmark.
+    """
+
+    operators = [
+        Operator(operation=lambda: None, delay=0.001, timeout=duration * 10)
+        for _ in range(count)
+    ]
+
+    for operator in operators:
+        operator.run()
+        operator.pause()
+
+    time.sleep(0.1)
+
+    start = time.process_time()
+    time.sleep(duration)
+    used = time.process_time() - start
+
+    stop_all(operators)
+
+    return {
+        "operators": count,
+        "cpu_seconds_per_second": used / duration
+    }
+
+def benchmark_scale(count: int, workers: int | None) -> dict[str, Any]:
+    """
+    Measures the threads and memory of operators inside a superator.
+
+    :param count: The amount of operators.
+    :param workers: The amount of shared workers of the superator.
+
+    :return: The results of the benchmark.
+    """
+
+    gc.collect()
+
+    baseline_threads = threading.active_count()
+
+    tracemalloc.start()
+
+    operators = [Operator(operation=lambda: None, delay=0.1) for _ in range(count)]
+
+    superator = Superator(operators, workers=workers)
+    superator.run()
+
+    time.sleep(0.5)
+
+    threads = threading.active_count() - baseline_threads
+    memory, _ = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    processes = [operator._operation_process for operator in operators]
+
+    superator.stop()
+
+    for process in processes:
+        if isinstance(process, threading.Thread):
+            process.join()
+
+    time.sleep(0.1)
+
+    return {
+        "operators": count,
+        "workers": workers,
+        "threads": threads,
+        "memory_bytes": memory
+    }
+
+def benchmark_executor(count: int, delay: float, duration: float) -> dict[str, Any]:
+    """
+    Measures the iteration rate and cpu time of periodic operators in one executor.
+
+    :param count: The amount of operators.
+    :param delay: The delay between iterations of each operator.
+    :param duration: The amount of seconds to measure.
+
+    :return: The results of the benchmark.
+    """
+
+    baseline_threads = threading.active_count()
+
+    counter = [0]
+
+    def operation() -> None:
+        counter[0] += 1
+
+    executor = Executor(workers=0)
+
+    operators = [Operator(operation=operation, delay=delay) for _ in range(count)]
+
+    for operator in operators:
+        operator.run(executor=executor)
+
+    time.sleep(delay * 2)
+
+    calls = counter[0]
+    cpu = time.process_time()
+    start = time.perf_counter()
+
+    time.sleep(duration)
+
+    elapsed = time.perf_counter() - start
+    rate = (counter[0] - calls) / elapsed
+    used = (time.process_time() - cpu) / elapsed
+    threads = threading.active_count() - baseline_threads
+
+    for operator in operators:
+        operator.stop()
+
+    for operator in operators:
+        operator.join()
+
+    executor.stop()
+
+    return {
+        "operators": count,
+        "delay": delay,
+        "rate": rate,
+        "expected_rate": count / delay,
+        "cpu_seconds_per_second": used,
+        "threads": threads
+    }
+
+def main() -> None:
+    """A function to run the benchmarks."""
+
+    parser = argparse.ArgumentParser(description="Benchmarks of looperation.")
+    parser.add_argument("--quick", action="store_true", help="run shorter benchmarks.")
+    parser.add_argument("--output", help="the path of a json file to write the results into.")
+
+    arguments = parser.parse_args()
+
+    quick = arguments.quick
+
+    benchmarks: dict[str, Callable[[], Any]] = {
+        "overhead": lambda: benchmark_overhead(10_000 if quick else ITERATIONS),
+        "jitter": lambda: [
+            benchmark_jitter(delay, ticks, rate)
+            for delay, ticks in (
+                ((0.001, 100), (0.01, 20), (1, 2)) if quick else
+                ((0.001, 2000), (0.01, 500), (1, 10))
+            )
+            for rate in (False, True)
+        ],
+        "control": lambda: benchmark_control(5 if quick else 50),
+        "paused_cpu": lambda: benchmark_paused_cpu(100, 0.5 if quick else 2),
+        "scale": lambda: [
+            benchmark_scale(count, workers)
+            for count in (10, 100, 1000)
+            for workers in (None, 4)
+        ],
+        "executor": lambda: [
+            benchmark_executor(count, 0.5, 1 if quick else 5)
+            for count in ((1000, 10_000) if quick else (1000, 10_000, 20_000))
+        ]
+    }
+
+    results = {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "benchmarks": {}
+    }
+
+    for name, benchmark in benchmarks.items():
+        print(f"running {name}", file=sys.stderr)
+
+        results["benchmarks"][name] = benchmark()
+
+    output = json.dumps(results, indent=4)
+
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            file.write(output)
+
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
@@ -5,3 +5,14 @@ from looperation.superator import *
 from looperation.operation import *
 from looperation.process import *
 from looperation.handler import *
+from looperation.control import *
+from looperation.timer import *
+from looperation.executor import *
+from looperation.multiprocess import *
+from looperation.history import *
+from looperation.stats import *
+from looperation.batch import *
+from looperation.channel import *
+from looperation.limit import *
+from looperation.schedule import *
+from looperation.sink import *
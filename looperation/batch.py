@@ -0,0 +1,194 @@
+# batch.py
+
+import time
+import numbers
+import datetime as dt
+from typing import Any, Iterable, Sequence
+
+from looperation.operation import Inputs
+
+try:
+    import numpy as np
+
+except ImportError:
+    np = None
+
+__all__ = [
+    "Batch",
+    "column"
+]
+
+TimeDuration = float | dt.timedelta
+
+def column(values: Sequence[Any]) -> Any:
+    """
+    Converts the values of an argument into a column.
+
+    :param values: The values of the argument in each call.
+
+    :return: A numpy array for numeric values, otherwise a list.
+    """
+
+    if (np is not None) and all(isinstance(value, numbers.Number) for value in values):
+        return np.asarray(values)
+
+    return list(values)
+
+class Batch:
+    """A class to accumulate the inputs of multiple calls into a single call."""
+
+    def __init__(self, size: int, linger: TimeDuration = None) -> None:
+        """
+        Defines the attributes of the batch.
+
+        :param size: The maximum amount of calls in a batch.
+        :param linger: The maximum time to hold the first call of a batch.
+        """
+
+        if size < 1:
+            raise ValueError(f"Batch size must be positive, not {size}.")
+
+        self.size = size
+        self.linger = linger
+
+        self.items: list[Inputs] = []
+        self.opened: float | None = None
+
+    def __len__(self) -> int:
+        """
+        Returns the amount of calls in the batch.
+
+        :return: The amount of calls.
+        """
+
+        return len(self.items)
+
+    @property
+    def ready(self) -> bool:
+        """
+        returns the value of the batch being full or lingering for too long.
+
+        :return: The value.
+        """
+
+        if not self.items:
+            return False
+
+        if len(self.items) >= self.size:
+            return True
+
+        linger = self.linger
+
+        if linger is None:
+            return False
+
+        if isinstance(linger, dt.timedelta):
+            linger = linger.total_seconds()
+
+        return (time.monotonic() - self.opened) >= linger
+
+    @property
+    def remaining(self) -> float | None:
+        """
+        returns the amount of seconds until the batch lingers for too long.
+
+        :return: The remaining time, or None for an empty batch or no linger.
+        """
+
+        linger = self.linger
+
+        if (linger is None) or not self.items:
+            return None
+
+        if isinstance(linger, dt.timedelta):
+            linger = linger.total_seconds()
+
+        return max(linger - (time.monotonic() - self.opened), 0.0)
+
+    def add(self, args: Iterable[Any], kwargs: dict[str, Any]) -> bool:
+        """
+        Adds the inputs of a call to the batch.
+
+        :param args: The positional arguments of the call.
+        :param kwargs: The keyword arguments of the call.
+
+        :return: The value of the batch being ready.
+        """
+
+        if not self.items:
+            self.opened = time.monotonic()
+
+        self.items.append(Inputs(args=tuple(args), kwargs=dict(kwargs)))
+
+        return self.ready
+
+    def take(self) -> list[Inputs]:
+        """
+        Removes and returns the calls of the batch.
+
+        :return: The inputs of the calls.
+        """
+
+        items = self.items
+
+        self.items = []
+        self.opened = None
+
+        return items
+
+    @staticmethod
+    def columns(items: Sequence[Inputs]) -> tuple[tuple, dict[str, Any]]:
+        """
+        Converts the inputs of the calls into columns of arguments.
+
+        :param items: The inputs of the calls.
+
+        :return: The positional and keyword columns.
+        """
+
+        if not items:
+            return (), {}
+
+        length = len(items[0].args)
+        keys = items[0].kwargs.keys()
+
+        for inputs in items:
+            if len(inputs.args) != length or inputs.kwargs.keys() != keys:
+                raise ValueError(
+                    "All calls in a batch must have the same arguments."
+                )
+
+        args = tuple(
+            column(values)
+            for values in zip(*(inputs.args for inputs in items))
+        )
+
+        kwargs = {
+            key: column([inputs.kwargs[key] for inputs in items])
+            for key in keys
+        }
+
+        return args, kwargs
+
+    @staticmethod
+    def split(returns: Any, count: int) -> list[Any]:
+        """
+        Splits the returned value of a batch call into the results of each call.
+
+        :param returns: The returned value of the batch call.
+        :param count: The amount of calls in the batch.
+
+        :return: The result of each call.
+        """
+
+        if isinstance(returns, (str, bytes, dict)):
+            return [returns] * count
+
+        try:
+            if len(returns) == count:
+                return list(returns)
+
+        except TypeError:
+            pass
+
+        return [returns] * count
@@ -0,0 +1,241 @@
+# channel.py
+
+import threading
+from collections import deque
+from typing import Generic, TypeVar, ClassVar, Iterator, AsyncIterator
+
+from looperation.control import Signal
+
+__all__ = [
+    "Channel",
+    "Closed"
+]
+
+_T = TypeVar("_T")
+
+class Closed(Exception):
+    """An exception raised when reading from a closed and empty channel."""
+
+class Channel(Generic[_T]):
+    """A bounded queue between threads and asyncio tasks with an overflow policy."""
+
+    BLOCK: ClassVar[str] = "block"
+    DROP_OLDEST: ClassVar[str] = "drop_oldest"
+    DROP_NEWEST: ClassVar[str] = "drop_newest"
+
+    OVERFLOWS: ClassVar[tuple[str, ...]] = (BLOCK, DROP_OLDEST, DROP_NEWEST)
+
+    def __init__(self, size: int, overflow: str = BLOCK) -> None:
+        """
+        Defines the attributes of the channel.
+
+        :param size: The maximum amount of items in the channel.
+        :param overflow: The policy when the channel is full, one of block, drop_oldest, drop_newest.
+        """
+
+        if size < 1:
+            raise ValueError(f"Channel size must be positive, not {size}.")
+
+        if overflow not in Channel.OVERFLOWS:
+            raise ValueError(
+                f"Overflow policy must be one of {', '.join(Channel.OVERFLOWS)}, "
+                f"not {overflow}."
+            )
+
+        self.size = size
+        self.overflow = overflow
+
+        self.dropped = 0
+        self.closed = False
+
+        self._items: deque[_T] = deque()
+        self._lock = threading.Lock()
+        self._readable = Signal()
+        self._writable = Signal(value=True)
+
+    def __len__(self) -> int:
+        """
+        Returns the amount of items in the channel.
+
+        :return: The amount of items.
+        """
+
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[_T]:
+        """
+        Iterates over the items of the channel until it is closed.
+
+        :return: The items of the channel.
+        """
+
+        while True:
+            try:
+                yield self.get()
+
+            except Closed:
+                return
+
+    async def __aiter__(self) -> AsyncIterator[_T]:
+        """
+        Iterates over the items of the channel until it is closed.
+
+        :return: The items of the channel.
+        """
+
+        while True:
+            try:
+                yield await self.async_get()
+
+            except Closed:
+                return
+
+    def _update(self) -> None:
+        """Updates the signals of the channel. Must be called under the lock."""
+
+        if self._items or self.closed:
+            self._readable.set()
+
+        else:
+            self._readable.clear()
+
+        if (len(self._items) < self.size) or self.closed:
+            self._writable.set()
+
+        else:
+            self._writable.clear()
+
+    def offer(self, item: _T) -> bool | None:
+        """
+        Adds an item to the channel without waiting.
+
+        :param item: The item to add.
+
+        :return: True when added, False when dropped, None when full under the block policy.
+        """
+
+        with self._lock:
+            if self.closed:
+                return False
+
+            if len(self._items) >= self.size:
+                if self.overflow == Channel.DROP_NEWEST:
+                    self.dropped += 1
+
+                    return False
+
+                elif self.overflow == Channel.DROP_OLDEST:
+                    self._items.popleft()
+
+                    self.dropped += 1
+
+                else:
+                    return None
+
+            self._items.append(item)
+
+            self._update()
+
+            return True
+
+    def put(self, item: _T, timeout: float = None) -> bool:
+        """
+        Adds an item to the channel, waiting for space under the block policy.
+
+        :param item: The item to add.
+        :param timeout: The maximum amount of seconds to wait.
+
+        :return: The value of the item being added.
+        """
+
+        while True:
+            added = self.offer(item)
+
+            if added is not None:
+                return added
+
+            if not self._writable.wait(timeout) and timeout is not None:
+                return False
+
+    async def async_put(self, item: _T, timeout: float = None) -> bool:
+        """
+        Adds an item to the channel, waiting for space under the block policy.
+
+        :param item: The item to add.
+        :param timeout: The maximum amount of seconds to wait.
+
+        :return: The value of the item being added.
+        """
+
+        while True:
+            added = self.offer(item)
+
+            if added is not None:
+                return added
+
+            if not await self._writable.async_wait(timeout) and timeout is not None:
+                return False
+
+    def poll(self) -> tuple[bool, _T | None]:
+        """
+        Removes an item from the channel without waiting.
+
+        :return: The value of an item being available, and the item.
+        """
+
+        with self._lock:
+            if self._items:
+                item = self._items.popleft()
+
+                self._update()
+
+                return True, item
+
+            if self.closed:
+                raise Closed("Channel is closed.")
+
+            return False, None
+
+    def get(self, timeout: float = None) -> _T:
+        """
+        Removes an item from the channel, waiting for one to be available.
+
+        :param timeout: The maximum amount of seconds to wait.
+
+        :return: The item.
+        """
+
+        while True:
+            available, item = self.poll()
+
+            if available:
+                return item
+
+            if not self._readable.wait(timeout) and timeout is not None:
+                raise TimeoutError("No item was available in the channel.")
+
+    async def async_get(self, timeout: float = None) -> _T:
+        """
+        Removes an item from the channel, waiting for one to be available.
+
+        :param timeout: The maximum amount of seconds to wait.
+
+        :return: The item.
+        """
+
+        while True:
+            available, item = self.poll()
+
+            if available:
+                return item
+
+            if not await self._readable.async_wait(timeout) and timeout is not None:
+                raise TimeoutError("No item was available in the channel.")
+
+    def close(self) -> None:
+        """Closes the channel and wakes up all waiting threads and tasks."""
+
+        with self._lock:
+            self.closed = True
+
+            self._update()
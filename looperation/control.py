@@ -0,0 +1,136 @@
+# control.py
+
+import threading
+import asyncio
+
+__all__ = [
+    "Signal"
+]
+
+class Signal:
+    """A flag that can be awaited by threads and by asyncio tasks."""
+
+    def __init__(self, value: bool = False) -> None:
+        """
+        Defines the attributes of the signal.
+
+        :param value: The initial value of the signal.
+        """
+
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+        if value:
+            self._event.set()
+
+    def __getstate__(self) -> dict[str, bool]:
+        """
+        Gets the state of the object.
+
+        :return: The state of the object.
+        """
+
+        return {"value": self.is_set()}
+
+    def __setstate__(self, state: dict[str, bool]) -> None:
+        """
+        Sets the state of the object.
+
+        :param state: The state of the object.
+        """
+
+        self.__init__(value=state["value"])
+
+    @staticmethod
+    def _resolve(future: asyncio.Future) -> None:
+        """
+        Resolves the future of a waiting task.
+
+        :param future: The future to resolve.
+        """
+
+        if not future.done():
+            future.set_result(True)
+
+    def is_set(self) -> bool:
+        """
+        Returns the value of the signal.
+
+        :return: The value.
+        """
+
+        return self._event.is_set()
+
+    def set(self) -> None:
+        """Sets the signal and wakes up all waiting threads and tasks."""
+
+        with self._lock:
+            self._event.set()
+
+            waiters = self._waiters
+            self._waiters = []
+
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(self._resolve, future)
+
+            except RuntimeError:
+                pass
+
+    def clear(self) -> None:
+        """Clears the signal."""
+
+        self._event.clear()
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+        Blocks the current thread until the signal is set.
+
+        :param timeout: The maximum amount of seconds to wait.
+
+        :return: The value of the signal.
+        """
+
+        return self._event.wait(timeout)
+
+    async def async_wait(self, timeout: float = None) -> bool:
+        """
+        Waits in the running event loop until the signal is set.
+
+        :param timeout: The maximum amount of seconds to wait.
+
+        :return: The value of the signal.
+        """
+
+        if self._event.is_set():
+            return True
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        with self._lock:
+            if self._event.is_set():
+                return True
+
+            self._waiters.append((loop, future))
+
+        handle = None if timeout is None else loop.call_later(
+            max(timeout, 0), self._resolve, future
+        )
+
+        try:
+            await future
+
+        finally:
+            if handle is not None:
+                handle.cancel()
+
+            with self._lock:
+                try:
+                    self._waiters.remove((loop, future))
+
+                except ValueError:
+                    pass
+
+        return self._event.is_set()
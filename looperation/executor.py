@@ -0,0 +1,209 @@
+# executor.py
+
+import threading
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Callable, TypeVar
+
+from looperation.operator import Operator, TimeDestination
+
+__all__ = [
+    "Executor"
+]
+
+_O = TypeVar("_O")
+
+class Executor:
+    """A class to run many operators as tasks of one event loop and a bounded thread pool."""
+
+    def __init__(self, workers: int = None, name: str = None) -> None:
+        """
+        Defines the attributes of the executor.
+
+        :param workers: The amount of threads for synchronous operations, 0 to run them in the event loop.
+        :param name: The name of the executor.
+        """
+
+        self.workers = workers
+        self.name = name
+
+        self.operators: list[Operator] = []
+
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pool: ThreadPoolExecutor | None = None
+        self._process: threading.Thread | None = None
+        self._futures: dict[Operator, Future] = {}
+
+    @property
+    def running(self) -> bool:
+        """
+        returns the value of the event loop running.
+
+        :return: The value.
+        """
+
+        return (self._process is not None) and self._process.is_alive()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop | None:
+        """
+        returns the event loop of the executor.
+
+        :return: The event loop.
+        """
+
+        return self._loop
+
+    def executor_loop(self) -> None:
+        """Runs the event loop of the executor."""
+
+        asyncio.set_event_loop(self._loop)
+
+        try:
+            self._loop.run_forever()
+
+        finally:
+            self._loop.close()
+
+    def start(self) -> None:
+        """Starts the event loop thread of the executor."""
+
+        with self._lock:
+            if self.running:
+                return
+
+            self._loop = asyncio.new_event_loop()
+
+            if self.workers != 0:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix=self.name or "looperation-executor"
+                )
+
+            self._process = threading.Thread(
+                target=self.executor_loop, name=self.name, daemon=True
+            )
+
+            self._process.start()
+
+    async def call(self, callback: Callable[[], _O]) -> _O:
+        """
+        Calls a synchronous callback in the thread pool of the executor.
+
+        :param callback: The callback to call.
+
+        :return: The returned value of the callback.
+        """
+
+        if self._pool is None:
+            return callback()
+
+        return await asyncio.get_running_loop().run_in_executor(self._pool, callback)
+
+    async def operate(
+            self,
+            operator: Operator,
+            loop: bool = None,
+            loop_stopping: bool = None,
+            wait: TimeDestination = None,
+            timeout: TimeDestination = None
+    ) -> None:
+        """
+        Runs the process of an operator in the event loop of the executor.
+
+        :param operator: The operator to run.
+        :param loop: The value to run a loop.
+        :param wait: The value to wait after starting to run the process.
+        :param loop_stopping: The value to evaluate stopping during a loop.
+        :param timeout: The valur to add a start_timeout to the process.
+        """
+
+        operator._executor = self
+
+        try:
+            await operator.run_async(
+                loop=loop, loop_stopping=loop_stopping,
+                wait=wait, timeout=timeout, prepared=True
+            )
+
+        finally:
+            operator._executor = None
+
+            with self._lock:
+                self._futures.pop(operator, None)
+
+                try:
+                    self.operators.remove(operator)
+
+                except ValueError:
+                    pass
+
+    def submit(
+            self,
+            operator: Operator,
+            loop: bool = None,
+            loop_stopping: bool = None,
+            wait: TimeDestination = None,
+            timeout: TimeDestination = None
+    ) -> Future:
+        """
+        Runs the process of an operator in the executor.
+
+        The state of the operator is prepared before returning, so the operator
+        is running, and can be stopped or joined, before its task starts.
+
+        :param operator: The operator to run.
+        :param loop: The value to run a loop.
+        :param wait: The value to wait after starting to run the process.
+        :param loop_stopping: The value to evaluate stopping during a loop.
+        :param timeout: The valur to add a start_timeout to the process.
+
+        :return: The future of the operator process.
+        """
+
+        self.start()
+
+        operator.prepare(loop=loop, loop_stopping=loop_stopping, block=False)
+        operator._looping = True
+
+        future = asyncio.run_coroutine_threadsafe(
+            self.operate(
+                operator, loop=loop, loop_stopping=loop_stopping,
+                wait=wait, timeout=timeout
+            ),
+            self._loop
+        )
+
+        with self._lock:
+            self.operators.append(operator)
+            self._futures[operator] = future
+
+        return future
+
+    async def shutdown(self) -> None:
+        """Cancels the remaining operator tasks and stops the event loop."""
+
+        current = asyncio.current_task()
+
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        asyncio.get_running_loop().stop()
+
+    def stop(self) -> None:
+        """Stops the event loop thread and the thread pool of the executor."""
+
+        with self._lock:
+            if not self.running:
+                return
+
+            asyncio.run_coroutine_threadsafe(self.shutdown(), self._loop)
+
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
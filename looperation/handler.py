@@ -1,15 +1,393 @@
 # handler.py
 
+import time
+import random
 import warnings
+import threading
+from collections import deque
 from typing import Any, Callable, Iterable, Self, ClassVar
 from dataclasses import dataclass
 
+from looperation.timer import Timer
+
 __all__ = [
-    "Handler"
+    "Handler",
+    "Retry",
+    "Breaker",
+    "Reporter"
 ]
 
+class Catching:
+    """A base class for objects that match exceptions against their exception types."""
+
+    exceptions: Iterable[type[Exception]] = None
+
+    @property
+    def types(self) -> tuple[type[Exception], ...] | type[Exception]:
+        """
+        returns the exception types to match.
+
+        A tuple of exceptions is used as is, and any other
+        collection is read on each call, so changes to it take effect.
+
+        :return: The exception types.
+        """
+
+        exceptions = self.exceptions
+
+        if exceptions is None:
+            return Exception
+
+        if type(exceptions) is not tuple:
+            exceptions = tuple(exceptions)
+
+        return exceptions or Exception
+
 @dataclass
-class Handler:
+class Retry(Catching):
+    """A class to define the retrying of failed operations with exponential backoff."""
+
+    exceptions: Iterable[type[Exception]] = None
+    attempts: int = 3
+    base: float = 0.1
+    cap: float = 10.0
+    jitter: bool = True
+    retries: int = 0
+    exhausted: int = 0
+
+    def matches(self, exception: Exception) -> bool:
+        """
+        Checks if an exception should be retried.
+
+        :param exception: The exception object.
+
+        :return: The value of the exception being retried.
+        """
+
+        return isinstance(exception, self.types)
+
+    def delay(self, attempt: int) -> float:
+        """
+        Returns the backoff before a retry, with full jitter.
+
+        :param attempt: The number of the failed attempt, starting at 0.
+
+        :return: The amount of seconds to wait.
+        """
+
+        ceiling = min(self.cap, self.base * (2 ** attempt))
+
+        if self.jitter:
+            return random.uniform(0, ceiling)
+
+        return ceiling
+
+class Breaker:
+    """A circuit breaker to fail fast while a dependency keeps failing."""
+
+    CLOSED: ClassVar[str] = "closed"
+    OPEN: ClassVar[str] = "open"
+    HALF_OPEN: ClassVar[str] = "half_open"
+
+    def __init__(
+            self,
+            threshold: float = 0.5,
+            window: int = 20,
+            minimum: int = 10,
+            cooldown: float = 30.0,
+            interval: float = 0.1,
+            pause: bool = False
+    ) -> None:
+        """
+        Defines the attributes of the circuit breaker.
+
+        :param threshold: The failure rate in the window to open the breaker at.
+        :param window: The amount of latest calls to compute the failure rate of.
+        :param minimum: The minimum amount of calls in the window to open the breaker.
+        :param cooldown: The amount of seconds to stay open before a probe call.
+        :param interval: The amount of seconds to wait while another operator probes.
+        :param pause: The value to pause the operator while open, instead of skipping calls.
+        """
+
+        self.threshold = threshold
+        self.window = window
+        self.minimum = minimum
+        self.cooldown = cooldown
+        self.interval = interval
+        self.pause = pause
+
+        self.state = Breaker.CLOSED
+        self.opened = 0
+        self.rejected = 0
+
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probed_at: float | None = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Gets the state of the object.
+
+        :return: The state of the object.
+        """
+
+        data = self.__dict__.copy()
+
+        data["_lock"] = None
+
+        return data
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """
+        Sets the state of the object.
+
+        :param state: The state of the object.
+        """
+
+        self.__dict__.update(state)
+
+        self._lock = threading.Lock()
+
+    @property
+    def failure_rate(self) -> float:
+        """
+        returns the failure rate of the calls in the window.
+
+        :return: The failure rate.
+        """
+
+        return (self._failures / len(self._outcomes)) if self._outcomes else 0.0
+
+    def _record(self, failed: bool) -> None:
+        """
+        Records an outcome into the window. Must be called under the lock.
+
+        :param failed: The value of the call failing.
+        """
+
+        if len(self._outcomes) == self._outcomes.maxlen:
+            self._failures -= self._outcomes[0]
+
+        self._outcomes.append(failed)
+        self._failures += failed
+
+    def _open(self) -> None:
+        """Opens the breaker. Must be called under the lock."""
+
+        self.state = Breaker.OPEN
+        self.opened += 1
+
+        self._opened_at = time.monotonic()
+        self._probed_at = None
+
+    def allow(self) -> bool:
+        """
+        Checks if a call may be made, and starts a probe when the cooldown is over.
+
+        :return: The value of allowing the call.
+        """
+
+        if self.state == Breaker.CLOSED:
+            return True
+
+        with self._lock:
+            now = time.monotonic()
+
+            if self.state == Breaker.OPEN:
+                if now - self._opened_at >= self.cooldown:
+                    self.state = Breaker.HALF_OPEN
+                    self._probed_at = now
+
+                    return True
+
+            elif self.state == Breaker.HALF_OPEN:
+                if (self._probed_at is None) or (now - self._probed_at >= self.cooldown):
+                    self._probed_at = now
+
+                    return True
+
+            else:
+                return True
+
+            self.rejected += 1
+
+            return False
+
+    def remaining(self) -> float:
+        """
+        Returns the amount of seconds until a call may be allowed.
+
+        :return: The waiting time.
+        """
+
+        if self.state == Breaker.OPEN:
+            return max(self._opened_at + self.cooldown - time.monotonic(), 0.0)
+
+        if self.state == Breaker.HALF_OPEN:
+            return self.interval
+
+        return 0.0
+
+    def success(self) -> None:
+        """Records a successful call."""
+
+        with self._lock:
+            if self.state == Breaker.HALF_OPEN:
+                self.state = Breaker.CLOSED
+
+                self._outcomes.clear()
+                self._failures = 0
+                self._probed_at = None
+
+            self._record(False)
+
+    def failure(self) -> None:
+        """Records a failed call."""
+
+        with self._lock:
+            if self.state == Breaker.HALF_OPEN:
+                self._open()
+
+                return
+
+            self._record(True)
+
+            if (
+                (self.state == Breaker.CLOSED) and
+                (len(self._outcomes) >= self.minimum) and
+                (self.failure_rate >= self.threshold)
+            ):
+                self._open()
+
+    def reset(self) -> None:
+        """Closes the breaker and clears the window."""
+
+        with self._lock:
+            self.state = Breaker.CLOSED
+
+            self._outcomes.clear()
+            self._failures = 0
+            self._probed_at = None
+
+class Reporter:
+    """A class to report repeated exceptions as rate-limited summaries."""
+
+    def __init__(self, interval: float = 10.0, size: int = 100, warn: bool = True) -> None:
+        """
+        Defines the attributes of the reporter.
+
+        :param interval: The amount of seconds between summaries of a repeated exception.
+        :param size: The maximum amount of distinct exceptions to aggregate.
+        :param warn: The value to warn, instead of printing.
+        """
+
+        if interval <= 0:
+            raise ValueError(f"Reporter interval must be positive, not {interval}.")
+
+        self.interval = interval
+        self.size = size
+        self.warn = warn
+
+        self.reported = 0
+        self.suppressed = 0
+
+        self._counts: dict[tuple[type, str], int] = {}
+        self._started = time.monotonic()
+        self._scheduled = False
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Gets the state of the object.
+
+        :return: The state of the object.
+        """
+
+        return {"interval": self.interval, "size": self.size, "warn": self.warn}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """
+        Sets the state of the object.
+
+        :param state: The state of the object.
+        """
+
+        self.__init__(**state)
+
+    def emit(self, message: str) -> None:
+        """
+        Emits a message.
+
+        :param message: The message to emit.
+        """
+
+        self.reported += 1
+
+        if self.warn:
+            warnings.warn(message)
+
+        else:
+            print(message)
+
+    def report(self, exception: Exception) -> None:
+        """
+        Reports an exception, emitting only the first of its kind in each interval.
+
+        :param exception: The exception to report.
+        """
+
+        key = (type(exception), str(exception))
+
+        with self._lock:
+            count = self._counts.get(key)
+
+            if count is not None:
+                self._counts[key] = count + 1
+                self.suppressed += 1
+
+                if not self._scheduled:
+                    self._scheduled = True
+
+                    Timer.shared().schedule(
+                        max(self._started + self.interval - time.monotonic(), 0.0),
+                        self.flush
+                    )
+
+                return
+
+            overflow = len(self._counts) >= self.size
+
+            if not self._counts:
+                self._started = time.monotonic()
+
+            self._counts[key] = 0
+
+        if overflow:
+            self.flush()
+
+        self.emit(f"{key[0].__name__}: {key[1]}")
+
+    def flush(self) -> None:
+        """Emits the summaries of the repeated exceptions and starts a new interval."""
+
+        with self._lock:
+            counts = self._counts
+            elapsed = time.monotonic() - self._started
+
+            self._counts = {}
+            self._scheduled = False
+
+        for (base, message), count in counts.items():
+            if count:
+                self.emit(
+                    f"{base.__name__}: {message} "
+                    f"({count} more occurrences in the last {elapsed:.1f} seconds)"
+                )
+
+@dataclass
+class Handler(Catching):
     """A class to handle operations."""
 
     success_callback: Callable[["Handler"], Any] = None
@@ -23,6 +401,12 @@ class Handler:
     exit: bool = False
     caught: bool = False
     data: ... = None
+    retry: Retry = None
+    retrying: bool = False
+    attempt: int = 0
+    retry_delay: float = 0.0
+    breaker: Breaker = None
+    reporter: Reporter = None
 
     print_exception_handler: ClassVar[Callable[["Handler", Exception], Any]] = (
         lambda h, e: print(
@@ -47,6 +431,7 @@ class Handler:
 
         self.exit = False
         self.caught = False
+        self.retrying = False
 
         if self.success_callback is not None:
             self.success_callback(self)
@@ -64,18 +449,54 @@ class Handler:
 
         caught = False
 
+        if self.breaker is not None:
+            if exception is None:
+                self.breaker.success()
+
+            elif isinstance(exception, self.types):
+                self.breaker.failure()
+
+        if exception is None:
+            self.attempt = 0
+
+        elif (
+            (self.retry is not None) and
+            self.catch and
+            isinstance(exception, self.types) and
+            self.retry.matches(exception)
+        ):
+            if (
+                (self.attempt + 1 < self.retry.attempts) and
+                ((self.breaker is None) or (self.breaker.state == Breaker.CLOSED))
+            ):
+                self.retry_delay = self.retry.delay(self.attempt)
+                self.attempt += 1
+                self.retrying = True
+                self.retry.retries += 1
+
+                return True
+
+            self.attempt = 0
+            self.retry.exhausted += 1
+
         if None not in (base, exception, traceback):
             self.exit = True
             self.caught = True
 
-            if isinstance(exception, tuple(self.exceptions or ()) or Exception):
+            if isinstance(exception, self.types):
                 caught = self.catch and True
 
                 if self.exception_callback is not None:
                     self.exception_callback(self)
 
                 if self.exception_handler is None:
-                    if not self.silence:
+                    if self.silence:
+                        pass
+
+                    elif self.reporter is not None:
+                        self.reporter.report(exception)
+
+                    else:
                         message = f"{base.__name__}: {str(exception)}"
 
                         if self.warn:
@@ -106,7 +527,10 @@ class Handler:
             warn=self.warn,
             catch=self.catch,
             silence=self.silence,
-            data=data
+            data=data,
+            retry=self.retry,
+            breaker=self.breaker,
+            reporter=self.reporter
         )
 
     def make_exit(self) -> None:
@@ -0,0 +1,211 @@
+# history.py
+
+import random
+import datetime as dt
+from array import array
+from typing import Any, ClassVar, Generic, TypeVar
+
+from looperation.process import ProcessTime
+from looperation.operation import Operation, Inputs, Outputs
+
+__all__ = [
+    "History"
+]
+
+_O = TypeVar("_O")
+
+def from_nanoseconds(value: int) -> dt.datetime:
+    """
+    Converts an epoch time in nanoseconds into a datetime object.
+
+    :param value: The epoch time in nanoseconds.
+
+    :return: The datetime object.
+    """
+
+    return dt.datetime.fromtimestamp(value / 1_000_000_000)
+
+class History(Generic[_O]):
+    """A fixed size record of the latest or sampled calls of an operation."""
+
+    LAST: ClassVar[str] = "last"
+    RESERVOIR: ClassVar[str] = "reservoir"
+    EVERY: ClassVar[str] = "every"
+
+    MODES: ClassVar[tuple[str, ...]] = (LAST, RESERVOIR, EVERY)
+
+    def __init__(
+            self,
+            size: int,
+            mode: str = LAST,
+            every: int = 1,
+            seed: int = None
+    ) -> None:
+        """
+        Defines the attributes of the history.
+
+        :param size: The maximum amount of records to keep.
+        :param mode: The sampling mode, one of last, reservoir, every.
+        :param every: The amount of calls between samples in the every mode.
+        :param seed: The random seed of the reservoir mode.
+        """
+
+        if size < 1:
+            raise ValueError(f"History size must be positive, not {size}.")
+
+        if mode not in History.MODES:
+            raise ValueError(
+                f"History mode must be one of {', '.join(History.MODES)}, "
+                f"not {mode}."
+            )
+
+        self.size = size
+        self.mode = mode
+        self.every = max(every, 1)
+
+        self.calls = 0
+        self.written = 0
+
+        self._random = random.Random(seed)
+
+        self._starts = array("q", bytes(8 * size))
+        self._ends = array("q", bytes(8 * size))
+        self._args: list[tuple | None] = [None] * size
+        self._kwargs: list[dict[str, Any] | None] = [None] * size
+        self._returns: list[_O | None] = [None] * size
+
+    def __len__(self) -> int:
+        """
+        Returns the amount of records in the history.
+
+        :return: The amount of records.
+        """
+
+        return min(self.written, self.size)
+
+    def slot(self) -> int | None:
+        """
+        Counts a call and returns the slot to record it into.
+
+        :return: The index of the slot, or None to skip the call.
+        """
+
+        calls = self.calls
+        self.calls = calls + 1
+
+        if self.mode == History.LAST:
+            slot = self.written % self.size
+
+        elif self.mode == History.EVERY:
+            if calls % self.every:
+                return None
+
+            slot = self.written % self.size
+
+        elif self.written < self.size:
+            slot = self.written
+
+        else:
+            slot = self._random.randrange(calls + 1)
+
+            if slot >= self.size:
+                return None
+
+        self.written += 1
+
+        return slot
+
+    def record(
+            self,
+            start: int,
+            end: int,
+            args: tuple,
+            kwargs: dict[str, Any],
+            returns: _O
+    ) -> None:
+        """
+        Records a call of the operation.
+
+        :param start: The epoch start time of the call in nanoseconds.
+        :param end: The epoch end time of the call in nanoseconds.
+        :param args: The positional arguments of the call.
+        :param kwargs: The keyword arguments of the call.
+        :param returns: The returned value of the call.
+        """
+
+        slot = self.slot()
+
+        if slot is None:
+            return
+
+        self._starts[slot] = start
+        self._ends[slot] = end
+        self._args[slot] = args
+        self._kwargs[slot] = kwargs
+        self._returns[slot] = returns
+
+    def order(self) -> list[int]:
+        """
+        Returns the slots of the records in chronological order.
+
+        :return: The indexes of the slots.
+        """
+
+        length = len(self)
+
+        if self.mode == History.RESERVOIR:
+            return sorted(range(length), key=self._starts.__getitem__)
+
+        if self.written <= self.size:
+            return list(range(length))
+
+        first = self.written % self.size
+
+        return list(range(first, self.size)) + list(range(first))
+
+    def times(self) -> tuple[array, array]:
+        """
+        Returns the start and end times of the records in nanoseconds.
+
+        :return: The arrays of the start and end times.
+        """
+
+        order = self.order()
+
+        return (
+            array("q", (self._starts[i] for i in order)),
+            array("q", (self._ends[i] for i in order))
+        )
+
+    def operations(self) -> list[Operation[_O]]:
+        """
+        Builds the operation records of the history in chronological order.
+
+        :return: The operation records.
+        """
+
+        return [
+            Operation(
+                time=ProcessTime(
+                    start=from_nanoseconds(self._starts[i]),
+                    end=from_nanoseconds(self._ends[i])
+                ),
+                inputs=Inputs(
+                    args=tuple(self._args[i]),
+                    kwargs=dict(self._kwargs[i])
+                ),
+                outputs=Outputs(returns=self._returns[i])
+            )
+            for i in self.order()
+        ]
+
+    def clear(self) -> None:
+        """Removes all records from the history."""
+
+        self.calls = 0
+        self.written = 0
+
+        for i in range(self.size):
+            self._args[i] = None
+            self._kwargs[i] = None
+            self._returns[i] = None
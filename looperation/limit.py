@@ -0,0 +1,177 @@
+# limit.py
+
+import time
+import threading
+import datetime as dt
+
+__all__ = [
+    "TokenBucket",
+    "Adaptive"
+]
+
+TimeDuration = float | dt.timedelta
+
+def duration_seconds(duration: TimeDuration) -> float:
+    """
+    Converts a duration into seconds.
+
+    :param duration: The duration to convert.
+
+    :return: The amount of seconds.
+    """
+
+    if isinstance(duration, dt.timedelta):
+        return duration.total_seconds()
+
+    return duration
+
+class TokenBucket:
+    """A token bucket rate limiter that can be shared between operators and threads."""
+
+    def __init__(self, rate: float, burst: float = None) -> None:
+        """
+        Defines the attributes of the token bucket.
+
+        :param rate: The amount of tokens added every second.
+        :param burst: The maximum amount of tokens in the bucket.
+        """
+
+        if rate <= 0:
+            raise ValueError(f"Token bucket rate must be positive, not {rate}.")
+
+        if burst is None:
+            burst = 1.0
+
+        self.rate = rate
+        self.burst = burst
+
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, float]:
+        """
+        Gets the state of the object.
+
+        :return: The state of the object.
+        """
+
+        return {"rate": self.rate, "burst": self.burst}
+
+    def __setstate__(self, state: dict[str, float]) -> None:
+        """
+        Sets the state of the object.
+
+        :param state: The state of the object.
+        """
+
+        self.__init__(**state)
+
+    @property
+    def tokens(self) -> float:
+        """
+        returns the amount of available tokens.
+
+        :return: The amount of tokens.
+        """
+
+        with self._lock:
+            self._refill()
+
+            return self._tokens
+
+    def _refill(self) -> None:
+        """Adds the tokens accumulated since the last update. Must be called under the lock."""
+
+        now = time.monotonic()
+
+        self._tokens = min(self._tokens + (now - self._updated) * self.rate, self.burst)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Takes tokens from the bucket, possibly in advance.
+
+        :param tokens: The amount of tokens to take.
+
+        :return: The amount of seconds to wait before the tokens are available.
+        """
+
+        with self._lock:
+            self._refill()
+
+            self._tokens -= tokens
+
+            if self._tokens >= 0:
+                return 0.0
+
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """
+        Takes tokens from the bucket, blocking until they are available.
+
+        :param tokens: The amount of tokens to take.
+        """
+
+        wait = self.reserve(tokens)
+
+        if wait > 0:
+            time.sleep(wait)
+
+class Adaptive:
+    """An extra delay between iterations that grows on failures and shrinks on sustained success."""
+
+    def __init__(
+            self,
+            step: TimeDuration = 0.1,
+            maximum: TimeDuration = 60.0,
+            increase: float = 2.0,
+            decrease: float = 0.5,
+            successes: int = 10
+    ) -> None:
+        """
+        Defines the attributes of the adaptive delay.
+
+        :param step: The delay after the first failure.
+        :param maximum: The maximum delay.
+        :param increase: The factor to multiply the delay by on a failure.
+        :param decrease: The factor to multiply the delay by after the successes.
+        :param successes: The amount of consecutive successes before decreasing the delay.
+        """
+
+        self.step = duration_seconds(step)
+        self.maximum = duration_seconds(maximum)
+        self.increase = increase
+        self.decrease = decrease
+        self.successes = successes
+
+        self.delay = 0.0
+        self.streak = 0
+
+    def failure(self) -> None:
+        """Increases the delay after a failure."""
+
+        self.streak = 0
+        self.delay = min(max(self.delay * self.increase, self.step), self.maximum)
+
+    def success(self) -> None:
+        """Decreases the delay after enough consecutive successes."""
+
+        if not self.delay:
+            return
+
+        self.streak += 1
+
+        if self.streak >= self.successes:
+            self.streak = 0
+            self.delay *= self.decrease
+
+            if self.delay < self.step:
+                self.delay = 0.0
+
+    def reset(self) -> None:
+        """Removes the extra delay."""
+
+        self.delay = 0.0
+        self.streak = 0
@@ -0,0 +1,495 @@
+# multiprocess.py
+
+import os
+import time
+import pickle
+import warnings
+import threading
+import multiprocessing
+import datetime as dt
+from multiprocessing.connection import Connection
+from typing import Iterable, Callable, Any, ClassVar
+
+from looperation.operator import Operator, time_seconds
+from looperation.superator import Superator, ShutdownReport
+from looperation.executor import Executor
+from looperation.handler import Handler
+
+__all__ = [
+    "ProcessSuperator"
+]
+
+TimeDuration = float | dt.timedelta
+TimeDestination = TimeDuration | dt.datetime
+
+def portable(value: Any) -> Any:
+    """
+    Returns a value that can be sent between processes.
+
+    :param value: The value to send.
+
+    :return: The value or a replacement for it.
+    """
+
+    try:
+        pickle.dumps(value)
+
+        return value
+
+    except Exception as e:
+        if isinstance(value, BaseException):
+            return RuntimeError(f"{type(value).__name__}: {str(value)}")
+
+        return RuntimeError(
+            f"Unpicklable value of type {type(value).__name__}: {str(e)}"
+        )
+
+def forward(operator: Operator, index: int, reports: Any, results: bool) -> None:
+    """
+    Routes the exceptions and results of an operator to the parent process.
+
+    :param operator: The operator to route.
+    :param index: The index of the operator in the parent process.
+    :param reports: The queue to report into.
+    :param results: The value to report the returned values of the operation.
+    """
+
+    operator.handler = Handler(
+        exception_handler=lambda h, e: reports.put(
+            (ProcessSuperator.EXCEPTION, index, portable(e))
+        )
+    )
+
+    if not results or operator.operation is None:
+        return
+
+    operation = operator.operation
+
+    if operator.is_async:
+        async def report(*args: Any, **kwargs: Any) -> Any:
+            returns = await operation(*args, **kwargs)
+
+            reports.put((ProcessSuperator.RESULT, index, portable(returns)))
+
+            return returns
+
+    else:
+        def report(*args: Any, **kwargs: Any) -> Any:
+            returns = operation(*args, **kwargs)
+
+            reports.put((ProcessSuperator.RESULT, index, portable(returns)))
+
+            return returns
+
+    operator.operation = report
+
+def process_loop(
+        operators: list[tuple[int, Operator]],
+        control: Connection,
+        reports: Any,
+        workers: int,
+        results: bool
+) -> None:
+    """
+    Runs operators in a worker process until they stop.
+
+    :param operators: The operators to run with their indexes in the parent process.
+    :param control: The connection to receive commands from.
+    :param reports: The queue to report into.
+    :param workers: The amount of threads for synchronous operations.
+    :param results: The value to report the returned values of the operations.
+    """
+
+    local = dict(operators)
+
+    for index, operator in operators:
+        forward(operator, index=index, reports=reports, results=results)
+
+    executor = Executor(workers=workers)
+
+    futures = [executor.submit(operator) for operator in local.values()]
+
+    try:
+        while not all(future.done() for future in futures):
+            if not control.poll(0.1):
+                continue
+
+            try:
+                command, index = control.recv()
+
+            except EOFError:
+                command, index = ProcessSuperator.STOP, None
+
+            targets = local.values() if index is None else [local[index]]
+
+            for operator in targets:
+                getattr(operator, command)()
+
+            if (command == ProcessSuperator.STOP) and (index is None):
+                break
+
+    finally:
+        for operator in local.values():
+            if operator.running:
+                operator.stop()
+
+        executor.stop()
+
+        reports.put((ProcessSuperator.FINISHED, os.getpid(), None))
+
+class ProcessSuperator(Superator):
+    """A super operator to run operators in multiple processes."""
+
+    PAUSE: ClassVar[str] = "pause"
+    UNPAUSE: ClassVar[str] = "unpause"
+    STOP: ClassVar[str] = "stop"
+
+    EXCEPTION: ClassVar[str] = "exception"
+    RESULT: ClassVar[str] = "result"
+    FINISHED: ClassVar[str] = "finished"
+
+    def __init__(
+            self,
+            operators: Iterable[Operator],
+            handler: Handler = None,
+            stopping_collector: Callable[[], bool] = None,
+            termination: Callable[[], Any] = None,
+            delay: TimeDuration = None,
+            block: bool = False,
+            wait: TimeDestination = None,
+            timeout: TimeDestination = None,
+            processes: int = None,
+            workers: int = None,
+            results: bool = False,
+            context: str = None
+    ) -> None:
+        """
+        Defines the attributes of the operators controller.
+
+        The operators are copied into the worker processes, their own handlers
+        are replaced, and their exceptions are handled by the handler of the
+        superator, with the operator as the data. When results are reported,
+        the success callback of the handler is called with the operator and
+        the returned value as the data.
+
+        :param operators: The operators to control.
+        :param handler: The handler object to handle the exceptions of the operators.
+        :param stopping_collector: The callback to collect a value to indicate to stop.
+        :param termination: The termination callback.
+        :param delay: The delay for the process.
+        :param wait: The value to wait after starting to run the process.
+        :param block: The value to block the execution.
+        :param timeout: The valur to add a start_timeout to the process.
+        :param processes: The amount of worker processes.
+        :param workers: The amount of threads in each process, None for the default, 0 to run operations in its event loop.
+        :param results: The value to report the returned values of the operations.
+        :param context: The multiprocessing start method.
+        """
+
+        if processes is None:
+            processes = os.cpu_count() or 1
+
+        super().__init__(
+            operators=operators,
+            handler=handler,
+            delay=delay,
+            block=block,
+            wait=wait,
+            timeout=timeout,
+            termination=termination,
+            stopping_collector=stopping_collector,
+            workers=workers
+        )
+
+        self.processes = processes
+        self.results = results
+        self.context = context
+
+        self._connections: list[Connection] = []
+        self._locations: dict[int, int] = {}
+        self._workers: list[multiprocessing.Process] = []
+        self._listener: threading.Thread | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Gets the state of the object.
+
+        :return: The state of the object.
+        """
+
+        data = super().__getstate__()
+
+        data["_connections"] = []
+        data["_workers"] = []
+        data["_listener"] = None
+
+        return data
+
+    def report(self, kind: str, index: int, value: Any) -> None:
+        """
+        Handles a report from a worker process.
+
+        :param kind: The kind of the report.
+        :param index: The index of the operator.
+        :param value: The reported value.
+        """
+
+        operator = self.operators[index]
+        handler = self.handler or Handler()
+
+        if kind == ProcessSuperator.RESULT:
+            with handler(data=(operator, value)):
+                pass
+
+            return
+
+        handling = handler(data=operator)
+        handling.success_callback = None
+
+        try:
+            with handling:
+                raise value
+
+        except Exception as e:
+            warnings.warn(f"{type(e).__name__}: {str(e)}")
+
+        if handling.caught and handling.exit:
+            self.send(ProcessSuperator.STOP, operator)
+
+    def listening_loop(self, reports: Any, processes: int) -> None:
+        """
+        Runs the process of receiving the reports of the worker processes.
+
+        :param reports: The queue of the reports.
+        :param processes: The amount of worker processes.
+        """
+
+        finished = 0
+
+        try:
+            while finished < processes:
+                kind, index, value = reports.get()
+
+                if kind == ProcessSuperator.FINISHED:
+                    finished += 1
+
+                else:
+                    self.report(kind, index, value)
+
+        finally:
+            self.finish()
+
+    def send(self, command: str, operator: Operator = None) -> None:
+        """
+        Sends a command to the worker processes.
+
+        :param command: The command to send, one of pause, unpause, stop.
+        :param operator: The operator to send to, or all operators.
+        """
+
+        if operator is None:
+            targets = [(connection, None) for connection in self._connections]
+
+        else:
+            index = self.operators.index(operator)
+
+            targets = [(self._connections[self._locations[index]], index)]
+
+        for connection, index in targets:
+            try:
+                connection.send((command, index))
+
+            except (OSError, ValueError):
+                pass
+
+    def start_operations(self) -> None:
+        """Starts the worker processes of the operators."""
+
+        context = multiprocessing.get_context(self.context)
+
+        processes = max(min(self.processes, len(self.operators)), 1)
+
+        reports = context.Queue()
+
+        groups: list[list[tuple[int, Operator]]] = [[] for _ in range(processes)]
+
+        self._locations.clear()
+
+        for index, operator in enumerate(self.operators):
+            location = index % processes
+
+            groups[location].append((index, operator))
+            self._locations[index] = location
+
+        self._connections = []
+        self._workers = []
+
+        self._looping = True
+
+        for group in groups:
+            receiver, sender = context.Pipe(duplex=False)
+
+            worker = context.Process(
+                target=process_loop,
+                args=(group, receiver, reports, self.workers, self.results),
+                daemon=True
+            )
+
+            worker.start()
+
+            self._connections.append(sender)
+            self._workers.append(worker)
+
+        self._listener = threading.Thread(
+            target=lambda: self.listening_loop(reports, processes),
+            daemon=True
+        )
+
+        self._listener.start()
+
+    def run(
+            self,
+            loop: bool = None,
+            loop_stopping: bool = None,
+            block: bool = None,
+            wait: TimeDestination = None,
+            timeout: TimeDestination = None
+    ) -> None:
+        """
+        Runs the process of the operator object.
+
+        :param loop: The value to run a loop.
+        :param wait: The value to wait after starting to run the process.
+        :param block: The value to block the execution.
+        :param loop_stopping: The value to evaluate stopping during a loop.
+        :param timeout: The valur to add a start_timeout to the process.
+        """
+
+        if not any(worker.is_alive() for worker in self._workers):
+            self.start_operations()
+
+        Operator.run(
+            self, block=block, wait=wait, timeout=timeout,
+            loop=loop, loop_stopping=loop_stopping
+        )
+
+    def join(self, timeout: float = None) -> bool:
+        """
+        Waits for the worker processes to finish.
+
+        :param timeout: The maximum amount of seconds to wait.
+
+        :return: The value of the process being finished.
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        if not super().join(timeout):
+            return False
+
+        for worker in self._workers:
+            worker.join(
+                None if deadline is None else
+                max(deadline - time.monotonic(), 0)
+            )
+
+        return not any(worker.is_alive() for worker in self._workers)
+
+    def shutdown(
+            self,
+            deadline: TimeDuration = None,
+            grace: TimeDuration = 0.1
+    ) -> ShutdownReport:
+        """
+        Stops all worker processes at once and waits for them until the deadline.
+
+        Worker processes still running at the deadline are terminated, and
+        their operators are reported as cancelled.
+
+        :param deadline: The maximum time to wait for the worker processes to stop.
+        :param grace: The time to wait for the terminated processes after the deadline.
+
+        :return: The report of the shutdown.
+        """
+
+        start = time.monotonic()
+
+        self.send(ProcessSuperator.STOP)
+
+        self.join(None if deadline is None else time_seconds(deadline))
+
+        late = [worker for worker in self._workers if worker.is_alive()]
+
+        for worker in late:
+            worker.terminate()
+
+        for worker in late:
+            worker.join(time_seconds(grace))
+
+        report = ShutdownReport()
+
+        for index, operator in enumerate(self.operators):
+            worker = self._workers[self._locations[index]] if self._workers else None
+
+            if worker is None or worker not in late:
+                report.stopped.append(operator)
+
+            elif worker.is_alive():
+                report.running.append(operator)
+
+            else:
+                report.cancelled.append(operator)
+
+        Operator.stop(self)
+
+        report.elapsed = time.monotonic() - start
+
+        return report
+
+    def stop_operation(self) -> None:
+        """Stops the screening process."""
+
+        Operator.stop_operation(self)
+
+    def pause(self, operations: bool = True) -> None:
+        """
+        Pauses the screening process.
+
+        :param operations: The value to pause all operations.
+        """
+
+        if operations:
+            self.send(ProcessSuperator.PAUSE)
+
+        Operator.pause(self)
+
+    def unpause(self, operations: bool = True) -> None:
+        """
+        Unpauses the screening process.
+
+        :param operations: The value to unpause all operations.
+        """
+
+        if operations:
+            self.send(ProcessSuperator.UNPAUSE)
+
+        Operator.unpause(self)
+
+    def stop(
+            self,
+            operations: bool = True,
+            cancel: bool = False,
+            terminate: bool = True
+    ) -> None:
+        """
+        Stops the screening process.
+
+        :param operations: The value to stop all operations.
+        :param cancel: The value to cancel concurrent calls of the superator instead of waiting for them.
+        :param terminate: The value to call the termination callback of the superator.
+        """
+
+        if operations:
+            self.send(ProcessSuperator.STOP)
+
+        Operator.stop(self, cancel=cancel, terminate=terminate)
@@ -1,6 +1,6 @@
 # operation.py
 
-from typing import Generic, Any, TypeVar
+from typing import Generic, Any, TypeVar, ClassVar, Self
 
 from dataclasses import dataclass, field
 
@@ -21,6 +21,36 @@ class Inputs:
     args: tuple = field(default_factory=tuple)
     kwargs: dict[str, Any] = field(default_factory=dict)
 
+    ARGS: ClassVar[str] = "args"
+    KWARGS: ClassVar[str] = "kwargs"
+
+    @classmethod
+    def load(cls, data: InputsData) -> Self:
+        """
+        Creates an instance of the class for the data.
+
+        :param data: The data to load into an object.
+
+        :return: The new instance with the data.
+        """
+
+        return cls(
+            args=tuple(data.get(cls.ARGS, ())),
+            kwargs=dict(data.get(cls.KWARGS, {}))
+        )
+
+    def json(self) -> InputsData:
+        """
+        Returns a json object to represent the data of the object.
+
+        :return: The data of the object.
+        """
+
+        return {
+            self.ARGS: self.args,
+            self.KWARGS: self.kwargs
+        }
+
 _O = TypeVar("_O")
 
 OutputsData = dict[str, _O]
@@ -31,6 +61,29 @@ class Outputs(Generic[_O]):
 
     returns: _O = None
 
+    RETURNS: ClassVar[str] = "returns"
+
+    @classmethod
+    def load(cls, data: OutputsData) -> Self:
+        """
+        Creates an instance of the class for the data.
+
+        :param data: The data to load into an object.
+
+        :return: The new instance with the data.
+        """
+
+        return cls(returns=data.get(cls.RETURNS))
+
+    def json(self) -> OutputsData:
+        """
+        Returns a json object to represent the data of the object.
+
+        :return: The data of the object.
+        """
+
+        return {self.RETURNS: self.returns}
+
 TimeData = dict[str, float]
 OperationData = dict[str, InputsData | OutputsData | TimeData]
 
@@ -41,3 +94,36 @@ class Operation(Generic[_O]):
     time: ProcessTime
     inputs: Inputs
     outputs: Outputs[_O]
+
+    TIME: ClassVar[str] = "time"
+    INPUTS: ClassVar[str] = "inputs"
+    OUTPUTS: ClassVar[str] = "outputs"
+
+    @classmethod
+    def load(cls, data: OperationData) -> Self:
+        """
+        Creates an instance of the class for the data.
+
+        :param data: The data to load into an object.
+
+        :return: The new instance with the data.
+        """
+
+        return cls(
+            time=ProcessTime.load(data[cls.TIME]),
+            inputs=Inputs.load(data[cls.INPUTS]),
+            outputs=Outputs.load(data[cls.OUTPUTS])
+        )
+
+    def json(self) -> OperationData:
+        """
+        Returns a json object to represent the data of the object.
+
+        :return: The data of the object.
+        """
+
+        return {
+            self.TIME: self.time.json(),
+            self.INPUTS: self.inputs.json(),
+            self.OUTPUTS: self.outputs.json()
+        }
@@ -5,12 +5,27 @@ import warnings
 import threading
 import asyncio
 import datetime as dt
+from collections import deque
+from concurrent.futures import Future
+from functools import partial
+from contextlib import nullcontext
 from typing import (
-    Callable, Generic, Any, Iterable, TypeVar, Awaitable
+    Callable, Generic, Any, Iterable, TypeVar, Awaitable, Iterator, AsyncIterator
 )
 
 from looperation.process import ProcessTime
+from looperation.operation import Inputs, Outputs, Operation
 from looperation.handler import Handler
+from looperation.control import Signal
+from looperation.timer import Timer, TimerHandle
+from looperation.pacing import Pacer
+from looperation.history import History, from_nanoseconds
+from looperation.stats import Stats
+from looperation.batch import Batch
+from looperation.channel import Channel, Closed
+from looperation.limit import TokenBucket, Adaptive
+from looperation.schedule import Schedule, Cron, Scheduler
+from looperation.sink import Sink
 
 __all__ = [
     "Operator",
@@ -34,6 +49,21 @@ def time_seconds(wait: float | dt.timedelta | dt.datetime) -> float:
 
     return wait
 
+def in_event_loop() -> bool:
+    """
+    Checks if the current thread is running an event loop.
+
+    :return: The value of an event loop running.
+    """
+
+    try:
+        asyncio.get_running_loop()
+
+    except RuntimeError:
+        return False
+
+    return True
+
 _O = TypeVar("_O")
 
 TimeDuration = float | dt.timedelta
@@ -43,7 +73,13 @@ class Operator(Generic[_O]):
     """A class to handle a loop operation."""
 
     DELAY = 0
-    _SLEEP = 0.0001
+
+    RUNNING = "running"
+    PAUSED = "paused"
+    STOPPED = "stopped"
+    FINISHED = "finished"
+
+    STATES = (RUNNING, PAUSED, STOPPED, FINISHED)
 
     def __init__(
             self,
@@ -61,7 +97,21 @@ class Operator(Generic[_O]):
             block: bool = False,
             coroutine: bool = False,
             wait: TimeDestination = None,
-            timeout: TimeDestination = None
+            timeout: TimeDestination = None,
+            rate: bool = False,
+            overrun: str = Pacer.SKIP,
+            history: History = None,
+            stats: bool = False,
+            batch: Batch = None,
+            max_in_flight: int = 1,
+            queue: int = None,
+            backpressure: str = Channel.BLOCK,
+            limiter: TokenBucket = None,
+            adaptive: Adaptive = None,
+            stopping_every: int = None,
+            stopping_interval: TimeDuration = None,
+            schedule: Schedule | str = None,
+            sink: Sink = None
     ) -> None:
         """
         Defines the attributes of the handler.
@@ -81,8 +131,39 @@ class Operator(Generic[_O]):
         :param block: The value to block the execution.
         :param timeout: The valur to add a start_timeout to the process.
         :param coroutine: The value to add the process as a coroutine to a running event loop.
+        :param rate: The value to run iterations in a fixed rate of delay instead of a fixed delay.
+        :param overrun: The policy for missed ticks in a fixed rate, one of burst, skip, coalesce.
+        :param history: The history object to record the calls of the operation into.
+        :param stats: The value to collect statistics of the iterations.
+        :param batch: The batch object to accumulate calls into a single call of the operation.
+        :param max_in_flight: The maximum amount of concurrent calls of an async operation.
+        :param queue: The size of a queue to collect arguments into from a separate stage.
+        :param backpressure: The policy of a full queue, one of block, drop_oldest, drop_newest.
+        :param limiter: The token bucket to take a token from before each iteration.
+        :param adaptive: The adaptive delay to slow down iterations after caught exceptions.
+        :param stopping_every: The amount of iterations between evaluations of stopping in the loop.
+        :param stopping_interval: The minimum time between evaluations of stopping.
+        :param schedule: The wall-clock schedule of the iterations, or a cron expression, instead of the delay.
+        :param sink: The sink to write the calls of the operation into.
         """
 
+        if (stopping_every is not None) and (stopping_every < 1):
+            raise ValueError(
+                f"Stopping evaluation interval must be positive, not {stopping_every}."
+            )
+
+        if backpressure not in Channel.OVERFLOWS:
+            raise ValueError(
+                f"Backpressure policy must be one of {', '.join(Channel.OVERFLOWS)}, "
+                f"not {backpressure}."
+            )
+
+        if overrun not in Pacer.OVERRUNS:
+            raise ValueError(
+                f"Overrun policy must be one of {', '.join(Pacer.OVERRUNS)}, "
+                f"not {overrun}."
+            )
+
         if delay is None:
             delay = self.DELAY
 
@@ -96,6 +177,8 @@ class Operator(Generic[_O]):
         self.warn = warn
         self.coroutine = coroutine
         self.delay = delay
+        self.rate = rate
+        self.overrun = overrun
         self.loop_stopping = loop_stopping
         self._loop = loop
 
@@ -110,19 +193,82 @@ class Operator(Generic[_O]):
         self._paused = False
         self._stopping = False
 
+        self._resumed = Signal(value=True)
+        self._halted = Signal()
+        self._finished = Signal(value=True)
+
+        self._looping = False
+        self._terminated = False
+        self._scheduled = False
+        self._firing = False
+        self._schedule_handle: TimerHandle | None = None
+        self._deferred_handle: TimerHandle | None = None
+        self._done: Future[None] | None = None
+        self._condition = threading.Condition()
+
+        self._paused_at: float | None = None
+        self._paused_time = 0.0
+
+        self._pacer = Pacer()
+        self._stopping_pacer = Pacer()
+
+        self._continuing = True
+        self._stopping_count = 0
+        self._stopping_checked: float | None = None
+
         self._operation_process: threading.Thread | None = None
-        self._timeout_process: threading.Thread | None = None
+        self._timeout_handle: TimerHandle | asyncio.TimerHandle | None = None
+        self._timeout_deadline: float | None = None
+        self._timeout_origin = False
+        self._timeout_paused_time = 0.0
         self._stopping_process: threading.Thread | None = None
 
+        self._task: asyncio.Task | None = None
+        self._task_loop: asyncio.AbstractEventLoop | None = None
+        self._loop_task: asyncio.Task | None = None
+        self._executor = None
+
+        self._in_flight: set[asyncio.Task] = set()
+        self._subscribers: list[tuple[Channel, bool]] = []
+        self._pending: deque[tuple[Channel, Any]] = deque()
+        self._cancel = False
+
+        self._channel: Channel[tuple[Iterable[Any], dict[str, Any]]] | None = None
+        self._collecting_process: threading.Thread | None = None
+        self._collecting_pacer = Pacer()
+        self._dropped = 0
+
+        self._unflushed: list[Inputs] | None = None
+
+        self._async_operation: Callable[..., _O | Awaitable[_O]] | None = None
+        self._async_value = False
+
         self._start: dt.datetime | None = None
         self._end: dt.datetime | None = None
 
+        self._started_at: float | None = None
+        self._stopped_at: float | None = None
+
         self.operation = operation
         self.termination = termination
         self.args_collector = args_collector
         self.kwargs_collector = kwargs_collector
         self.stopping_collector = stopping_collector
         self.handler = handler
+        self.history = history
+        self.statistics: Stats | None = Stats() if stats else None
+        self.batch = batch
+        self.max_in_flight = max_in_flight
+        self.queue = queue
+        self.backpressure = backpressure
+        self.limiter = limiter
+        self.adaptive = adaptive
+        self.stopping_every = stopping_every
+        self.stopping_interval = stopping_interval
+        self.schedule: Schedule | None = (
+            Cron(schedule) if isinstance(schedule, str) else schedule
+        )
+        self.sink = sink
 
     def __getstate__(self) -> dict[str, Any]:
         """
@@ -134,11 +280,44 @@ class Operator(Generic[_O]):
         data = self.__dict__.copy()
 
         data["_operation_process"] = None
-        data["_timeout_process"] = None
+        data["_timeout_handle"] = None
         data["_stopping_process"] = None
+        data["_task"] = None
+        data["_task_loop"] = None
+        data["_loop_task"] = None
+        data["_schedule_handle"] = None
+        data["_deferred_handle"] = None
+        data["_executor"] = None
+        data["_in_flight"] = set()
+        data["_subscribers"] = []
+        data["_pending"] = deque()
+        data["_channel"] = None
+        data["_collecting_process"] = None
+        data["_done"] = None
+        data["_condition"] = None
 
         return data
 
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """
+        Sets the state of the object.
+
+        :param state: The state of the object.
+        """
+
+        self.__dict__.update(state)
+
+        self._condition = threading.Condition()
+
+    def __await__(self):
+        """
+        Waits for the process of the operator to finish.
+
+        :return: The awaitable of the waiting.
+        """
+
+        return self.async_join().__await__()
+
     @property
     def blocking(self) -> bool:
         """
@@ -199,6 +378,134 @@ class Operator(Generic[_O]):
 
         return self._timeout
 
+    @property
+    def state(self) -> str:
+        """
+        returns the state of the process, one of running, paused, stopped, finished.
+
+        :return: The state value.
+        """
+
+        if self._finished.is_set():
+            return Operator.FINISHED
+
+        if not self._running:
+            return Operator.STOPPED
+
+        if self._paused:
+            return Operator.PAUSED
+
+        return Operator.RUNNING
+
+    @property
+    def done(self) -> Future[None]:
+        """
+        returns a future that is resolved when the current run of the process finishes.
+
+        :return: The future of the run.
+        """
+
+        done = self._done
+
+        if done is None:
+            done = Future()
+
+            self._done = done
+
+            if self._finished.is_set():
+                self._resolve(done)
+
+        return done
+
+    @staticmethod
+    def _resolve(future: Future[None]) -> None:
+        """
+        Resolves a future of a finished run.
+
+        :param future: The future to resolve.
+        """
+
+        try:
+            future.set_result(None)
+
+        except Exception:
+            pass
+
+    def notify(self) -> None:
+        """Wakes up the threads waiting for a change in the state of the process."""
+
+        with self._condition:
+            self._condition.notify_all()
+
+    def finish(self) -> None:
+        """Marks the current run of the process as finished."""
+
+        self._looping = False
+        self._loop_task = None
+        self._finished.set()
+
+        self.close_subscribers()
+
+        done = self._done
+
+        if done is not None and not done.done():
+            self._resolve(done)
+
+        self.notify()
+
+    def join(self, timeout: float = None) -> bool:
+        """
+        Waits for the process to finish.
+
+        :param timeout: The maximum amount of seconds to wait.
+
+        :return: The value of the process being finished.
+        """
+
+        return self._finished.wait(timeout)
+
+    async def async_join(self, timeout: float = None) -> bool:
+        """
+        Waits for the process to finish in the running event loop.
+
+        :param timeout: The maximum amount of seconds to wait.
+
+        :return: The value of the process being finished.
+        """
+
+        return await self._finished.async_wait(timeout)
+
+    def wait_until(self, state: str, timeout: float = None) -> bool:
+        """
+        Waits for the process to reach a state.
+
+        Waiting for the stopped state also returns when the process is finished.
+
+        :param state: The state to wait for, one of running, paused, stopped, finished.
+        :param timeout: The maximum amount of seconds to wait.
+
+        :return: The value of the state being reached.
+        """
+
+        if state not in Operator.STATES:
+            raise ValueError(
+                f"State must be one of {', '.join(Operator.STATES)}, not {state}."
+            )
+
+        if state == Operator.FINISHED:
+            return self.join(timeout)
+
+        if state == Operator.STOPPED:
+            accepted = (Operator.STOPPED, Operator.FINISHED)
+
+        else:
+            accepted = (state,)
+
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self.state in accepted, timeout
+            )
+
     @property
     def stopping(self) -> bool:
         """
@@ -250,283 +557,1805 @@ class Operator(Generic[_O]):
 
     @property
     def is_async(self) -> bool:
+        """
+        returns the value of the operation being a coroutine function.
 
-        return self.operation and asyncio.iscoroutinefunction(self.operation)
-
-    async def async_operate(self) -> None:
-        """Calls the operation of the process."""
+        :return: The value.
+        """
 
-        args = (self.args_collector() if self.args_collector else ())
-        kwargs = (self.kwargs_collector() if self.kwargs_collector else {})
+        operation = self.operation
 
-        if self.is_async:
-            await self.operation(*args, **kwargs)
+        if operation is not self._async_operation:
+            self._async_operation = operation
+            self._async_value = (
+                (operation is not None) and
+                asyncio.iscoroutinefunction(operation)
+            )
 
-        else:
-            self.operation(*args, **kwargs)
+        return self._async_value
 
-    def operate(self) -> None:
-        """Calls the operation of the process."""
+    def collect(self) -> tuple[Iterable[Any], dict[str, Any]]:
+        """
+        Collects the arguments for the operation.
 
-        task = self.async_operate()
+        :return: The positional and keyword arguments.
+        """
 
-        if self.coroutine:
-            asyncio.new_event_loop().create_task(task)
+        statistics = self.statistics
 
-        else:
-            asyncio.run(task)
+        if statistics is None:
+            args = (self.args_collector() if self.args_collector else ())
+            kwargs = (self.kwargs_collector() if self.kwargs_collector else {})
 
-    def continue_loop(self) -> bool:
-        """Returns the value to continue the loop."""
+            return args, kwargs
 
-        return (
-            (not self.stopping_collector) or
-            (not self.loop_stopping) or
-            (not self.stopping_collector())
-        )
+        start = time.perf_counter_ns()
 
-    def stopping_loop(self) -> None:
-        """Runs the process of stopping the operation."""
+        args = (self.args_collector() if self.args_collector else ())
+        kwargs = (self.kwargs_collector() if self.kwargs_collector else {})
 
-        while self.running:
-            while (not self.loop_stopping) and self.stopping_collector:
-                if self.paused:
-                    break
+        statistics.collector.record(time.perf_counter_ns() - start)
 
-                t = time.time()
+        return args, kwargs
 
-                if self.stopping_collector and self.stopping_collector():
-                    self.stop()
+    def record(
+            self,
+            start: int,
+            end: int,
+            args: Iterable[Any],
+            kwargs: dict[str, Any],
+            returns: _O
+    ) -> None:
+        """
+        Records a call of the operation into the statistics, the history, the sink and the result streams.
 
-                    return
+        :param start: The epoch start time of the call in nanoseconds.
+        :param end: The epoch end time of the call in nanoseconds.
+        :param args: The positional arguments of the call.
+        :param kwargs: The keyword arguments of the call.
+        :param returns: The returned value of the call.
+        """
 
-                if self.delay:
-                    delay = time_seconds(self.delay)
+        statistics = self.statistics
 
-                    time.sleep(max(delay - (time.time() - t), 0))
+        if statistics is not None:
+            statistics.operation.record(end - start)
 
-            while self.paused:
-                time.sleep(self._SLEEP)
+        history = self.history
 
-    async def async_operation_loop(self) -> None:
-        """Runs the process of the operator."""
+        if history is not None:
+            history.record(start, end, args, kwargs, returns)
 
-        if not self.loop:
-            await self.async_operate()
+        sink = self.sink
 
-        while self.running and self.continue_loop():
-            while self.operating and self.continue_loop():
-                if self.paused:
-                    break
+        if sink is not None:
+            sink.record(start, end, args, kwargs, returns)
 
-                t = time.time()
+        if self._subscribers:
+            self.publish(start, end, args, kwargs, returns)
 
-                if self.handler is None:
-                    await self.async_operate()
+    def record_batch(
+            self,
+            start: int,
+            end: int,
+            items: list[Inputs],
+            returns: Any
+    ) -> None:
+        """
+        Records a batch call of the operation into the statistics, the history, the sink and the result streams.
 
-                else:
-                    with self.handler:
-                        await self.async_operate()
+        :param start: The epoch start time of the call in nanoseconds.
+        :param end: The epoch end time of the call in nanoseconds.
+        :param items: The inputs of the calls in the batch.
+        :param returns: The returned value of the batch call.
+        """
 
-                    if self.handler.caught and self.handler.exit:
-                        self.stop()
+        statistics = self.statistics
 
-                        break
+        if statistics is not None:
+            statistics.operation.record(end - start)
 
-                if self.delay:
-                    delay = time_seconds(self.delay)
+        history = self.history
+        sink = self.sink
+        subscribed = bool(self._subscribers)
 
-                    await asyncio.sleep(max(delay - (time.time() - t), 0))
+        if (history is not None) or (sink is not None) or subscribed:
+            for inputs, value in zip(items, Batch.split(returns, len(items))):
+                if history is not None:
+                    history.record(start, end, inputs.args, inputs.kwargs, value)
 
-            while self.paused:
-                await asyncio.sleep(self._SLEEP)
+                if sink is not None:
+                    sink.record(start, end, inputs.args, inputs.kwargs, value)
 
-        self.stop()
+                if subscribed:
+                    self.publish(start, end, inputs.args, inputs.kwargs, value)
 
-    def operation_loop(self) -> None:
+    def publish(
+            self,
+            start: int,
+            end: int,
+            args: Iterable[Any],
+            kwargs: dict[str, Any],
+            returns: _O
+    ) -> None:
+        """
+        Sends the result of a call to the result streams.
 
-        task = self.async_operation_loop()
+        A full channel under the block policy blocks the calling thread, unless
+        the process runs in an event loop, where the result is kept until the
+        loop delivers it without blocking the event loop.
 
-        if self.coroutine:
-            asyncio.new_event_loop().create_task(task)
+        :param start: The epoch start time of the call in nanoseconds.
+        :param end: The epoch end time of the call in nanoseconds.
+        :param args: The positional arguments of the call.
+        :param kwargs: The keyword arguments of the call.
+        :param returns: The returned value of the call.
+        """
 
-        else:
-            asyncio.run(task)
+        outputs = Outputs(returns=returns)
+        operation = None
 
-    def timeout_loop(self, duration: TimeDestination) -> None:
-        """
-        Runs a timeout for the process.
+        for channel, operations in self._subscribers:
+            if operations:
+                if operation is None:
+                    operation = Operation(
+                        time=ProcessTime(
+                            start=from_nanoseconds(start),
+                            end=from_nanoseconds(end)
+                        ),
+                        inputs=Inputs(args=tuple(args), kwargs=dict(kwargs)),
+                        outputs=outputs
+                    )
 
-        :param duration: The duration of the timeout.
-        """
+                item = operation
 
-        origin = False
+            else:
+                item = outputs
 
-        if isinstance(duration, dt.datetime):
-            origin = True
+            if channel.offer(item) is not None:
+                continue
 
-        if isinstance(duration, (int, float)):
-            duration = dt.timedelta(seconds=duration)
+            if (self._task_loop is None) and not in_event_loop():
+                channel.put(item)
 
-        if isinstance(duration, dt.timedelta):
-            duration = dt.datetime.now() + duration
+            else:
+                self._pending.append((channel, item))
 
-        last = dt.datetime.now()
+    async def async_deliver(self) -> None:
+        """Waits for space in the full result streams to deliver the kept results."""
 
-        start = None
+        pending = self._pending
 
-        paused = False
+        while pending:
+            channel, item = pending.popleft()
 
-        while self.timeout and (duration > last):
-            while self.paused:
-                if not paused:
-                    start = dt.datetime.now()
+            await channel.async_put(item)
 
-                    paused = True
+    def close_subscribers(self) -> None:
+        """Closes the result streams, waking up the calls waiting for space in them."""
 
-                time.sleep(self._SLEEP)
+        subscribers = self._subscribers
 
-            last = dt.datetime.now()
+        if subscribers:
+            self._subscribers = []
 
-            if paused:
-                if not origin:
-                    duration += (last - start)
+            for channel, _ in subscribers:
+                channel.close()
 
-                paused = False
+        self._pending.clear()
 
-        if self.timeout:
-            self.stop()
+    def subscribe(
+            self,
+            size: int = 1000,
+            overflow: str = Channel.DROP_OLDEST,
+            operations: bool = False
+    ) -> Channel[Outputs[_O] | Operation[_O]]:
+        """
+        Creates a channel that receives the results of the operation until the process stops.
 
-    def start_operation(self) -> None:
-        """Starts the operation loop process."""
+        Under the block policy, a full channel blocks the operation until it is read.
+        When the last run of the process has already finished, the channel is closed.
 
-        if self.operating:
-            if self.warn:
-                warnings.warn(
-                    f"Operation process"
-                    f"{f' of operator {self.name}' if self.name else ''} "
-                    f"is already running."
-                )
+        :param size: The maximum amount of unread results.
+        :param overflow: The policy when the channel is full, one of block, drop_oldest, drop_newest.
+        :param operations: The value to receive full operation records instead of outputs.
 
-            return
+        :return: The channel of the results.
+        """
 
-        self._operating = True
-        self._running = True
+        channel = Channel(size, overflow=overflow)
 
-        if self.blocking:
-            self.operation_loop()
+        self._subscribers = self._subscribers + [(channel, operations)]
 
-        else:
-            self._operation_process = threading.Thread(
-                target=self.operation_loop
-            )
+        if (
+            (self._start is not None) and
+            self._finished.is_set() and
+            (not self._running)
+        ):
+            self.unsubscribe(channel)
 
-            self._operation_process.start()
+        return channel
 
-    def start_waiting(self, wait: TimeDestination = None) -> None:
+    def unsubscribe(self, channel: Channel) -> None:
         """
-        Runs a waiting for the process.
+        Stops sending results to a channel and closes it.
 
-        :param wait: The duration of the waiting.
+        :param channel: The channel of the results.
         """
 
-        if wait is None:
-            wait = self.wait_value
-
-            if wait is None:
-                raise ValueError(
-                    "Waiting value"
-                    f"{f' of operator {self.name}' if self.name else ''} "
-                    "is not defined."
-                )
+        self._subscribers = [
+            subscriber for subscriber in self._subscribers
+            if subscriber[0] is not channel
+        ]
 
-        time.sleep(time_seconds(wait))
+        channel.close()
 
-    def start_timeout(self, duration: TimeDestination = None) -> None:
+    def results(
+            self,
+            size: int = 1000,
+            overflow: str = Channel.DROP_OLDEST,
+            operations: bool = False
+    ) -> Iterator[Outputs[_O] | Operation[_O]]:
         """
-        Runs a timeout for the process.
+        Iterates over the results of the operation until the process stops.
 
-        :param duration: The duration of the start_timeout.
+        :param size: The maximum amount of unread results.
+        :param overflow: The policy when the buffer is full, one of block, drop_oldest, drop_newest.
+        :param operations: The value to receive full operation records instead of outputs.
+
+        :return: The results of the operation.
         """
 
-        if duration is None:
-            duration = self.timeout_value
+        channel = self.subscribe(size=size, overflow=overflow, operations=operations)
 
-            if duration is None:
-                raise ValueError(
-                    "Timeout value"
-                    f"{f' of operator {self.name}' if self.name else ''} "
-                    "is not defined."
-                )
+        def stream() -> Iterator[Outputs[_O] | Operation[_O]]:
+            try:
+                yield from channel
 
-        if self.timeout:
-            if self.warn:
-                warnings.warn(
-                    f"Timeout process"
-                    f"{f' of operator {self.name}' if self.name else ''} "
-                    f"is already running."
-                )
+            finally:
+                self.unsubscribe(channel)
 
-            return
+        return stream()
 
-        self._timeout = True
+    def aresults(
+            self,
+            size: int = 1000,
+            overflow: str = Channel.DROP_OLDEST,
+            operations: bool = False
+    ) -> AsyncIterator[Outputs[_O] | Operation[_O]]:
+        """
+        Iterates over the results of the operation in the running event loop until the process stops.
 
-        self._timeout_process = threading.Thread(
-            target=lambda: self.timeout_loop(duration=duration)
-        )
+        :param size: The maximum amount of unread results.
+        :param overflow: The policy when the buffer is full, one of block, drop_oldest, drop_newest.
+        :param operations: The value to receive full operation records instead of outputs.
 
-        self._timeout_process.start()
+        :return: The results of the operation.
+        """
 
-    def start_stopping(self) -> None:
-        """Runs a timeout for the process."""
+        channel = self.subscribe(size=size, overflow=overflow, operations=operations)
 
-        if self.timeout:
-            if self.warn:
-                warnings.warn(
-                    f"Stopping process"
-                    f"{f' or operator {self.name}' if self.name else ''} "
-                    f"is already running."
-                )
+        async def stream() -> AsyncIterator[Outputs[_O] | Operation[_O]]:
+            try:
+                async for item in channel:
+                    yield item
 
-            return
+            finally:
+                self.unsubscribe(channel)
 
-        self._stopping = True
+        return stream()
 
-        self._stopping_process = threading.Thread(
-            target=lambda: self.stopping_loop()
-        )
+    def sync_flush(self, items: list[Inputs] = None) -> Any:
+        """
+        Calls the operation with the accumulated batch without an event loop.
 
-        self._stopping_process.start()
+        The calls of a failed batch are kept to be retried, and the accumulated
+        calls are removed from the batch only after they are converted into columns.
 
-    def run(
-            self,
-            loop: bool = None,
-            loop_stopping: bool = None,
-            block: bool = None,
-            wait: TimeDestination = None,
-            timeout: TimeDestination = None
-    ) -> None:
-        """
-        Runs the process of the operator object.
+        :param items: The calls of a failed batch to retry, instead of the accumulated batch.
 
-        :param loop: The value to run a loop.
-        :param wait: The value to wait after starting to run the process.
-        :param block: The value to block the execution.
-        :param loop_stopping: The value to evaluate stopping during a loop.
-        :param timeout: The valur to add a start_timeout to the process.
+        :return: The returned value of the operation.
         """
 
-        if block is None:
-            block = self.block_value
+        accumulated = items is None
 
-        if wait is None:
-            wait = self.wait_value
+        if accumulated:
+            items = self.batch.items
 
-        if timeout is None:
-            timeout = self.timeout_value
+        if not items:
+            return None
 
-        if loop is not None:
-            self._loop = loop
+        args, kwargs = Batch.columns(items)
+
+        if accumulated:
+            self.batch.take()
+
+        start = time.time_ns()
+
+        self._unflushed = items
+
+        returns = self.operation(*args, **kwargs)
+
+        self._unflushed = None
+
+        self.record_batch(start, time.time_ns(), items, returns)
+
+        return returns
+
+    async def async_flush(self, items: list[Inputs] = None) -> Any:
+        """
+        Calls the operation with the accumulated batch.
+
+        The calls of a failed batch are kept to be retried, and the accumulated
+        calls are removed from the batch only after they are converted into columns.
+
+        :param items: The calls of a failed batch to retry, instead of the accumulated batch.
+
+        :return: The returned value of the operation.
+        """
+
+        if not self.is_async:
+            return await self.offload(partial(self.sync_flush, items))
+
+        accumulated = items is None
+
+        if accumulated:
+            items = self.batch.items
+
+        if not items:
+            return None
+
+        args, kwargs = Batch.columns(items)
+
+        if accumulated:
+            self.batch.take()
+
+        start = time.time_ns()
+
+        self._unflushed = items
+
+        returns = await self.operation(*args, **kwargs)
+
+        self._unflushed = None
+
+        self.record_batch(start, time.time_ns(), items, returns)
+
+        return returns
+
+    @property
+    def lingering(self) -> float | None:
+        """
+        returns the amount of seconds until the accumulated batch is due to be called.
+
+        :return: The remaining time, or None without a lingering batch.
+        """
+
+        batch = self.batch
+
+        return None if batch is None else batch.remaining
+
+    def receive(self) -> tuple[Iterable[Any], dict[str, Any]] | None:
+        """
+        Collects the arguments for the operation, or takes them from the queue.
+
+        :return: The positional and keyword arguments, or None when the queue is closed or the batch lingers.
+        """
+
+        if self._channel is None:
+            return self.collect()
+
+        try:
+            return self._channel.get(self.lingering)
+
+        except (Closed, TimeoutError):
+            return None
+
+    async def async_receive(self) -> tuple[Iterable[Any], dict[str, Any]] | None:
+        """
+        Collects the arguments for the operation, or takes them from the queue.
+
+        :return: The positional and keyword arguments, or None when the queue is closed or the batch lingers.
+        """
+
+        if self._channel is None:
+            return self.collect()
+
+        try:
+            return await self._channel.async_get(self.lingering)
+
+        except (Closed, TimeoutError):
+            return None
+
+    def sync_operate(self, inputs: tuple[Iterable[Any], dict[str, Any]] = None) -> _O:
+        """
+        Calls the operation of the process without an event loop.
+
+        :param inputs: The arguments of the call, instead of collecting them.
+
+        :return: The returned value of the operation.
+        """
+
+        batch = self.batch
+
+        if inputs is None:
+            if (batch is not None) and batch.ready:
+                return self.sync_flush()
+
+            inputs = self.receive()
+
+            if inputs is None:
+                return self.sync_flush() if (batch is not None) and batch.ready else None
+
+        args, kwargs = inputs
+
+        if batch is not None:
+            return self.sync_flush() if batch.add(args, kwargs) else None
+
+        return self.call(args, kwargs)
+
+    def call(self, args: Iterable[Any], kwargs: dict[str, Any]) -> _O:
+        """
+        Calls a synchronous operation with collected arguments.
+
+        :param args: The positional arguments of the call.
+        :param kwargs: The keyword arguments of the call.
+
+        :return: The returned value of the operation.
+        """
+
+        if (
+            (self.history is None) and (self.statistics is None) and
+            (self.sink is None) and not self._subscribers
+        ):
+            return self.operation(*args, **kwargs)
+
+        start = time.time_ns()
+
+        returns = self.operation(*args, **kwargs)
+
+        self.record(start, time.time_ns(), args, kwargs, returns)
+
+        return returns
+
+    async def async_operate(self, inputs: tuple[Iterable[Any], dict[str, Any]] = None) -> _O:
+        """
+        Calls the operation of the process.
+
+        :param inputs: The arguments of the call, instead of collecting them.
+
+        :return: The returned value of the operation.
+        """
+
+        if not self.is_async and self._channel is None:
+            return self.sync_operate(inputs)
+
+        batch = self.batch
+
+        if inputs is None:
+            if (batch is not None) and batch.ready:
+                return await self.async_flush()
+
+            inputs = await self.async_receive()
+
+            if inputs is None:
+                return await self.async_flush() if (batch is not None) and batch.ready else None
+
+        args, kwargs = inputs
+
+        if batch is not None:
+            return await self.async_flush() if batch.add(args, kwargs) else None
+
+        if not self.is_async:
+            return await self.offload(partial(self.call, args, kwargs))
+
+        if (
+            (self.history is None) and (self.statistics is None) and
+            (self.sink is None) and not self._subscribers
+        ):
+            return await self.operation(*args, **kwargs)
+
+        start = time.time_ns()
+
+        returns = await self.operation(*args, **kwargs)
+
+        self.record(start, time.time_ns(), args, kwargs, returns)
+
+        return returns
+
+    async def offload(self, callback: Callable[[], _O]) -> _O:
+        """
+        Calls a synchronous callback, in the thread pool of the executor when running in one.
+
+        :param callback: The callback to call.
+
+        :return: The returned value of the callback.
+        """
+
+        if self._executor is None:
+            return callback()
+
+        return await self._executor.call(callback)
+
+    def operate(self) -> _O | asyncio.Task:
+        """
+        Calls the operation of the process.
+
+        :return: The returned value, or the task of the operation when running as a coroutine.
+        """
+
+        if self.coroutine:
+            return asyncio.get_running_loop().create_task(self.async_operate())
+
+        if self.is_async:
+            return asyncio.run(self.async_operate())
+
+        return self.sync_operate()
+
+    def handle(self, start: int = None, handler: Handler = None, iteration: bool = True) -> bool:
+        """
+        Accounts for a finished iteration and the state of the handler.
+
+        :param start: The start time of the iteration in nanoseconds.
+        :param handler: The handler of the iteration, or the handler of the operator.
+        :param iteration: The value to count the call as an iteration.
+
+        :return: The value to continue the loop.
+        """
+
+        proceed = True
+
+        statistics = self.statistics
+
+        if handler is None:
+            handler = self.handler
+
+        adaptive = self.adaptive
+
+        if adaptive is not None:
+            if (handler is not None) and handler.caught:
+                adaptive.failure()
+
+            else:
+                adaptive.success()
+
+        if (handler is not None) and handler.caught:
+            if statistics is not None:
+                statistics.errors += 1
+
+            if handler.exit:
+                self.stop()
+
+                proceed = False
+
+        if (statistics is not None) and iteration:
+            statistics.iterations += 1
+
+            if start is not None:
+                statistics.iteration.record(time.perf_counter_ns() - start)
+
+        return proceed
+
+    def attempt(
+            self,
+            handler: Handler,
+            inputs: tuple[Iterable[Any], dict[str, Any]] = None
+    ) -> tuple[Iterable[Any], dict[str, Any]] | None:
+        """
+        Runs a single attempt of the operation inside a handler, without an event loop.
+
+        :param handler: The handler of the attempt.
+        :param inputs: The arguments of a previous attempt to retry.
+
+        :return: The arguments of the attempt.
+        """
+
+        with handler:
+            if self._unflushed is not None:
+                self.sync_flush(self._unflushed)
+
+            elif (inputs is None) and (self.batch is not None):
+                self.sync_operate()
+
+            else:
+                if inputs is None:
+                    inputs = self.receive()
+
+                if inputs is not None:
+                    self.sync_operate(inputs)
+
+        return inputs
+
+    async def async_attempt(
+            self,
+            handler: Handler,
+            inputs: tuple[Iterable[Any], dict[str, Any]] = None
+    ) -> tuple[Iterable[Any], dict[str, Any]] | None:
+        """
+        Runs a single attempt of the operation inside a handler.
+
+        :param handler: The handler of the attempt.
+        :param inputs: The arguments of a previous attempt to retry.
+
+        :return: The arguments of the attempt.
+        """
+
+        with handler:
+            if self._unflushed is not None:
+                await self.async_flush(self._unflushed)
+
+            elif (inputs is None) and (self.batch is not None):
+                await self.async_operate()
+
+            else:
+                if inputs is None:
+                    inputs = await self.async_receive()
+
+                if inputs is not None:
+                    await self.async_operate(inputs)
+
+        return inputs
+
+    def step(self, iteration: bool = True) -> bool:
+        """
+        Runs a single iteration of the operation without an event loop.
+
+        :param iteration: The value to count the call as an iteration.
+
+        :return: The value to continue the loop.
+        """
+
+        start = None if self.statistics is None else time.perf_counter_ns()
+
+        handler = self.handler
+
+        self._unflushed = None
+
+        if handler is None:
+            self.sync_operate()
+
+        else:
+            inputs = self.attempt(handler)
+
+            while handler.retrying and not self._halted.wait(handler.retry_delay):
+                inputs = self.attempt(handler, inputs)
+
+        return self.handle(start, iteration=iteration)
+
+    async def async_step(self, iteration: bool = True) -> bool:
+        """
+        Runs a single iteration of the operation.
+
+        In an executor, a synchronous operation runs in its thread pool,
+        while the queue of collected arguments is read in the event loop.
+
+        :param iteration: The value to count the call as an iteration.
+
+        :return: The value to continue the loop.
+        """
+
+        handler = self.handler
+
+        if (
+            (self._executor is not None) and
+            (not self.is_async) and
+            (self._channel is None)
+        ):
+            if (handler is None) or (handler.retry is None):
+                proceed = await self._executor.call(partial(self.step, iteration))
+
+                if self._pending:
+                    await self.async_deliver()
+
+                return proceed
+
+            start = None if self.statistics is None else time.perf_counter_ns()
+
+            self._unflushed = None
+
+            inputs = await self._executor.call(partial(self.attempt, handler))
+
+            while handler.retrying and not await self._halted.async_wait(handler.retry_delay):
+                inputs = await self._executor.call(partial(self.attempt, handler, inputs))
+
+            if self._pending:
+                await self.async_deliver()
+
+            return self.handle(start, iteration=iteration)
+
+        return await self.async_call(handler, iteration)
+
+    async def async_call(self, handler: Handler = None, iteration: bool = True) -> bool:
+        """
+        Runs a single iteration of the operation with its own handler.
+
+        :param handler: The handler of the iteration.
+        :param iteration: The value to count the call as an iteration.
+
+        :return: The value to continue the loop.
+        """
+
+        start = None if self.statistics is None else time.perf_counter_ns()
+
+        self._unflushed = None
+
+        if handler is None:
+            await self.async_operate()
+
+        else:
+            inputs = await self.async_attempt(handler)
+
+            while handler.retrying and not await self._halted.async_wait(handler.retry_delay):
+                inputs = await self.async_attempt(handler, inputs)
+
+        if self._pending:
+            await self.async_deliver()
+
+        return self.handle(start, handler, iteration)
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        returns the amount of collected arguments waiting in the queue.
+
+        :return: The amount of arguments.
+        """
+
+        return 0 if self._channel is None else len(self._channel)
+
+    @property
+    def dropped(self) -> int:
+        """
+        returns the amount of collected arguments dropped by the queue.
+
+        :return: The amount of arguments.
+        """
+
+        return self._dropped + (0 if self._channel is None else self._channel.dropped)
+
+    def collecting_handler(self) -> Handler:
+        """
+        Returns a copy of the handler for the collecting stage.
+
+        The copy has no retry and no circuit breaker, so collections are not
+        counted as calls of the operation.
+
+        :return: The handler of the collecting stage.
+        """
+
+        handler = self.handler()
+
+        handler.retry = None
+        handler.breaker = None
+
+        return handler
+
+    def collecting_loop(self) -> None:
+        """Runs the stage of collecting arguments into the queue."""
+
+        channel = self._channel
+
+        try:
+            while self.running and not channel.closed:
+                if self.paused:
+                    self._resumed.wait()
+                    self._collecting_pacer.reset()
+
+                    continue
+
+                self._collecting_pacer.begin()
+
+                if self.handler is None:
+                    channel.put(self.collect())
+
+                else:
+                    handler = self.collecting_handler()
+
+                    with handler:
+                        channel.put(self.collect())
+
+                    if handler.caught and handler.exit:
+                        break
+
+                if self.delay:
+                    self._halted.wait(
+                        self._collecting_pacer.wait(
+                            time_seconds(self.delay),
+                            rate=self.rate, overrun=self.overrun
+                        )
+                    )
+
+        finally:
+            if self.running:
+                self.stop()
+
+    async def async_collecting_loop(self) -> None:
+        """Runs the stage of collecting arguments into the queue in the running event loop."""
+
+        channel = self._channel
+
+        try:
+            while self.running and not channel.closed:
+                if self.paused:
+                    await self._resumed.async_wait()
+                    self._collecting_pacer.reset()
+
+                    continue
+
+                self._collecting_pacer.begin()
+
+                if self._executor is not None:
+                    collected = self._executor.call(self.collect)
+
+                else:
+                    collected = asyncio.to_thread(self.collect)
+
+                if self.handler is None:
+                    await channel.async_put(await collected)
+
+                else:
+                    handler = self.collecting_handler()
+
+                    with handler:
+                        await channel.async_put(await collected)
+
+                    if handler.caught and handler.exit:
+                        break
+
+                if self.delay:
+                    await self._halted.async_wait(
+                        self._collecting_pacer.wait(
+                            time_seconds(self.delay),
+                            rate=self.rate, overrun=self.overrun
+                        )
+                    )
+
+                else:
+                    await asyncio.sleep(0)
+
+        finally:
+            if self.running:
+                self.stop()
+
+    def start_collecting(self) -> None:
+        """Starts the stage of collecting arguments into the queue."""
+
+        if self._channel is not None:
+            self._dropped += self._channel.dropped
+
+        self._channel = Channel(size=self.queue, overflow=self.backpressure)
+        self._collecting_pacer.reset()
+
+        if self._task_loop is not None:
+            self._collecting_process = None
+
+            self._task_loop.create_task(self.async_collecting_loop())
+
+        else:
+            self._collecting_process = threading.Thread(
+                target=self.collecting_loop, daemon=True
+            )
+
+            self._collecting_process.start()
+
+    def stop_collecting(self) -> None:
+        """Stops the stage of collecting arguments into the queue."""
+
+        if self._channel is not None:
+            self._channel.close()
+
+        self._collecting_process = None
+
+    @property
+    def in_flight(self) -> int:
+        """
+        returns the amount of concurrent calls of the operation.
+
+        :return: The amount of calls.
+        """
+
+        return len(self._in_flight)
+
+    @property
+    def active_time(self) -> float:
+        """
+        returns the amount of seconds the process spent running and not paused.
+
+        :return: The active time value.
+        """
+
+        if self._started_at is None:
+            return 0.0
+
+        end = self._stopped_at
+
+        if end is None:
+            end = time.monotonic()
+
+        return max(end - self._started_at - self.paused_time, 0.0)
+
+    def describe(self, statistics: Stats) -> dict[str, Any]:
+        """
+        Returns a json object of statistics with the timing of the operator.
+
+        :param statistics: The statistics to describe.
+
+        :return: The data of the statistics.
+        """
+
+        data = statistics.json()
+
+        active_time = self.active_time - statistics.active
+        delay = time_seconds(self.delay) if self.delay else None
+
+        data["active_time"] = active_time
+        data["paused_time"] = self.paused_time
+        data["rate"] = (statistics.iterations / active_time) if active_time > 0 else None
+        data["target_rate"] = (1 / delay) if delay else None
+        data["missed"] = self._pacer.missed
+
+        return data
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Returns a snapshot of the statistics of the operator.
+
+        :return: The data of the statistics.
+        """
+
+        return self.describe(self.statistics or Stats())
+
+    def reset_stats(self) -> None:
+        """Removes all collected statistics of the operator."""
+
+        if self.statistics is not None:
+            self.statistics.reset(active=self.active_time)
+
+        self._pacer.missed = 0
+
+    def stopping_due(self) -> bool:
+        """
+        Checks if the stopping collector is due for evaluation in this iteration.
+
+        When stopping_every or stopping_interval is set, the stopping collector
+        is evaluated only on the due iterations, and the last result is used in between.
+
+        :return: The value of the stopping collector being due.
+        """
+
+        if (self.stopping_every is not None) or (self.stopping_interval is not None):
+            count = self._stopping_count
+
+            self._stopping_count += 1
+
+            if self.stopping_every and (count % self.stopping_every):
+                return False
+
+            if self.stopping_interval is not None:
+                now = time.monotonic()
+
+                if (
+                    (self._stopping_checked is not None) and
+                    (now - self._stopping_checked < time_seconds(self.stopping_interval))
+                ):
+                    return False
+
+                self._stopping_checked = now
+
+        return True
+
+    def continue_loop(self) -> bool:
+        """
+        Returns the value to continue the loop.
+
+        :return: The value to continue.
+        """
+
+        if (not self.stopping_collector) or (not self.loop_stopping):
+            return True
+
+        if self.stopping_due():
+            self._continuing = not self.stopping_collector()
+
+        return self._continuing
+
+    async def async_continue_loop(self) -> bool:
+        """
+        Returns the value to continue the loop in the running event loop.
+
+        In an executor or a schedule, the stopping collector is called in their thread pool.
+
+        :return: The value to continue.
+        """
+
+        if (not self.stopping_collector) or (not self.loop_stopping):
+            return True
+
+        if self.stopping_due():
+            self._continuing = not await self.collect_stopping()
+
+        return self._continuing
+
+    async def collect_stopping(self) -> bool:
+        """
+        Calls the stopping collector, in the thread pool of the executor or the scheduler when running in one.
+
+        :return: The value to stop.
+        """
+
+        if self._executor is not None:
+            return await self._executor.call(self.stopping_collector)
+
+        if self._scheduled:
+            return await asyncio.get_running_loop().run_in_executor(
+                Scheduler.shared().pool, self.stopping_collector
+            )
+
+        return self.stopping_collector()
+
+    @property
+    def paused_time(self) -> float:
+        """
+        returns the amount of seconds the process spent paused.
+
+        :return: The paused time value.
+        """
+
+        paused_time = self._paused_time
+        paused_at = self._paused_at
+
+        if paused_at is not None:
+            paused_time += time.monotonic() - paused_at
+
+        return paused_time
+
+    def stopping_loop(self) -> None:
+        """Runs the process of stopping the operation."""
+
+        while self.running:
+            while (
+                self.running and
+                (not self.loop_stopping) and
+                self.stopping_collector
+            ):
+                if self.paused:
+                    break
+
+                self._stopping_pacer.begin()
+
+                if self.stopping_collector and self.stopping_collector():
+                    self.stop()
+
+                    return
+
+                interval = self.stopping_interval or self.delay
+
+                if interval:
+                    self._halted.wait(
+                        self._stopping_pacer.wait(time_seconds(interval))
+                    )
+
+            if not self.running or (self.loop_stopping or not self.stopping_collector):
+                break
+
+            self._resumed.wait()
+            self._stopping_pacer.reset()
+
+    async def async_stopping_loop(self) -> None:
+        """Runs the process of stopping the operation in the running event loop."""
+
+        while self.running:
+            while (
+                self.running and
+                (not self.loop_stopping) and
+                self.stopping_collector
+            ):
+                if self.paused:
+                    break
+
+                self._stopping_pacer.begin()
+
+                if self.stopping_collector and await self.collect_stopping():
+                    self.stop()
+
+                    return
+
+                interval = self.stopping_interval or self.delay
+
+                if interval:
+                    await self._halted.async_wait(
+                        self._stopping_pacer.wait(time_seconds(interval))
+                    )
+
+            if not self.running or (self.loop_stopping or not self.stopping_collector):
+                break
+
+            await self._resumed.async_wait()
+            self._stopping_pacer.reset()
+
+    def blocked(self) -> float | None:
+        """
+        Checks the circuit breaker of the handler before an iteration.
+
+        :return: The amount of seconds to wait instead of the iteration, or None to proceed.
+        """
+
+        handler = self.handler
+
+        if (handler is None) or (handler.breaker is None):
+            return None
+
+        breaker = handler.breaker
+
+        if breaker.allow():
+            return None
+
+        remaining = breaker.remaining()
+
+        if breaker.pause:
+            self.pause()
+            self.call_later(remaining, self.unpause)
+
+            return 0.0
+
+        if self.delay:
+            return min(time_seconds(self.delay), remaining)
+
+        return remaining
+
+    def throttle(self) -> float:
+        """
+        Returns the amount of seconds to wait for the rate limiter and the adaptive delay.
+
+        :return: The waiting time.
+        """
+
+        wait = 0.0
+
+        if self.limiter is not None:
+            wait += self.limiter.reserve()
+
+        if self.adaptive is not None:
+            wait += self.adaptive.delay
+
+        return wait
+
+    def pace(self) -> float:
+        """
+        Returns the amount of seconds to wait before the next iteration.
+
+        :return: The waiting time.
+        """
+
+        if self.schedule is not None:
+            return self.schedule.wait()
+
+        return self._pacer.wait(
+            time_seconds(self.delay), rate=self.rate, overrun=self.overrun
+        )
+
+    def wait_next(self, wait: float) -> None:
+        """
+        Waits before the next iteration, calling the batch when it lingers for too long in the meantime.
+
+        The call of a lingering batch is not counted as an iteration.
+
+        :param wait: The amount of seconds to wait.
+        """
+
+        remaining = self.lingering
+
+        if (remaining is not None) and (remaining < wait):
+            deadline = time.monotonic() + wait
+
+            if self._halted.wait(remaining):
+                return
+
+            self.step(iteration=False)
+
+            wait = max(deadline - time.monotonic(), 0.0)
+
+        self._halted.wait(wait)
+
+    async def async_wait_next(self, wait: float) -> None:
+        """
+        Waits before the next iteration, calling the batch when it lingers for too long in the meantime.
+
+        The call of a lingering batch is not counted as an iteration.
+
+        :param wait: The amount of seconds to wait.
+        """
+
+        remaining = self.lingering
+
+        if (remaining is not None) and (remaining < wait):
+            deadline = time.monotonic() + wait
+
+            if await self._halted.async_wait(remaining):
+                return
+
+            await self.async_step(iteration=False)
+
+            wait = max(deadline - time.monotonic(), 0.0)
+
+        await self._halted.async_wait(wait)
+
+    def drain(self) -> None:
+        """Calls the operation with the calls left in the batch when the loop ends, without an event loop."""
+
+        if (self.batch is not None) and len(self.batch):
+            with self.handler or nullcontext():
+                self.sync_flush()
+
+    async def async_drain(self) -> None:
+        """Calls the operation with the calls left in the batch when the loop ends."""
+
+        if (self.batch is not None) and len(self.batch):
+            with self.handler or nullcontext():
+                await self.async_flush()
+
+            if self._pending:
+                await self.async_deliver()
+
+    def sync_operation_loop(self) -> None:
+        """Runs the process of the operator for a synchronous operation."""
+
+        if not self.loop:
+            self.step()
+            self.drain()
+            self.stop()
+
+            return
+
+        while self.running and self._continuing:
+            while self.operating and self.continue_loop():
+                if self.paused:
+                    break
+
+                if (self.handler is not None) and (self.handler.breaker is not None):
+                    wait = self.blocked()
+
+                    if wait is not None:
+                        self._halted.wait(wait)
+
+                        continue
+
+                if (self.limiter is not None) or (self.adaptive is not None):
+                    wait = self.throttle()
+
+                    if wait > 0 and self._halted.wait(wait):
+                        break
+
+                self._pacer.begin()
+
+                if not self.step():
+                    break
+
+                if self.delay or (self.schedule is not None):
+                    self.wait_next(self.pace())
+
+            if self.paused:
+                self._resumed.wait()
+                self._pacer.reset()
+
+        self.drain()
+        self.stop()
+
+    async def async_concurrent_loop(self) -> None:
+        """Runs the process of the operator with multiple concurrent calls."""
+
+        in_flight: set[asyncio.Task] = set()
+        failures: list[BaseException] = []
+
+        self._in_flight = in_flight
+
+        def done(task: asyncio.Task) -> None:
+            in_flight.discard(task)
+
+            if not task.cancelled() and task.exception() is not None:
+                failures.append(task.exception())
+
+                self._halted.set()
+
+        try:
+            while self.running and self._continuing and not failures:
+                while self.operating and await self.async_continue_loop():
+                    if self.paused or failures:
+                        break
+
+                    if (self.handler is not None) and (self.handler.breaker is not None):
+                        wait = self.blocked()
+
+                        if wait is not None:
+                            await self._halted.async_wait(wait)
+
+                            continue
+
+                    if (self.limiter is not None) or (self.adaptive is not None):
+                        wait = self.throttle()
+
+                        if wait > 0 and await self._halted.async_wait(wait):
+                            break
+
+                    self._pacer.begin()
+
+                    while (
+                        in_flight and
+                        (len(in_flight) >= max(self.max_in_flight, 1)) and
+                        not self._halted.is_set()
+                    ):
+                        halted = asyncio.ensure_future(self._halted.async_wait())
+
+                        await asyncio.wait(
+                            in_flight | {halted}, return_when=asyncio.FIRST_COMPLETED
+                        )
+
+                        halted.cancel()
+
+                    if not self.operating or failures:
+                        break
+
+                    task = asyncio.create_task(
+                        self.async_call(None if self.handler is None else self.handler())
+                    )
+
+                    in_flight.add(task)
+                    task.add_done_callback(done)
+
+                    if self.delay or (self.schedule is not None):
+                        await self._halted.async_wait(self.pace())
+
+                    else:
+                        await asyncio.sleep(0)
+
+                if self.paused and not failures:
+                    await self._resumed.async_wait()
+                    self._pacer.reset()
+
+        finally:
+            if in_flight:
+                if self._cancel:
+                    for task in in_flight:
+                        task.cancel()
+
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+        self.stop()
+
+        if failures:
+            raise failures[0]
+
+    async def async_operation_loop(self) -> None:
+        """Runs the process of the operator."""
+
+        self._loop_task = asyncio.current_task()
+
+        if not self.loop:
+            await self.async_step()
+            await self.async_drain()
+            self.stop()
+
+            return
+
+        if (self.max_in_flight > 1) and self.is_async and (self.batch is None):
+            await self.async_concurrent_loop()
+
+            return
+
+        while self.running and self._continuing:
+            while self.operating and await self.async_continue_loop():
+                if self.paused:
+                    break
+
+                if (self.handler is not None) and (self.handler.breaker is not None):
+                    wait = self.blocked()
+
+                    if wait is not None:
+                        await self._halted.async_wait(wait)
+
+                        continue
+
+                if (self.limiter is not None) or (self.adaptive is not None):
+                    wait = self.throttle()
+
+                    if wait > 0 and await self._halted.async_wait(wait):
+                        break
+
+                self._pacer.begin()
+
+                if not await self.async_step():
+                    break
+
+                if self.delay or (self.schedule is not None):
+                    await self.async_wait_next(self.pace())
+
+                else:
+                    await asyncio.sleep(0)
+
+            if self.paused:
+                await self._resumed.async_wait()
+                self._pacer.reset()
+
+        await self.async_drain()
+        self.stop()
+
+    def operation_loop(self) -> asyncio.Task | None:
+        """
+        Runs the operation loop of the process.
+
+        Synchronous operations run in a plain loop with no event loop,
+        asynchronous operations run in a single event loop for the whole process.
+
+        :return: The task of the loop, when running as a coroutine.
+        """
+
+        if self.coroutine:
+            return asyncio.get_running_loop().create_task(
+                self.async_operation_loop()
+            )
+
+        if self.is_async:
+            asyncio.run(self.async_operation_loop())
+
+        else:
+            self.sync_operation_loop()
+
+    async def task_loop(
+            self,
+            wait: TimeDestination = None,
+            timeout: TimeDestination = None
+    ) -> None:
+        """
+        Runs the whole process of the operator in the running event loop.
+
+        :param wait: The value to wait after starting to run the process.
+        :param timeout: The valur to add a start_timeout to the process.
+        """
+
+        if not self.running:
+            self.finish()
+
+            return
+
+        if timeout:
+            self.start_timeout(timeout)
+
+        if wait:
+            await self._halted.async_wait(time_seconds(wait))
+
+        stopping: asyncio.Task | None = None
+
+        if (
+            (not self.loop_stopping or not self.loop) and
+            (self.stopping_collector is not None)
+        ):
+            self._stopping = True
+
+            stopping = asyncio.create_task(self.async_stopping_loop())
+
+        try:
+            if (self.operation is not None) and self.running:
+                self._operating = True
+
+                if self.queue:
+                    self.start_collecting()
+
+                await self.async_operation_loop()
+
+            else:
+                await self._halted.async_wait()
+
+        except asyncio.CancelledError:
+            self.stop()
+
+            raise
+
+        finally:
+            self._stopping = False
+
+            if stopping is not None and not stopping.done():
+                stopping.cancel()
+
+            self.finish()
+
+    def start_task(
+            self,
+            loop: bool = None,
+            loop_stopping: bool = None,
+            wait: TimeDestination = None,
+            timeout: TimeDestination = None,
+            prepared: bool = False
+    ) -> asyncio.Task:
+        """
+        Runs the process of the operator as a task in the running event loop.
+
+        :param loop: The value to run a loop.
+        :param wait: The value to wait after starting to run the process.
+        :param loop_stopping: The value to evaluate stopping during a loop.
+        :param timeout: The valur to add a start_timeout to the process.
+        :param prepared: The value of the state being already prepared by the caller.
+
+        :return: The task of the process.
+        """
+
+        event_loop = asyncio.get_running_loop()
+
+        if self.operating or (self._task is not None and not self._task.done()):
+            if self.warn:
+                warnings.warn(
+                    f"Operation process"
+                    f"{f' of operator {self.name}' if self.name else ''} "
+                    f"is already running."
+                )
+
+            return self._task
+
+        if wait is None:
+            wait = self.wait_value
+
+        if timeout is None:
+            timeout = self.timeout_value
+
+        if (wait is None) and (self.schedule is not None):
+            wait = self.schedule.next(dt.datetime.now())
+
+        if not prepared:
+            self.prepare(loop=loop, loop_stopping=loop_stopping, block=False)
+
+        self._looping = True
+        self._task_loop = event_loop
+        self._task = event_loop.create_task(
+            self.task_loop(wait=wait, timeout=timeout)
+        )
+
+        return self._task
+
+    async def run_async(
+            self,
+            loop: bool = None,
+            loop_stopping: bool = None,
+            wait: TimeDestination = None,
+            timeout: TimeDestination = None,
+            prepared: bool = False
+    ) -> None:
+        """
+        Runs the process of the operator in the running event loop until it stops.
+
+        :param loop: The value to run a loop.
+        :param wait: The value to wait after starting to run the process.
+        :param loop_stopping: The value to evaluate stopping during a loop.
+        :param timeout: The valur to add a start_timeout to the process.
+        :param prepared: The value of the state being already prepared by the caller.
+        """
+
+        await self.start_task(
+            loop=loop, loop_stopping=loop_stopping,
+            wait=wait, timeout=timeout, prepared=prepared
+        )
+
+    def call_later(self, delay: float, callback: Callable[[], Any]) -> Any:
+        """
+        Schedules a callback in the event loop of the task, or in the shared timer.
+
+        :param delay: The amount of seconds to wait.
+        :param callback: The callback to call.
+
+        :return: The cancellable handle of the callback.
+        """
+
+        event_loop = self._task_loop
+
+        if event_loop is None or event_loop.is_closed():
+            return Timer.shared().schedule(delay, callback)
+
+        try:
+            running = asyncio.get_running_loop()
+
+        except RuntimeError:
+            running = None
+
+        if running is event_loop:
+            return event_loop.call_later(delay, callback)
+
+        return Timer.shared().schedule(
+            delay, lambda: event_loop.call_soon_threadsafe(callback)
+        )
+
+    def timeout_remaining(self) -> float | None:
+        """
+        Returns the amount of active seconds left until the timeout.
+
+        :return: The remaining seconds.
+        """
+
+        if self._timeout_deadline is None:
+            return None
+
+        remaining = self._timeout_deadline - time.monotonic()
+
+        if not self._timeout_origin:
+            remaining += self.paused_time - self._timeout_paused_time
+
+        return remaining
+
+    def schedule_timeout(self) -> None:
+        """Schedules the expiration of the timeout in the shared timer."""
+
+        if self._timeout_handle is not None:
+            self._timeout_handle.cancel()
+
+        remaining = self.timeout_remaining()
+
+        if remaining is None:
+            return
+
+        self._timeout_handle = self.call_later(
+            max(remaining, 0), self.expire_timeout
+        )
+
+    def expire_timeout(self) -> None:
+        """
+        Stops the process when the timeout is due.
+
+        In a thread, the stopping runs in the worker threads of the shared timer,
+        so a slow termination callback does not delay the other timers,
+        in an event loop, the stopping runs in the event loop of the task.
+        """
+
+        self._timeout_handle = None
+
+        remaining = self.timeout_remaining()
+
+        if (not self.timeout) or self.paused or (remaining is None):
+            return
+
+        if remaining > 0:
+            self.schedule_timeout()
+
+        elif (self._task_loop is not None) and not self._task_loop.is_closed():
+            self.stop()
+
+        else:
+            Timer.shared().submit(self.stop)
+
+    def operation_process(self) -> None:
+        """Runs the operation loop and marks the run as finished when it exits."""
+
+        task = None
+
+        try:
+            task = self.operation_loop()
+
+        except asyncio.CancelledError:
+            if not self._cancel:
+                raise
+
+        finally:
+            if task is None:
+                self.finish()
+
+            else:
+                task.add_done_callback(lambda _: self.finish())
+
+    def start_operation(self) -> None:
+        """Starts the operation loop process."""
+
+        if self.operating:
+            if self.warn:
+                warnings.warn(
+                    f"Operation process"
+                    f"{f' of operator {self.name}' if self.name else ''} "
+                    f"is already running."
+                )
+
+            return
+
+        self._operating = True
+        self._running = True
+        self._looping = True
+
+        if self.blocking:
+            self.operation_process()
+
+        else:
+            self._operation_process = threading.Thread(
+                target=self.operation_process
+            )
+
+            self._operation_process.start()
+
+    def start_waiting(self, wait: TimeDestination = None) -> None:
+        """
+        Runs a waiting for the process.
+
+        :param wait: The duration of the waiting.
+        """
+
+        if wait is None:
+            wait = self.wait_value
+
+            if wait is None:
+                raise ValueError(
+                    "Waiting value"
+                    f"{f' of operator {self.name}' if self.name else ''} "
+                    "is not defined."
+                )
+
+        time.sleep(time_seconds(wait))
+
+    def start_timeout(self, duration: TimeDestination = None) -> None:
+        """
+        Runs a timeout for the process.
+
+        :param duration: The duration of the start_timeout.
+        """
+
+        if duration is None:
+            duration = self.timeout_value
+
+            if duration is None:
+                raise ValueError(
+                    "Timeout value"
+                    f"{f' of operator {self.name}' if self.name else ''} "
+                    "is not defined."
+                )
+
+        if self.timeout:
+            if self.warn:
+                warnings.warn(
+                    f"Timeout process"
+                    f"{f' of operator {self.name}' if self.name else ''} "
+                    f"is already running."
+                )
+
+            return
+
+        self._timeout = True
+        self._timeout_origin = isinstance(duration, dt.datetime)
+        self._timeout_deadline = time.monotonic() + time_seconds(duration)
+        self._timeout_paused_time = self.paused_time
+
+        self.schedule_timeout()
+
+    def start_stopping(self) -> None:
+        """Runs a timeout for the process."""
+
+        if self.stopping:
+            if self.warn:
+                warnings.warn(
+                    f"Stopping process"
+                    f"{f' or operator {self.name}' if self.name else ''} "
+                    f"is already running."
+                )
+
+            return
+
+        self._stopping = True
+
+        self._stopping_process = threading.Thread(
+            target=lambda: self.stopping_loop()
+        )
+
+        self._stopping_process.start()
+
+    def prepare(
+            self,
+            loop: bool = None,
+            loop_stopping: bool = None,
+            block: bool = None
+    ) -> None:
+        """
+        Prepares the state of the operator object before running.
+
+        :param loop: The value to run a loop.
+        :param block: The value to block the execution.
+        :param loop_stopping: The value to evaluate stopping during a loop.
+        """
+
+        if block is None:
+            block = self.block_value
+
+        if loop is not None:
+            self._loop = loop
 
         else:
             loop = self.loop
@@ -542,21 +2371,288 @@ class Operator(Generic[_O]):
         self._running = True
         self._paused = False
 
+        self._paused_at = None
+        self._paused_time = 0.0
+
+        self._halted.clear()
+        self._resumed.set()
+        self._finished.clear()
+
+        self._done = None
+        self._cancel = False
+        self._terminated = False
+
+        self._pacer.reset()
+        self._stopping_pacer.reset()
+
+        self._continuing = True
+        self._stopping_count = 0
+        self._stopping_checked = None
+
+        self._task_loop = None
+
         self._blocking = block
 
         self._start = dt.datetime.now()
 
+        self._started_at = time.monotonic()
+        self._stopped_at = None
+
+        if self.statistics is not None:
+            self.statistics.active = 0.0
+
+        self.notify()
+
+    def run(
+            self,
+            loop: bool = None,
+            loop_stopping: bool = None,
+            block: bool = None,
+            wait: TimeDestination = None,
+            timeout: TimeDestination = None,
+            executor: Any = None
+    ) -> None:
+        """
+        Runs the process of the operator object.
+
+        :param loop: The value to run a loop.
+        :param wait: The value to wait after starting to run the process.
+        :param block: The value to block the execution.
+        :param loop_stopping: The value to evaluate stopping during a loop.
+        :param timeout: The valur to add a start_timeout to the process.
+        :param executor: The executor to run the process in as a task, instead of a thread.
+        """
+
+        if executor is not None:
+            future = executor.submit(
+                self, loop=loop, loop_stopping=loop_stopping,
+                wait=wait, timeout=timeout
+            )
+
+            if self.block_value if block is None else block:
+                future.result()
+
+            return
+
+        if self.coroutine:
+            self.start_task(
+                loop=loop, loop_stopping=loop_stopping,
+                wait=wait, timeout=timeout
+            )
+
+            return
+
+        if wait is None:
+            wait = self.wait_value
+
+        if timeout is None:
+            timeout = self.timeout_value
+
+        self.prepare(loop=loop, loop_stopping=loop_stopping, block=block)
+
+        scheduled = (
+            (self.schedule is not None) and
+            (self.operation is not None) and
+            self.loop and
+            not self.blocking
+        )
+
+        if (wait is None) and (self.schedule is not None) and not scheduled:
+            wait = self.schedule.next(dt.datetime.now())
+
         if timeout:
             self.start_timeout(timeout)
 
         if wait:
             self.start_waiting(wait)
 
-        if (not loop_stopping or not loop) and (self.stopping_collector is not None):
+        if (
+            (not self.loop_stopping or not self.loop) and
+            (self.stopping_collector is not None)
+        ):
             self.start_stopping()
 
         if self.operation is not None:
-            self.start_operation()
+            if self.queue:
+                self.start_collecting()
+
+            if scheduled:
+                self.start_schedule()
+
+            else:
+                self.start_operation()
+
+    def start_schedule(self) -> None:
+        """Starts the iterations of the process in the shared scheduler, without a thread."""
+
+        self._operating = True
+        self._running = True
+        self._looping = True
+        self._scheduled = True
+
+        Scheduler.shared().add(self)
+
+    def fire(self, resume: Callable[[], bool] = None) -> None:
+        """
+        Runs a scheduled iteration of the process.
+
+        :param resume: The rest of a deferred iteration to run, instead of a new iteration.
+        """
+
+        deferred = False
+
+        try:
+            if self.running and self.operating:
+                deferred = self.admit() if resume is None else resume()
+
+        except Exception as e:
+            self.stop()
+
+            warnings.warn(f"{type(e).__name__}: {str(e)}")
+
+        finally:
+            if not deferred:
+                self.fired()
+
+    def admit(self) -> bool:
+        """
+        Passes a scheduled iteration through the circuit breaker and the rate limiting, like an iteration of the loop.
+
+        A rate limited iteration is deferred in the shared timer,
+        so the waiting does not hold a thread of the scheduler.
+
+        :return: The value of the iteration being deferred.
+        """
+
+        if (self.handler is not None) and (self.handler.breaker is not None):
+            if self.blocked() is not None:
+                return False
+
+        if (self.limiter is not None) or (self.adaptive is not None):
+            wait = self.throttle()
+
+            if wait > 0:
+                return Scheduler.shared().defer(self, wait, self.iterate)
+
+        return self.iterate()
+
+    def iterate(
+            self,
+            inputs: tuple[Iterable[Any], dict[str, Any]] = None,
+            start: int = None,
+            retry: bool = False
+    ) -> bool:
+        """
+        Runs the operation of a scheduled iteration.
+
+        A failed attempt is retried from the shared timer after its backoff,
+        so the waiting does not hold a thread of the scheduler.
+
+        :param inputs: The arguments of a failed attempt to retry.
+        :param start: The start time of the iteration in nanoseconds.
+        :param retry: The value of the iteration being a retry of a failed attempt.
+
+        :return: The value of the iteration being deferred.
+        """
+
+        if (not retry) and (not self.continue_loop()):
+            self.stop()
+
+            return False
+
+        handler = self.handler
+
+        if not retry:
+            start = None if self.statistics is None else time.perf_counter_ns()
+
+            self._unflushed = None
+
+        if handler is None:
+            self.sync_operate()
+
+        else:
+            inputs = self.attempt(handler, inputs)
+
+            if handler.retrying and Scheduler.shared().defer(
+                self, handler.retry_delay,
+                partial(self.iterate, inputs, start, True)
+            ):
+                return True
+
+        if not self.handle(start):
+            self.stop()
+
+        return False
+
+    async def async_fire(self) -> None:
+        """Runs a scheduled iteration of the process in the event loop of the scheduler, like an iteration of the loop."""
+
+        try:
+            if self.running and self.operating:
+                if (self.handler is not None) and (self.handler.breaker is not None):
+                    if self.blocked() is not None:
+                        return
+
+                if (self.limiter is not None) or (self.adaptive is not None):
+                    wait = self.throttle()
+
+                    if wait > 0 and await self._halted.async_wait(wait):
+                        return
+
+                if not await self.async_continue_loop():
+                    self.stop()
+
+                elif not await self.async_step():
+                    self.stop()
+
+        except Exception as e:
+            self.stop()
+
+            warnings.warn(f"{type(e).__name__}: {str(e)}")
+
+        finally:
+            self.fired()
+
+    def fired(self) -> None:
+        """Marks a scheduled iteration of the process as done, finishing the run when stopped."""
+
+        with self._condition:
+            self._firing = False
+
+            stopped = self._scheduled and not self._running
+
+            if stopped:
+                self._scheduled = False
+
+        if stopped:
+            self.finish()
+
+    def stop_schedule(self) -> None:
+        """Stops the scheduled iterations of the process."""
+
+        handle = self._schedule_handle
+
+        if handle is not None:
+            handle.cancel()
+
+            self._schedule_handle = None
+
+        with self._condition:
+            deferred = self._deferred_handle
+
+            if deferred is not None:
+                deferred.cancel()
+
+                self._deferred_handle = None
+                self._firing = False
+
+            stopped = self._scheduled and not self._firing
+
+            if stopped:
+                self._scheduled = False
+
+        if stopped:
+            self.finish()
 
     def stop_operation(self) -> None:
         """Stops the operation loop process."""
@@ -579,11 +2675,11 @@ class Operator(Generic[_O]):
         if self.timeout:
             self._timeout = False
 
-        if (
-            isinstance(self._timeout_process, threading.Thread) and
-            self._timeout_process.is_alive()
-        ):
-            self._timeout_process = None
+        if self._timeout_handle is not None:
+            self._timeout_handle.cancel()
+            self._timeout_handle = None
+
+        self._timeout_deadline = None
 
     def stop_stopping(self) -> None:
         """Stops the stopping process."""
@@ -600,22 +2696,99 @@ class Operator(Generic[_O]):
     def pause(self) -> None:
         """Stops the screening process."""
 
+        if not self._paused:
+            self._paused_at = time.monotonic()
+
         self._paused = True
+        self._resumed.clear()
+
+        self.notify()
 
     def unpause(self) -> None:
         """Stops the screening process."""
 
+        paused_at = self._paused_at
+
+        if paused_at is not None:
+            self._paused_time += time.monotonic() - paused_at
+            self._paused_at = None
+
         self._paused = False
+        self._resumed.set()
 
-    def stop(self) -> None:
-        """Stops the screening process."""
+        if paused_at is not None:
+            if self.timeout:
+                self.schedule_timeout()
+
+            self.notify()
+
+    def terminate(self) -> None:
+        """Calls the termination callback, once for each run of the process."""
+
+        with self._condition:
+            if self._terminated:
+                return
+
+            self._terminated = True
+
+        if self.termination is not None:
+            self.termination()
+
+    def cancel(self) -> None:
+        """Cancels the running asynchronous calls and loop of the process from any thread."""
+
+        self._cancel = True
+
+        tasks = list(self._in_flight)
+
+        for task in (self._loop_task, self._task):
+            if task is not None:
+                tasks.append(task)
+
+        for task in tasks:
+            if task.done():
+                continue
+
+            try:
+                task.get_loop().call_soon_threadsafe(task.cancel)
+
+            except RuntimeError:
+                pass
+
+    def stop(self, cancel: bool = False, terminate: bool = True) -> None:
+        """
+        Stops the screening process.
+
+        :param cancel: The value to cancel concurrent calls instead of waiting for them.
+        :param terminate: The value to call the termination callback.
+        """
+
+        if cancel:
+            self._cancel = True
+
+        if self._running and (self._started_at is not None):
+            self._stopped_at = time.monotonic()
 
         self._running = False
+        self._operating = False
         self._blocking = False
 
+        self._halted.set()
+
         self.unpause()
         self.stop_operation()
         self.stop_timeout()
+        self.stop_collecting()
+        self.close_subscribers()
 
-        if self.termination is not None:
-            self.termination()
+        if terminate:
+            self.terminate()
+
+        if self._scheduled:
+            self.stop_schedule()
+
+        elif not self._looping:
+            self.finish()
+
+        else:
+            self.notify()
@@ -0,0 +1,107 @@
+# pacing.py
+
+import time
+from typing import ClassVar
+
+__all__ = [
+    "Pacer"
+]
+
+class Pacer:
+    """A class to compute the waiting time between loop iterations on a monotonic clock."""
+
+    BURST: ClassVar[str] = "burst"
+    SKIP: ClassVar[str] = "skip"
+    COALESCE: ClassVar[str] = "coalesce"
+
+    OVERRUNS: ClassVar[tuple[str, ...]] = (BURST, SKIP, COALESCE)
+
+    __slots__ = ("_start", "_next", "iterations", "missed")
+
+    def __init__(self) -> None:
+        """Defines the attributes of the pacer."""
+
+        self._start: int | None = None
+        self._next: int | None = None
+
+        self.iterations = 0
+        self.missed = 0
+
+    def reset(self) -> None:
+        """Restarts the schedule from the next iteration."""
+
+        self._start = None
+        self._next = None
+
+    def begin(self) -> None:
+        """Marks the start of an iteration."""
+
+        now = time.monotonic_ns()
+
+        self._start = now
+
+        if self._next is None:
+            self._next = now
+
+        self.iterations += 1
+
+    def wait(self, period: float, rate: bool = False, overrun: str = SKIP) -> float:
+        """
+        Returns the amount of seconds to wait before the next iteration.
+
+        With a fixed rate, iterations target the absolute ticks of a grid
+        that starts at the first iteration. When an iteration overruns one
+        or more ticks, the overrun policy decides what happens:
+        burst runs every missed tick back to back, skip waits for the next
+        tick on the grid, and coalesce runs a single iteration immediately.
+
+        :param period: The amount of seconds between iterations.
+        :param rate: The value to run in a fixed rate instead of a fixed delay.
+        :param overrun: The policy for missed ticks in a fixed rate.
+
+        :return: The amount of seconds to wait.
+        """
+
+        now = time.monotonic_ns()
+        step = int(period * 1_000_000_000)
+
+        if not rate:
+            if self._start is None:
+                return period
+
+            return max(step - (now - self._start), 0) / 1_000_000_000
+
+        if self._next is None:
+            self._next = now
+
+        if step <= 0:
+            self._next = now
+
+            return 0
+
+        self._next += step
+
+        if self._next >= now:
+            return (self._next - now) / 1_000_000_000
+
+        missed = (now - self._next) // step
+
+        if overrun == Pacer.BURST:
+            return 0
+
+        elif overrun == Pacer.SKIP:
+            self.missed += missed + 1
+            self._next += (missed + 1) * step
+
+            return (self._next - now) / 1_000_000_000
+
+        elif overrun == Pacer.COALESCE:
+            self.missed += missed
+            self._next += missed * step
+
+            return 0
+
+        raise ValueError(
+            f"Overrun policy must be one of {', '.join(Pacer.OVERRUNS)}, "
+            f"not {overrun}."
+        )
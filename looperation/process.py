@@ -1,7 +1,8 @@
 # process.py
 
+import time
 import datetime as dt
-from typing import ClassVar, Any, Self
+from typing import ClassVar, Any, Self, Iterable, Iterator
 
 from dataclasses import dataclass
 
@@ -19,9 +20,15 @@ except ImportError:
 
 __all__ = [
     "ProcessTime",
-    "to_datetime"
+    "ProcessTimeArray",
+    "to_datetime",
+    "to_datetimes"
 ]
 
+EPOCH = dt.datetime(1970, 1, 1)
+NANOSECONDS = 1_000_000_000
+HOUR = 3600
+
 def to_datetime(index: Any, adjust: bool = True) -> dt.datetime:
     """
     Converts the index into a datetime object.
@@ -100,3 +107,445 @@ class ProcessTime:
             self.START: self.start.timestamp(),
             self.END: self.end.timestamp()
         }
+
+def require_numpy() -> None:
+    """Checks that numpy is installed for the columnar times."""
+
+    if np is None:
+        raise ImportError("numpy is required for columnar process times.")
+
+def require_pandas() -> None:
+    """Checks that pandas is installed for the data frames of the columnar times."""
+
+    if pd is None:
+        raise ImportError("pandas is required for data frames of process times.")
+
+def local_offsets(epochs: Any) -> Any:
+    """
+    Returns the offsets of the local time from utc at epoch times.
+
+    The offsets are computed once for each distinct hour of the epoch times.
+
+    :param epochs: The epoch times in nanoseconds.
+
+    :return: The offsets in nanoseconds.
+    """
+
+    if not len(epochs):
+        return np.zeros(0, dtype=np.int64)
+
+    hours, inverse = np.unique(epochs // (NANOSECONDS * HOUR), return_inverse=True)
+
+    offsets = np.array(
+        [
+            int(
+                (
+                    dt.datetime.fromtimestamp(int(hour) * HOUR) - EPOCH
+                ).total_seconds()
+            ) - int(hour) * HOUR
+            for hour in hours
+        ],
+        dtype=np.int64
+    ) * NANOSECONDS
+
+    return offsets[inverse.reshape(-1)]
+
+def from_epochs(epochs: Any) -> Any:
+    """
+    Converts epoch times in nanoseconds into local datetime64 values.
+
+    :param epochs: The epoch times in nanoseconds.
+
+    :return: The datetime64[ns] array.
+    """
+
+    epochs = np.asarray(epochs, dtype=np.int64)
+
+    return (epochs + local_offsets(epochs)).astype("datetime64[ns]")
+
+def to_epochs(values: Any) -> Any:
+    """
+    Converts local datetime64 values into epoch times in nanoseconds.
+
+    :param values: The datetime64[ns] array.
+
+    :return: The epoch times in nanoseconds.
+    """
+
+    local = np.asarray(values, dtype="datetime64[ns]").astype(np.int64)
+
+    return local - local_offsets(local - local_offsets(local))
+
+def to_seconds(epochs: Any) -> Any:
+    """
+    Converts epoch nanoseconds into epoch seconds, like datetime.timestamp.
+
+    :param epochs: The epoch times in nanoseconds.
+
+    :return: The epoch times in seconds.
+    """
+
+    return (epochs // NANOSECONDS) + (epochs % NANOSECONDS // 1000) / 1_000_000
+
+def convert(values: Any) -> tuple[Any, Any]:
+    """
+    Converts values into an array of local datetimes in bulk, keeping the epoch times of absolute values.
+
+    :param values: The values to convert.
+
+    :return: The datetime64[ns] array, and the epoch times in nanoseconds or None.
+    """
+
+    require_numpy()
+
+    if (pd is not None) and isinstance(values, (pd.Series, pd.Index)):
+        if getattr(values.dtype, "tz", None) is not None:
+            epochs = values.astype("datetime64[ns, UTC]").to_numpy("datetime64[ns]").astype(np.int64)
+
+            return from_epochs(epochs), epochs
+
+        if values.dtype.kind == "M":
+            return values.to_numpy("datetime64[ns]"), None
+
+        values = values.to_numpy()
+
+    array = np.asarray(values)
+
+    if array.dtype.kind == "M":
+        return array.astype("datetime64[ns]"), None
+
+    if array.dtype.kind in "iu":
+        epochs = array.astype(np.int64) * NANOSECONDS
+
+        return from_epochs(epochs), epochs
+
+    if array.dtype.kind == "f":
+        epochs = np.round(array * 1_000_000).astype(np.int64) * 1000
+
+        return from_epochs(epochs), epochs
+
+    try:
+        if (array.dtype.kind == "O") and any(
+            getattr(value, "tzinfo", None) is not None for value in array.flat
+        ):
+            raise TypeError("Aware datetime objects are converted one by one.")
+
+        return array.astype("datetime64[ns]"), None
+
+    except (TypeError, ValueError):
+        return np.array(
+            [
+                (
+                    value.astimezone().replace(tzinfo=None)
+                    if getattr(value, "tzinfo", None) is not None else value
+                )
+                for value in (to_datetime(value, adjust=False) for value in array.tolist())
+            ],
+            dtype="datetime64[ns]"
+        ), None
+
+def to_datetimes(values: Any) -> Any:
+    """
+    Converts values into an array of local datetimes in bulk.
+
+    Accepts ISO strings, epoch seconds, datetime and pandas Timestamp objects,
+    numpy datetime64 arrays and pandas series or indexes, like to_datetime.
+
+    :param values: The values to convert.
+
+    :return: The datetime64[ns] array.
+    """
+
+    return convert(values)[0]
+
+def local_zone() -> tuple[Any, ...]:
+    """
+    Returns the rules of the local timezone that local times are converted with.
+
+    :return: The offsets and names of the local timezone.
+    """
+
+    return time.timezone, time.altzone, time.daylight, time.tzname
+
+def local_datetime(epoch: int) -> dt.datetime:
+    """
+    Converts an epoch time in nanoseconds into a local datetime object, with the fold of a repeated hour.
+
+    :param epoch: The epoch time in nanoseconds.
+
+    :return: The datetime object.
+    """
+
+    return dt.datetime.fromtimestamp(epoch // NANOSECONDS).replace(
+        microsecond=epoch % NANOSECONDS // 1000
+    )
+
+class ProcessTimeArray:
+    """
+    A class to contain the start and end times of many calls in datetime64 columns.
+
+    Local datetime64 values carry no fold, so a local time in the repeated hour
+    of a daylight saving change is ambiguous, and is taken as its first occurrence,
+    like a datetime with fold=0. Times created from epoch times, aware pandas
+    columns or process time objects keep their epoch times, and convert back exactly,
+    while the values of their columns and the local time zone do not change.
+    """
+
+    START: ClassVar[str] = ProcessTime.START
+    END: ClassVar[str] = ProcessTime.END
+
+    def __init__(self, start: Any, end: Any) -> None:
+        """
+        Defines the attributes of the times.
+
+        :param start: The start times of the calls.
+        :param end: The end times of the calls.
+        """
+
+        start, start_epochs = convert(start)
+        end, end_epochs = convert(end)
+
+        self._define(start, end, start_epochs, end_epochs)
+
+    def _define(self, start: Any, end: Any, start_epochs: Any = None, end_epochs: Any = None) -> None:
+        """
+        Defines the columns of the times.
+
+        :param start: The start datetime64[ns] column.
+        :param end: The end datetime64[ns] column.
+        :param start_epochs: The epoch start times in nanoseconds, when known.
+        :param end_epochs: The epoch end times in nanoseconds, when known.
+        """
+
+        if start.shape != end.shape:
+            raise ValueError(
+                f"Start and end columns must have the same length, "
+                f"not {len(start)} and {len(end)}."
+            )
+
+        self.start = start
+        self.end = end
+
+        self._epochs = {
+            self.START: None if start_epochs is None else (start.copy(), start_epochs),
+            self.END: None if end_epochs is None else (end.copy(), end_epochs)
+        }
+        self._zone = local_zone()
+
+    @classmethod
+    def _create(cls, start: Any, end: Any, start_epochs: Any = None, end_epochs: Any = None) -> Self:
+        """
+        Creates an instance of the class from converted columns.
+
+        :param start: The start datetime64[ns] column.
+        :param end: The end datetime64[ns] column.
+        :param start_epochs: The epoch start times in nanoseconds, when known.
+        :param end_epochs: The epoch end times in nanoseconds, when known.
+
+        :return: The new instance with the times.
+        """
+
+        times = cls.__new__(cls)
+        times._define(start, end, start_epochs, end_epochs)
+
+        return times
+
+    def _known(self, column: str, index: Any = slice(None)) -> Any:
+        """
+        Returns the epoch times a column was created from, while its values and the local timezone are unchanged.
+
+        :param column: The name of the column, start or end.
+        :param index: The integer index, slice or mask of the calls.
+
+        :return: The epoch times in nanoseconds, or None.
+        """
+
+        known = self._epochs[column]
+
+        if (known is None) or (self._zone != local_zone()):
+            return None
+
+        created, epochs = known
+
+        values = np.asarray(getattr(self, column))
+
+        if (values.shape != created.shape) or (values.dtype != created.dtype):
+            return None
+
+        if not np.array_equal(values[index], created[index]):
+            return None
+
+        return epochs[index]
+
+    def epochs(self) -> tuple[Any, Any]:
+        """
+        Returns the epoch times of the calls.
+
+        :return: The epoch start and end times in nanoseconds.
+        """
+
+        start_epochs = self._known(self.START)
+        end_epochs = self._known(self.END)
+
+        return (
+            to_epochs(self.start) if start_epochs is None else start_epochs,
+            to_epochs(self.end) if end_epochs is None else end_epochs
+        )
+
+    def __len__(self) -> int:
+        """
+        Returns the amount of calls.
+
+        :return: The amount of calls.
+        """
+
+        return len(self.start)
+
+    def __iter__(self) -> Iterator[ProcessTime]:
+        """
+        Iterates over the times of the calls.
+
+        :return: The process time objects.
+        """
+
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, index: Any) -> ProcessTime | Self:
+        """
+        Returns the time of a call, or the times of a selection of calls.
+
+        :param index: The integer index, slice or mask.
+
+        :return: The process time object, or the selected times.
+        """
+
+        start_epochs = self._known(self.START, index)
+        end_epochs = self._known(self.END, index)
+
+        if isinstance(index, (int, np.integer)):
+            return ProcessTime(
+                start=(
+                    self.start[index].astype("datetime64[us]").item()
+                    if start_epochs is None else local_datetime(int(start_epochs))
+                ),
+                end=(
+                    self.end[index].astype("datetime64[us]").item()
+                    if end_epochs is None else local_datetime(int(end_epochs))
+                )
+            )
+
+        return self._create(self.start[index], self.end[index], start_epochs, end_epochs)
+
+    def __repr__(self) -> str:
+        """
+        Returns a string to represent the times.
+
+        :return: The string.
+        """
+
+        return f"{type(self).__name__}(length={len(self)})"
+
+    @property
+    def time(self) -> Any:
+        """
+        Returns the time durations of the calls.
+
+        :return: The timedelta64[ns] array.
+        """
+
+        return self.end - self.start
+
+    @classmethod
+    def from_times(cls, times: Iterable[ProcessTime]) -> Self:
+        """
+        Creates an instance of the class from process time objects.
+
+        :param times: The process time objects.
+
+        :return: The new instance with the times.
+        """
+
+        times = list(times)
+
+        return cls(
+            start=np.array([time.start.timestamp() for time in times], dtype=np.float64),
+            end=np.array([time.end.timestamp() for time in times], dtype=np.float64)
+        )
+
+    @classmethod
+    def from_nanoseconds(cls, start: Any, end: Any) -> Self:
+        """
+        Creates an instance of the class from epoch times in nanoseconds, like History.times().
+
+        :param start: The epoch start times in nanoseconds.
+        :param end: The epoch end times in nanoseconds.
+
+        :return: The new instance with the times.
+        """
+
+        require_numpy()
+
+        start = np.asarray(start, dtype=np.int64)
+        end = np.asarray(end, dtype=np.int64)
+
+        return cls._create(from_epochs(start), from_epochs(end), start, end)
+
+    @classmethod
+    def load(cls, data: Iterable[dict[str, float]]) -> Self:
+        """
+        Creates an instance of the class for the data of many calls.
+
+        :param data: The data to load into an object.
+
+        :return: The new instance with the data.
+        """
+
+        data = list(data)
+
+        return cls(
+            start=[record[cls.START] for record in data],
+            end=[record[cls.END] for record in data]
+        )
+
+    def json(self) -> list[dict[str, float]]:
+        """
+        Returns a json object to represent the data of the object.
+
+        :return: The data of the object.
+        """
+
+        start_epochs, end_epochs = self.epochs()
+
+        starts = to_seconds(start_epochs).tolist()
+        ends = to_seconds(end_epochs).tolist()
+
+        return [
+            {self.START: start, self.END: end}
+            for start, end in zip(starts, ends)
+        ]
+
+    @classmethod
+    def from_frame(cls, frame: Any) -> Self:
+        """
+        Creates an instance of the class from a data frame of start and end columns.
+
+        :param frame: The pandas data frame.
+
+        :return: The new instance with the times.
+        """
+
+        require_pandas()
+
+        return cls(start=frame[cls.START], end=frame[cls.END])
+
+    def to_frame(self) -> Any:
+        """
+        Returns a data frame of the start and end columns.
+
+        :return: The pandas data frame.
+        """
+
+        require_pandas()
+
+        return pd.DataFrame({self.START: self.start, self.END: self.end}, copy=False)
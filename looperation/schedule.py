@@ -0,0 +1,477 @@
+# schedule.py
+
+import os
+import asyncio
+import warnings
+import threading
+import datetime as dt
+from abc import ABC, abstractmethod
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Any, ClassVar, Self
+
+from looperation.timer import Timer
+
+__all__ = [
+    "Schedule",
+    "Every",
+    "Cron",
+    "Scheduler"
+]
+
+TimeDuration = float | dt.timedelta
+
+class Schedule(ABC):
+    """A base class for wall-clock schedules of operators."""
+
+    @abstractmethod
+    def next(self, after: dt.datetime) -> dt.datetime:
+        """
+        Returns the first fire time after a time.
+
+        :param after: The time to search after.
+
+        :return: The next fire time.
+        """
+
+    def wait(self, now: dt.datetime = None) -> float:
+        """
+        Returns the amount of seconds until the next fire time.
+
+        :param now: The current time.
+
+        :return: The waiting time.
+        """
+
+        if now is None:
+            now = dt.datetime.now()
+
+        return max((self.next(now) - now).total_seconds(), 0.0)
+
+class Every(Schedule):
+    """A schedule of fixed intervals aligned to the wall clock."""
+
+    ANCHOR: ClassVar[dt.datetime] = dt.datetime(2000, 1, 1)
+
+    def __init__(self, interval: TimeDuration, offset: TimeDuration = 0.0) -> None:
+        """
+        Defines the attributes of the schedule.
+
+        Intervals are aligned to midnight, so an interval of a minute fires
+        at :00 of every minute, and an offset of 30 seconds fires at :30.
+
+        :param interval: The interval between fire times.
+        :param offset: The offset of the fire times from the aligned times.
+        """
+
+        if not isinstance(interval, dt.timedelta):
+            interval = dt.timedelta(seconds=interval)
+
+        if not isinstance(offset, dt.timedelta):
+            offset = dt.timedelta(seconds=offset)
+
+        if interval <= dt.timedelta(0):
+            raise ValueError(f"Schedule interval must be positive, not {interval}.")
+
+        self.interval = interval
+        self.offset = offset
+
+    def __repr__(self) -> str:
+        """
+        Returns a string to represent the schedule.
+
+        :return: The string.
+        """
+
+        return f"{type(self).__name__}(interval={self.interval!r}, offset={self.offset!r})"
+
+    def next(self, after: dt.datetime) -> dt.datetime:
+        """
+        Returns the first fire time after a time.
+
+        :param after: The time to search after.
+
+        :return: The next fire time.
+        """
+
+        anchor = Every.ANCHOR + self.offset
+
+        return anchor + ((after - anchor) // self.interval + 1) * self.interval
+
+class Cron(Schedule):
+    """A cron-like schedule of minute, hour, day, month and weekday fields."""
+
+    FIELDS: ClassVar[tuple[tuple[str, int, int], ...]] = (
+        ("minute", 0, 59),
+        ("hour", 0, 23),
+        ("day", 1, 31),
+        ("month", 1, 12),
+        ("weekday", 0, 7)
+    )
+
+    ALIASES: ClassVar[dict[str, str]] = {
+        "@hourly": "0 * * * *",
+        "@daily": "0 0 * * *",
+        "@weekly": "0 0 * * 0",
+        "@monthly": "0 0 1 * *",
+        "@yearly": "0 0 1 1 *"
+    }
+
+    YEARS: ClassVar[int] = 8
+
+    def __init__(self, expression: str) -> None:
+        """
+        Defines the attributes of the schedule.
+
+        Fields support *, values, ranges, lists and steps, like "30 9 * * 1-5"
+        for weekdays at 09:30, with sunday as 0 or 7.
+
+        :param expression: The cron expression.
+        """
+
+        self.expression = expression
+
+        fields = Cron.ALIASES.get(expression.strip(), expression).split()
+
+        if len(fields) != len(Cron.FIELDS):
+            raise ValueError(
+                f"Cron expression must have {len(Cron.FIELDS)} fields, "
+                f"not {len(fields)}: {expression}."
+            )
+
+        values = [
+            self.parse(text, minimum, maximum)
+            for text, (_, minimum, maximum) in zip(fields, Cron.FIELDS)
+        ]
+
+        self.minutes, self.hours, self.days, self.months, weekdays = values
+
+        self.weekdays = {weekday % 7 for weekday in weekdays}
+
+        self.any_day = fields[2] == "*"
+        self.any_weekday = fields[4] == "*"
+
+    def __repr__(self) -> str:
+        """
+        Returns a string to represent the schedule.
+
+        :return: The string.
+        """
+
+        return f"{type(self).__name__}({self.expression!r})"
+
+    @staticmethod
+    def parse(text: str, minimum: int, maximum: int) -> frozenset[int]:
+        """
+        Parses a field of a cron expression.
+
+        :param text: The text of the field.
+        :param minimum: The minimum value of the field.
+        :param maximum: The maximum value of the field.
+
+        :return: The values of the field.
+        """
+
+        values: set[int] = set()
+
+        for part in text.split(","):
+            step = 1
+
+            if "/" in part:
+                part, step_text = part.split("/", 1)
+                step = int(step_text)
+
+            if part == "*":
+                start, end = minimum, maximum
+
+            elif "-" in part:
+                start_text, end_text = part.split("-", 1)
+                start, end = int(start_text), int(end_text)
+
+            else:
+                start = int(part)
+                end = maximum if step > 1 else start
+
+            if step < 1 or start < minimum or end > maximum or start > end:
+                raise ValueError(
+                    f"Invalid cron field {text} for values between {minimum} and {maximum}."
+                )
+
+            values.update(range(start, end + 1, step))
+
+        return frozenset(values)
+
+    def matches_day(self, date: dt.date) -> bool:
+        """
+        Checks if a date matches the day fields, like cron when both are restricted.
+
+        :param date: The date to check.
+
+        :return: The value of the date matching.
+        """
+
+        day = date.day in self.days
+        weekday = (date.isoweekday() % 7) in self.weekdays
+
+        if self.any_day:
+            return weekday
+
+        if self.any_weekday:
+            return day
+
+        return day or weekday
+
+    def next(self, after: dt.datetime) -> dt.datetime:
+        """
+        Returns the first fire time after a time.
+
+        :param after: The time to search after.
+
+        :return: The next fire time.
+        """
+
+        current = after.replace(second=0, microsecond=0) + dt.timedelta(minutes=1)
+        limit = after + dt.timedelta(days=366 * Cron.YEARS)
+
+        while current <= limit:
+            if current.month not in self.months:
+                year = current.year + (current.month == 12)
+                month = current.month % 12 + 1
+
+                current = current.replace(year=year, month=month, day=1, hour=0, minute=0)
+
+                continue
+
+            if not self.matches_day(current.date()):
+                current = (current + dt.timedelta(days=1)).replace(hour=0, minute=0)
+
+                continue
+
+            if current.hour not in self.hours:
+                current = (current + dt.timedelta(hours=1)).replace(minute=0)
+
+                continue
+
+            if current.minute not in self.minutes:
+                current += dt.timedelta(minutes=1)
+
+                continue
+
+            return current
+
+        raise ValueError(f"Cron expression never fires: {self.expression}.")
+
+class Scheduler:
+    """
+    A process-wide scheduler that fires operators from the shared timer.
+
+    Synchronous iterations run in a bounded thread pool, and asynchronous
+    iterations run as tasks of a single event loop.
+    """
+
+    _shared: ClassVar[Self | None] = None
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, workers: int = None, name: str = None) -> None:
+        """
+        Defines the attributes of the scheduler.
+
+        :param workers: The maximum amount of concurrent scheduled iterations.
+        :param name: The name of the scheduler threads.
+        """
+
+        self.workers = workers
+        self.name = name
+
+        self._pool: ThreadPoolExecutor | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._process: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> Self:
+        """
+        Returns the scheduler shared by the whole process.
+
+        :return: The shared scheduler.
+        """
+
+        scheduler = cls._shared
+
+        if scheduler is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    cls._shared = cls(name="looperation-scheduler")
+
+                scheduler = cls._shared
+
+        return scheduler
+
+    @classmethod
+    def _reset(cls) -> None:
+        """Drops the shared scheduler in a forked child process."""
+
+        cls._shared = None
+        cls._shared_lock = threading.Lock()
+
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        """
+        returns the thread pool of the scheduled iterations.
+
+        :return: The thread pool.
+        """
+
+        pool = self._pool
+
+        if pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.workers,
+                        thread_name_prefix=self.name or "looperation-scheduler"
+                    )
+
+                pool = self._pool
+
+        return pool
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """
+        returns the event loop of the asynchronous scheduled iterations.
+
+        :return: The event loop.
+        """
+
+        loop = self._loop
+
+        if loop is None:
+            with self._lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+
+                    self._process = threading.Thread(
+                        target=loop.run_forever,
+                        name=f"{self.name or 'looperation-scheduler'}-loop",
+                        daemon=True
+                    )
+
+                    self._process.start()
+
+                    self._loop = loop
+
+                loop = self._loop
+
+        return loop
+
+    def add(self, operator: Any, after: dt.datetime = None) -> None:
+        """
+        Schedules the next iteration of an operator in the shared timer.
+
+        :param operator: The operator to schedule.
+        :param after: The time to schedule the iteration after.
+        """
+
+        now = dt.datetime.now()
+
+        fire = operator.schedule.next(max(after, now) if after else now)
+
+        self.arm(operator, fire, now)
+
+    def arm(self, operator: Any, fire: dt.datetime, now: dt.datetime) -> None:
+        """
+        Schedules a fire time of an operator in the shared timer.
+
+        :param operator: The operator to schedule.
+        :param fire: The fire time.
+        :param now: The current time.
+        """
+
+        operator._schedule_handle = Timer.shared().schedule(
+            max((fire - now).total_seconds(), 0.0),
+            lambda: self.due(operator, fire)
+        )
+
+    def due(self, operator: Any, fire: dt.datetime) -> None:
+        """
+        Dispatches a due iteration of an operator into the thread pool.
+
+        :param operator: The operator to run.
+        :param fire: The fire time of the iteration.
+        """
+
+        if not operator.running:
+            return
+
+        now = dt.datetime.now()
+
+        if now < fire:
+            self.arm(operator, fire, now)
+
+            return
+
+        self.add(operator, after=fire)
+
+        with operator._condition:
+            if operator.paused or operator._firing:
+                operator._pacer.missed += 1
+
+                return
+
+            operator._firing = True
+
+        if operator.is_async:
+            asyncio.run_coroutine_threadsafe(operator.async_fire(), self.loop)
+
+        else:
+            self.dispatch(operator, operator.fire)
+
+    def dispatch(self, operator: Any, callback: Callable[[], Any]) -> None:
+        """
+        Runs an iteration of an operator in the thread pool.
+
+        :param operator: The operator to run.
+        :param callback: The iteration to run.
+        """
+
+        try:
+            self.pool.submit(callback)
+
+        except RuntimeError as e:
+            operator._firing = False
+
+            warnings.warn(f"{type(e).__name__}: {str(e)}")
+
+    def defer(self, operator: Any, delay: float, resume: Callable[[], bool]) -> bool:
+        """
+        Schedules the rest of an iteration of an operator in the shared timer.
+
+        :param operator: The operator to resume.
+        :param delay: The amount of seconds to wait.
+        :param resume: The rest of the iteration to run.
+
+        :return: The value of the iteration being deferred.
+        """
+
+        def due() -> None:
+            with operator._condition:
+                if operator._deferred_handle is not handle:
+                    return
+
+                operator._deferred_handle = None
+
+            self.dispatch(operator, partial(operator.fire, resume))
+
+        with operator._condition:
+            if not operator.running:
+                return False
+
+            handle = Timer.shared().schedule(delay, due)
+
+            operator._deferred_handle = handle
+
+        return True
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=Scheduler._reset)
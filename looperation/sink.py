@@ -0,0 +1,422 @@
+# sink.py
+
+import os
+import json
+import atexit
+import pickle
+import struct
+import warnings
+import threading
+import datetime as dt
+from collections import deque
+from typing import Any, ClassVar, Iterable, Iterator, Self
+
+from looperation.control import Signal
+from looperation.process import ProcessTime
+from looperation.operation import Inputs, Outputs, Operation
+from looperation.history import from_nanoseconds
+
+__all__ = [
+    "Sink"
+]
+
+TimeDuration = float | dt.timedelta
+
+Record = tuple[int, int, Iterable[Any], dict[str, Any], Any]
+
+class Sink:
+    """A write-behind file of operation records, written in batches by a background thread."""
+
+    JSONL: ClassVar[str] = "jsonl"
+    BINARY: ClassVar[str] = "binary"
+
+    FORMATS: ClassVar[tuple[str, ...]] = (JSONL, BINARY)
+
+    NEVER: ClassVar[str] = "never"
+    ROTATE: ClassVar[str] = "rotate"
+    FLUSH: ClassVar[str] = "flush"
+
+    FSYNCS: ClassVar[tuple[str, ...]] = (NEVER, ROTATE, FLUSH)
+
+    HEADER: ClassVar[struct.Struct] = struct.Struct("<I")
+
+    def __init__(
+            self,
+            path: str,
+            format: str = JSONL,
+            size: int = 1000,
+            interval: TimeDuration = 1.0,
+            capacity: int = 100_000,
+            fsync: str = ROTATE,
+            rotate: int = None
+    ) -> None:
+        """
+        Defines the attributes of the sink.
+
+        JSONL files contain a json line of each operation. Binary files contain
+        a little-endian 4-byte length before each pickled record of
+        (start, end, args, kwargs, returns) with epoch nanosecond times.
+
+        :param path: The path of the file to write into.
+        :param format: The format of the file, one of jsonl, binary.
+        :param size: The amount of buffered records to write in a batch.
+        :param interval: The maximum time to hold a buffered record.
+        :param capacity: The maximum amount of buffered records, beyond which records are dropped.
+        :param fsync: The policy to sync the file to the disk, one of never, rotate, flush.
+        :param rotate: The file size in bytes to rotate the file at.
+        """
+
+        if format not in Sink.FORMATS:
+            raise ValueError(
+                f"Sink format must be one of {', '.join(Sink.FORMATS)}, not {format}."
+            )
+
+        if fsync not in Sink.FSYNCS:
+            raise ValueError(
+                f"Fsync policy must be one of {', '.join(Sink.FSYNCS)}, not {fsync}."
+            )
+
+        if size < 1:
+            raise ValueError(f"Sink batch size must be positive, not {size}.")
+
+        if isinstance(interval, dt.timedelta):
+            interval = interval.total_seconds()
+
+        self.path = path
+        self.format = format
+        self.size = size
+        self.interval = interval
+        self.capacity = capacity
+        self.fsync = fsync
+        self.rotate = rotate
+
+        self.written = 0
+        self.dropped = 0
+        self.rotations = 0
+        self.closed = False
+
+        self._buffer: deque[Record] = deque()
+        self._ready = Signal()
+        self._requested = 0
+        self._completed = 0
+        self._writing = False
+        self._condition = threading.Condition()
+        self._lock = threading.Lock()
+        self._file = None
+        self._process: threading.Thread | None = None
+
+    def __enter__(self) -> Self:
+        """
+        Enters the context of the sink.
+
+        :return: The sink object.
+        """
+
+        return self
+
+    def __exit__(self, base: type[Exception], exception: Exception, traceback) -> None:
+        """
+        Closes the sink when exiting the context.
+
+        :param base: The base type of the exception.
+        :param exception: The exception object.
+        :param traceback: The traceback object.
+        """
+
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        Returns the amount of buffered records.
+
+        :return: The amount of records.
+        """
+
+        return len(self._buffer)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Gets the state of the object.
+
+        :return: The state of the object.
+        """
+
+        return {
+            "path": self.path,
+            "format": self.format,
+            "size": self.size,
+            "interval": self.interval,
+            "capacity": self.capacity,
+            "fsync": self.fsync,
+            "rotate": self.rotate
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """
+        Sets the state of the object.
+
+        :param state: The state of the object.
+        """
+
+        self.__init__(**state)
+
+    def start(self) -> None:
+        """Starts the writing thread of the sink."""
+
+        with self._lock:
+            if (self._process is not None) and self._process.is_alive():
+                return
+
+            self._file = open(self.path, "ab")
+            self._writing = True
+
+            self._process = threading.Thread(
+                target=self.writing_loop, name="looperation-sink", daemon=True
+            )
+
+            self._process.start()
+
+            atexit.register(self.close)
+
+    def record(
+            self,
+            start: int,
+            end: int,
+            args: Iterable[Any],
+            kwargs: dict[str, Any],
+            returns: Any
+    ) -> None:
+        """
+        Buffers a call of an operation to be written by the writing thread.
+
+        :param start: The epoch start time of the call in nanoseconds.
+        :param end: The epoch end time of the call in nanoseconds.
+        :param args: The positional arguments of the call.
+        :param kwargs: The keyword arguments of the call.
+        :param returns: The returned value of the call.
+        """
+
+        buffer = self._buffer
+
+        if len(buffer) >= self.capacity or self.closed:
+            self.dropped += 1
+
+            return
+
+        buffer.append((start, end, args, kwargs, returns))
+
+        if self._process is None:
+            self.start()
+
+        if len(buffer) >= self.size:
+            self._ready.set()
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Writes the buffered records and waits for the writing thread.
+
+        :param timeout: The maximum amount of seconds to wait.
+
+        :return: The value of the buffer being written.
+        """
+
+        if (self._process is None) or not self._writing:
+            return not self._buffer
+
+        with self._condition:
+            self._requested += 1
+
+            requested = self._requested
+
+        self._ready.set()
+
+        with self._condition:
+            self._condition.wait_for(
+                lambda: (self._completed >= requested) or not self._writing,
+                timeout
+            )
+
+            return self._completed >= requested
+
+    def close(self) -> None:
+        """Writes the buffered records, syncs and closes the file."""
+
+        with self._lock:
+            if self.closed:
+                return
+
+            self.closed = True
+
+            process = self._process
+
+        if process is not None:
+            self._ready.set()
+
+            process.join()
+
+        atexit.unregister(self.close)
+
+    def encode(self, record: Record) -> bytes:
+        """
+        Encodes a record in the format of the sink.
+
+        :param record: The record to encode.
+
+        :return: The encoded record.
+        """
+
+        if self.format == Sink.BINARY:
+            start, end, args, kwargs, returns = record
+
+            payload = pickle.dumps(
+                (start, end, tuple(args), dict(kwargs), returns),
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+
+            return Sink.HEADER.pack(len(payload)) + payload
+
+        return json.dumps(
+            self.operation(record).json(), default=repr
+        ).encode() + b"\n"
+
+    @staticmethod
+    def operation(record: Record) -> Operation:
+        """
+        Builds the operation object of a record.
+
+        :param record: The record of the call.
+
+        :return: The operation object.
+        """
+
+        start, end, args, kwargs, returns = record
+
+        return Operation(
+            time=ProcessTime(
+                start=from_nanoseconds(start),
+                end=from_nanoseconds(end)
+            ),
+            inputs=Inputs(args=tuple(args), kwargs=dict(kwargs)),
+            outputs=Outputs(returns=returns)
+        )
+
+    def write(self) -> None:
+        """Writes the buffered records into the file in a single batch."""
+
+        buffer = self._buffer
+
+        count = len(buffer)
+
+        if not count:
+            return
+
+        chunks = []
+
+        for _ in range(count):
+            record = buffer.popleft()
+
+            try:
+                chunks.append(self.encode(record))
+
+            except Exception as e:
+                self.dropped += 1
+
+                warnings.warn(f"{type(e).__name__}: {str(e)}")
+
+        data = b"".join(chunks)
+
+        self._file.write(data)
+        self._file.flush()
+
+        self.written += len(chunks)
+
+        if self.fsync == Sink.FLUSH:
+            os.fsync(self._file.fileno())
+
+        if (self.rotate is not None) and (self._file.tell() >= self.rotate):
+            self.rotate_file()
+
+    def rotate_file(self) -> None:
+        """Closes the current file, renames it with the next number, and opens a new file."""
+
+        if self.fsync != Sink.NEVER:
+            os.fsync(self._file.fileno())
+
+        self._file.close()
+
+        number = 1
+
+        while os.path.exists(f"{self.path}.{number}"):
+            number += 1
+
+        os.replace(self.path, f"{self.path}.{number}")
+
+        self.rotations += 1
+
+        self._file = open(self.path, "ab")
+
+    def complete(self, requested: int) -> None:
+        """
+        Marks the flush requests up to a number as written.
+
+        :param requested: The number of the last written flush request.
+        """
+
+        with self._condition:
+            self._completed = requested
+
+            self._condition.notify_all()
+
+    def writing_loop(self) -> None:
+        """Runs the process of writing the buffered records in batches."""
+
+        try:
+            while not self.closed:
+                self._ready.wait(self.interval)
+                self._ready.clear()
+
+                requested = self._requested
+
+                self.write()
+                self.complete(requested)
+
+            requested = self._requested
+
+            self.write()
+            self.complete(requested)
+
+        finally:
+            try:
+                if self.fsync != Sink.NEVER:
+                    os.fsync(self._file.fileno())
+
+                self._file.close()
+
+            finally:
+                with self._condition:
+                    self._writing = False
+
+                    self._condition.notify_all()
+
+    @staticmethod
+    def read(path: str, format: str = JSONL) -> Iterator[Operation]:
+        """
+        Reads the operation records of a sink file.
+
+        :param path: The path of the file.
+        :param format: The format of the file, one of jsonl, binary.
+
+        :return: The operation records.
+        """
+
+        with open(path, "rb") as file:
+            if format == Sink.BINARY:
+                while header := file.read(Sink.HEADER.size):
+                    (length,) = Sink.HEADER.unpack(header)
+
+                    yield Sink.operation(pickle.loads(file.read(length)))
+
+            else:
+                for line in file:
+                    if line.strip():
+                        yield Operation.load(json.loads(line))
@@ -0,0 +1,228 @@
+# stats.py
+
+from typing import Any, ClassVar, Self, Iterable
+
+__all__ = [
+    "Histogram",
+    "Stats"
+]
+
+class Histogram:
+    """A log-bucketed histogram of nanosecond values with a bounded relative error."""
+
+    SUB_BITS: ClassVar[int] = 4
+    SUB: ClassVar[int] = 1 << SUB_BITS
+    BUCKETS: ClassVar[int] = (64 - SUB_BITS) * SUB + 2 * SUB
+
+    PERCENTILES: ClassVar[tuple[float, ...]] = (50.0, 90.0, 99.0, 99.9)
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        """Defines the attributes of the histogram."""
+
+        self.counts = [0] * Histogram.BUCKETS
+        self.count = 0
+        self.total = 0
+        self.min: int | None = None
+        self.max: int | None = None
+
+    @staticmethod
+    def index(value: int) -> int:
+        """
+        Returns the bucket index of a value.
+
+        :param value: The value to locate.
+
+        :return: The index of the bucket.
+        """
+
+        shift = value.bit_length() - Histogram.SUB_BITS - 1
+
+        if shift <= 0:
+            return value
+
+        return shift * Histogram.SUB + (value >> shift)
+
+    @staticmethod
+    def lower(index: int) -> int:
+        """
+        Returns the lowest value of a bucket.
+
+        :param index: The index of the bucket.
+
+        :return: The lowest value.
+        """
+
+        shift = index // Histogram.SUB - 1
+
+        if shift <= 0:
+            return index
+
+        return (index - shift * Histogram.SUB) << shift
+
+    def record(self, value: int) -> None:
+        """
+        Records a value into the histogram.
+
+        :param value: The value to record.
+        """
+
+        if value < 0:
+            value = 0
+
+        self.counts[self.index(value)] += 1
+        self.count += 1
+        self.total += value
+
+        if self.min is None or value < self.min:
+            self.min = value
+
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def percentile(self, percentile: float) -> int | None:
+        """
+        Returns the value at a percentile of the recorded values.
+
+        :param percentile: The percentile between 0 and 100.
+
+        :return: The value at the percentile.
+        """
+
+        if not self.count:
+            return None
+
+        target = max(percentile / 100 * self.count, 1)
+
+        seen = 0
+
+        for index, count in enumerate(self.counts):
+            seen += count
+
+            if seen >= target:
+                return min(max(self.lower(index), self.min), self.max)
+
+        return self.max
+
+    @property
+    def mean(self) -> float | None:
+        """
+        returns the mean of the recorded values.
+
+        :return: The mean value.
+        """
+
+        if not self.count:
+            return None
+
+        return self.total / self.count
+
+    def merge(self, other: Self) -> None:
+        """
+        Adds the values of another histogram into the histogram.
+
+        :param other: The histogram to add.
+        """
+
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+
+        self.count += other.count
+        self.total += other.total
+
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+    def reset(self) -> None:
+        """Removes all recorded values."""
+
+        self.__init__()
+
+    def json(self) -> dict[str, float | int | None]:
+        """
+        Returns a json object to represent the data of the object.
+
+        :return: The data of the object.
+        """
+
+        data = {
+            "count": self.count,
+            "mean": self.mean,
+            "min": self.min,
+            "max": self.max
+        }
+
+        for percentile in Histogram.PERCENTILES:
+            data[f"p{percentile:g}"] = self.percentile(percentile)
+
+        return data
+
+class Stats:
+    """A class to collect the statistics of an operator."""
+
+    __slots__ = ("iterations", "errors", "collector", "operation", "iteration", "active")
+
+    def __init__(self) -> None:
+        """Defines the attributes of the statistics."""
+
+        self.iterations = 0
+        self.errors = 0
+
+        self.collector = Histogram()
+        self.operation = Histogram()
+        self.iteration = Histogram()
+
+        self.active = 0.0
+
+    def reset(self, active: float = 0.0) -> None:
+        """
+        Removes all collected statistics.
+
+        :param active: The active time of the operator at the reset.
+        """
+
+        self.__init__()
+
+        self.active = active
+
+    @classmethod
+    def combine(cls, stats: Iterable[Self]) -> Self:
+        """
+        Combines the statistics of multiple operators.
+
+        :param stats: The statistics to combine.
+
+        :return: The combined statistics.
+        """
+
+        combined = cls()
+
+        for data in stats:
+            combined.iterations += data.iterations
+            combined.errors += data.errors
+
+            combined.collector.merge(data.collector)
+            combined.operation.merge(data.operation)
+            combined.iteration.merge(data.iteration)
+
+        return combined
+
+    def json(self) -> dict[str, Any]:
+        """
+        Returns a json object to represent the data of the object.
+
+        :return: The data of the object.
+        """
+
+        return {
+            "iterations": self.iterations,
+            "errors": self.errors,
+            "collector": self.collector.json(),
+            "operation": self.operation.json(),
+            "iteration": self.iteration.json()
+        }
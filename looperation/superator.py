@@ -1,18 +1,48 @@
 # superator.py
 
+import time
+import asyncio
+import threading
 import datetime as dt
+from dataclasses import dataclass, field
+from concurrent.futures import (
+    Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait
+)
 from typing import Iterable, Callable, Any
 
-from looperation.operator import Operator
+from looperation.operator import Operator, time_seconds
 from looperation.handler import Handler
+from looperation.executor import Executor
+from looperation.stats import Stats
 
 __all__ = [
-    "Superator"
+    "Superator",
+    "ShutdownReport"
 ]
 
 TimeDuration = float | dt.timedelta
 TimeDestination = TimeDuration | dt.datetime
 
+@dataclass
+class ShutdownReport:
+    """A class to represent the result of shutting down a superator."""
+
+    stopped: list[Operator] = field(default_factory=list)
+    cancelled: list[Operator] = field(default_factory=list)
+    running: list[Operator] = field(default_factory=list)
+    failed: list[tuple[Operator, Exception]] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def clean(self) -> bool:
+        """
+        returns the value of all operators stopping cleanly before the deadline.
+
+        :return: The value.
+        """
+
+        return not (self.cancelled or self.running or self.failed)
+
 class Superator(Operator):
     """A super operator to control multiple operators."""
 
@@ -25,7 +55,8 @@ class Superator(Operator):
             delay: TimeDuration = None,
             block: bool = False,
             wait: TimeDestination = None,
-            timeout: TimeDestination = None
+            timeout: TimeDestination = None,
+            workers: int = None
     ) -> None:
         """
         Defines the attributes of the operators controller.
@@ -38,9 +69,14 @@ class Superator(Operator):
         :param wait: The value to wait after starting to run the process.
         :param block: The value to block the execution.
         :param timeout: The valur to add a start_timeout to the process.
+        :param workers: The amount of shared threads to run the operators in, instead of a thread for each.
         """
 
         self.operators = list(operators)
+        self.workers = workers
+        self.executor: Executor | None = None
+
+        self._completion: Future[None] | None = None
 
         super().__init__(
             handler=handler,
@@ -52,6 +88,109 @@ class Superator(Operator):
             stopping_collector=stopping_collector
         )
 
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Gets the state of the object.
+
+        :return: The state of the object.
+        """
+
+        data = super().__getstate__()
+
+        data["_completion"] = None
+
+        return data
+
+    @property
+    def done(self) -> Future[None]:
+        """
+        returns a future that is resolved when the superator and all operators finish.
+
+        :return: The future of the run.
+        """
+
+        completion = self._completion
+
+        if completion is not None:
+            return completion
+
+        completion = Future()
+
+        self._completion = completion
+
+        futures = [super().done] + [operator.done for operator in self.operators]
+
+        pending = [len(futures)]
+        lock = threading.Lock()
+
+        def resolve(_: Future[None]) -> None:
+            with lock:
+                pending[0] -= 1
+
+                finished = not pending[0]
+
+            if finished:
+                self._resolve(completion)
+
+        for future in futures:
+            future.add_done_callback(resolve)
+
+        return completion
+
+    def join(self, timeout: float = None) -> bool:
+        """
+        Waits for the superator and all operators to finish.
+
+        :param timeout: The maximum amount of seconds to wait.
+
+        :return: The value of the process being finished.
+        """
+
+        try:
+            self.done.result(timeout)
+
+        except FutureTimeoutError:
+            return False
+
+        return True
+
+    async def async_join(self, timeout: float = None) -> bool:
+        """
+        Waits for the superator and all operators to finish in the running event loop.
+
+        :param timeout: The maximum amount of seconds to wait.
+
+        :return: The value of the process being finished.
+        """
+
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(self.done)), timeout
+            )
+
+        except asyncio.TimeoutError:
+            return False
+
+        return True
+
+    def prepare(
+            self,
+            loop: bool = None,
+            loop_stopping: bool = None,
+            block: bool = None
+    ) -> None:
+        """
+        Prepares the state of the operator object before running.
+
+        :param loop: The value to run a loop.
+        :param block: The value to block the execution.
+        :param loop_stopping: The value to evaluate stopping during a loop.
+        """
+
+        super().prepare(loop=loop, loop_stopping=loop_stopping, block=block)
+
+        self._completion = None
+
     def operate(self) -> None:
         """Runs the process of the price screening."""
 
@@ -70,7 +209,8 @@ class Superator(Operator):
             loop_stopping: bool = None,
             block: bool = None,
             wait: TimeDestination = None,
-            timeout: TimeDestination = None
+            timeout: TimeDestination = None,
+            executor: Executor = None
     ) -> None:
         """
         Runs the process of the operator object.
@@ -80,17 +220,56 @@ class Superator(Operator):
         :param block: The value to block the execution.
         :param loop_stopping: The value to evaluate stopping during a loop.
         :param timeout: The valur to add a start_timeout to the process.
+        :param executor: The executor to run the operators in, which the superator does not stop.
         """
 
+        if (executor is None) and (self.workers is not None) and (self.executor is None):
+            self.executor = Executor(workers=self.workers)
+
+        executor = executor or self.executor
+
         for operator in self.operators:
             if not any((operator.running, operator.operating)):
-                operator.run()
+                operator.run(executor=executor)
 
         super().run(
             block=block, wait=wait, timeout=timeout,
             loop=loop, loop_stopping=loop_stopping
         )
 
+    def stats(self) -> dict[str, Any]:
+        """
+        Returns a snapshot of the combined statistics of the operators.
+
+        :return: The data of the statistics.
+        """
+
+        combined = Stats.combine(
+            operator.statistics for operator in self.operators
+            if operator.statistics is not None
+        )
+
+        if self.statistics is not None:
+            combined.active = self.statistics.active
+
+        data = self.describe(combined)
+        data["operators"] = [operator.stats() for operator in self.operators]
+
+        return data
+
+    def reset_stats(self, operations: bool = True) -> None:
+        """
+        Removes all collected statistics.
+
+        :param operations: The value to reset the statistics of all operations.
+        """
+
+        if operations:
+            for operator in self.operators:
+                operator.reset_stats()
+
+        super().reset_stats()
+
     def stop_operation(self) -> None:
         """Stops the screening process."""
 
@@ -130,15 +309,124 @@ class Superator(Operator):
 
         super().unpause()
 
-    def stop(self, operations: bool = True) -> None:
+    def shutdown(
+            self,
+            deadline: TimeDuration = None,
+            grace: TimeDuration = 0.1
+    ) -> ShutdownReport:
+        """
+        Stops all operators at once and waits for them until the deadline.
+
+        The operators are signaled together, their termination callbacks run
+        concurrently, and the asynchronous work still running at the deadline
+        is cancelled. Synchronous calls cannot be interrupted, and operators
+        still running after the grace period are reported as running.
+
+        :param deadline: The maximum time to wait for the operators to stop.
+        :param grace: The time to wait for the cancelled operators after the deadline.
+
+        :return: The report of the shutdown.
+        """
+
+        start = time.monotonic()
+
+        limit = None if deadline is None else start + time_seconds(deadline)
+
+        def remaining() -> float | None:
+            return None if limit is None else max(limit - time.monotonic(), 0.0)
+
+        operators = self.operators
+
+        pending: list[Operator] = []
+
+        for operator in operators:
+            with operator._condition:
+                if not operator._terminated:
+                    operator._terminated = True
+
+                    pending.append(operator)
+
+        for operator in operators:
+            operator.stop(terminate=False)
+
+        pool = ThreadPoolExecutor(
+            max_workers=max(min(len(operators), 32), 1),
+            thread_name_prefix="looperation-shutdown"
+        )
+
+        finished: Future[None] = Future()
+        finished.set_result(None)
+
+        terminations = {
+            operator: (
+                pool.submit(operator.termination)
+                if (operator in pending) and (operator.termination is not None)
+                else finished
+            )
+            for operator in operators
+        }
+
+        pool.shutdown(wait=False)
+
+        futures = {operator: operator.done for operator in operators}
+
+        wait(list(futures.values()) + list(terminations.values()), timeout=remaining())
+
+        report = ShutdownReport()
+
+        late = [operator for operator in operators if not futures[operator].done()]
+
+        for operator in late:
+            operator.cancel()
+
+        if late:
+            wait([futures[operator] for operator in late], timeout=time_seconds(grace))
+
+        for operator in operators:
+            termination = terminations[operator]
+
+            if not (futures[operator].done() and termination.done()):
+                report.running.append(operator)
+
+            elif termination.exception() is not None:
+                report.failed.append((operator, termination.exception()))
+
+            elif operator in late:
+                report.cancelled.append(operator)
+
+            else:
+                report.stopped.append(operator)
+
+        if self.executor is not None:
+            self.executor.stop()
+            self.executor = None
+
+        super().stop()
+
+        report.elapsed = time.monotonic() - start
+
+        return report
+
+    def stop(
+            self,
+            operations: bool = True,
+            cancel: bool = False,
+            terminate: bool = True
+    ) -> None:
         """
         Stops the screening process.
 
         :param operations: The value to stop all operations.
+        :param cancel: The value to cancel concurrent calls instead of waiting for them.
+        :param terminate: The value to call the termination callback of the superator.
         """
 
         if operations:
             for operator in self.operators:
-                operator.stop()
+                operator.stop(cancel=cancel)
 
-        super().stop()
+            if self.executor is not None:
+                self.executor.stop()
+                self.executor = None
+
+        super().stop(cancel=cancel, terminate=terminate)
@@ -0,0 +1,222 @@
+# timer.py
+
+import os
+import time
+import heapq
+import warnings
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Callable, Any, ClassVar, Self
+
+__all__ = [
+    "Timer",
+    "TimerHandle"
+]
+
+class TimerHandle:
+    """A class to represent a callback scheduled in a timer."""
+
+    __slots__ = ("deadline", "callback", "timer", "cancelled")
+
+    def __init__(
+            self,
+            deadline: float,
+            callback: Callable[[], Any],
+            timer: "Timer"
+    ) -> None:
+        """
+        Defines the attributes of the handle.
+
+        :param deadline: The monotonic time to call the callback at.
+        :param callback: The callback to call.
+        :param timer: The timer that owns the handle.
+        """
+
+        self.deadline = deadline
+        self.callback = callback
+        self.timer = timer
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Cancels the scheduled callback, unless the timer already took it to be called."""
+
+        with self.timer._condition:
+            if self.cancelled:
+                return
+
+            self.cancelled = True
+
+            self.timer.discard()
+
+class Timer:
+    """A single thread that calls scheduled callbacks from a min-heap of deadlines."""
+
+    COMPACTION = 64
+    WORKERS = 4
+
+    _shared: ClassVar[Self | None] = None
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, name: str = None) -> None:
+        """
+        Defines the attributes of the timer.
+
+        :param name: The name of the timer thread.
+        """
+
+        self.name = name
+
+        self._heap: list[tuple[float, int, TimerHandle]] = []
+        self._counter = 0
+        self._cancelled = 0
+        self._condition = threading.Condition()
+        self._process: threading.Thread | None = None
+        self._pool: ThreadPoolExecutor | None = None
+
+    def __len__(self) -> int:
+        """
+        Returns the amount of scheduled callbacks.
+
+        :return: The amount of callbacks.
+        """
+
+        return len(self._heap) - self._cancelled
+
+    @classmethod
+    def shared(cls) -> Self:
+        """
+        Returns the timer shared by the whole process.
+
+        :return: The shared timer.
+        """
+
+        timer = cls._shared
+
+        if timer is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    cls._shared = cls(name="looperation-timer")
+
+                timer = cls._shared
+
+        return timer
+
+    @classmethod
+    def _reset(cls) -> None:
+        """Drops the shared timer in a forked child process."""
+
+        cls._shared = None
+        cls._shared_lock = threading.Lock()
+
+    def schedule(self, delay: float, callback: Callable[[], Any]) -> TimerHandle:
+        """
+        Schedules a callback to be called after a delay.
+
+        :param delay: The amount of seconds to wait.
+        :param callback: The callback to call.
+
+        :return: The handle of the scheduled callback.
+        """
+
+        return self.schedule_at(time.monotonic() + delay, callback)
+
+    def schedule_at(self, deadline: float, callback: Callable[[], Any]) -> TimerHandle:
+        """
+        Schedules a callback to be called at a monotonic time.
+
+        :param deadline: The monotonic time to call the callback at.
+        :param callback: The callback to call.
+
+        :return: The handle of the scheduled callback.
+        """
+
+        handle = TimerHandle(deadline=deadline, callback=callback, timer=self)
+
+        with self._condition:
+            self._counter += 1
+
+            heapq.heappush(self._heap, (deadline, self._counter, handle))
+
+            if self._heap[0][2] is handle:
+                self._condition.notify()
+
+            if self._process is None or not self._process.is_alive():
+                self._process = threading.Thread(
+                    target=self.timer_loop, name=self.name, daemon=True
+                )
+
+                self._process.start()
+
+        return handle
+
+    def submit(self, callback: Callable[[], Any]) -> Future:
+        """
+        Calls a blocking callback in the worker threads of the timer, off the timer thread.
+
+        :param callback: The callback to call.
+
+        :return: The future of the call.
+        """
+
+        with self._condition:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.WORKERS,
+                    thread_name_prefix=f"{self.name or 'looperation-timer'}-worker"
+                )
+
+            pool = self._pool
+
+        return pool.submit(callback)
+
+    def discard(self) -> None:
+        """Counts a cancelled callback and compacts the heap when needed."""
+
+        with self._condition:
+            self._cancelled += 1
+
+            if (
+                (self._cancelled > self.COMPACTION) and
+                (self._cancelled * 2 > len(self._heap))
+            ):
+                self._heap = [
+                    entry for entry in self._heap if not entry[2].cancelled
+                ]
+                self._cancelled = 0
+
+                heapq.heapify(self._heap)
+
+    def timer_loop(self) -> None:
+        """Runs the process of calling the callbacks when they are due."""
+
+        while True:
+            with self._condition:
+                while True:
+                    while self._heap and self._heap[0][2].cancelled:
+                        heapq.heappop(self._heap)
+
+                        self._cancelled = max(self._cancelled - 1, 0)
+
+                    if not self._heap:
+                        self._condition.wait()
+
+                        continue
+
+                    remaining = self._heap[0][0] - time.monotonic()
+
+                    if remaining <= 0:
+                        break
+
+                    self._condition.wait(remaining)
+
+                handle = heapq.heappop(self._heap)[2]
+                handle.cancelled = True
+
+            try:
+                handle.callback()
+
+            except Exception as e:
+                warnings.warn(f"{type(e).__name__}: {str(e)}")
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=Timer._reset)
@@ -0,0 +1,139 @@
+# test_batch.py
+
+import time
+import queue
+import itertools
+
+import pytest
+
+from looperation import Operator, Batch, Handler, Retry, Executor
+
+def test_linger_flushes_between_iterations() -> None:
+    """Checks that a lingering batch is called before the next iteration is due."""
+
+    start = time.monotonic()
+    calls = []
+
+    operator = Operator(
+        operation=lambda values: calls.append(time.monotonic() - start),
+        args_collector=lambda: (1,), delay=0.5, batch=Batch(size=100, linger=0.05), timeout=0.3
+    )
+
+    operator.run(block=True)
+
+    assert calls and calls[0] < 0.25
+
+def test_linger_flushes_without_new_input() -> None:
+    """Checks that a lingering batch is called when the queue receives no new arguments."""
+
+    inputs = queue.Queue()
+
+    for value in range(3):
+        inputs.put(value)
+
+    calls = []
+
+    operator = Operator(
+        operation=lambda values: calls.append(list(values)),
+        args_collector=lambda: (inputs.get(),),
+        queue=10, batch=Batch(size=100, linger=0.05), timeout=1
+    )
+
+    operator.run()
+
+    time.sleep(0.3)
+
+    assert calls == [[0, 1, 2]]
+
+    operator.stop()
+
+@pytest.mark.parametrize("workers", [None, 1])
+def test_single_call_flushes_the_batch(workers: int | None) -> None:
+    """
+    Checks that an operator without a loop calls the operation with its single call.
+
+    :param workers: The amount of executor threads, or None to run in a thread of the operator.
+    """
+
+    calls = []
+
+    operator = Operator(
+        operation=lambda values: calls.append(list(values)),
+        args_collector=lambda: (1,), batch=Batch(size=10), loop=False
+    )
+
+    executor = None if workers is None else Executor(workers=workers)
+
+    operator.run(executor=executor)
+
+    assert operator.join(1)
+    assert calls == [[1]]
+
+    if executor is not None:
+        executor.stop()
+
+def test_lingering_calls_are_not_iterations() -> None:
+    """Checks that calling a lingering batch between iterations is not counted as an iteration."""
+
+    calls = []
+
+    operator = Operator(
+        operation=lambda values: calls.append(len(values)),
+        args_collector=lambda: (1,), delay=0.2, stats=True,
+        batch=Batch(size=100, linger=0.05), timeout=0.5
+    )
+
+    operator.run(block=True)
+
+    assert len(calls) == 3
+    assert operator.stats()["iterations"] == sum(calls)
+
+def test_invalid_batch_keeps_its_calls() -> None:
+    """Checks that calls of a batch that cannot be converted into columns are not lost."""
+
+    batch = Batch(size=10)
+
+    operator = Operator(operation=lambda *values: None, batch=batch)
+
+    batch.add((1,), {})
+    batch.add((1, 2), {})
+
+    with pytest.raises(ValueError):
+        operator.sync_flush()
+
+    assert len(batch) == 2
+
+@pytest.mark.parametrize("workers", [None, 1])
+def test_retry_calls_the_failed_batch(workers: int | None) -> None:
+    """
+    Checks that a retry calls the same batch again, instead of collecting new calls.
+
+    :param workers: The amount of executor threads, or None to run in a thread of the operator.
+    """
+
+    calls = []
+    counter = itertools.count()
+
+    def operation(values: list[int]) -> None:
+        calls.append([int(value) for value in values])
+
+        if len(calls) == 1:
+            raise ConnectionError("refused")
+
+    operator = Operator(
+        operation=operation, args_collector=lambda: (next(counter),),
+        batch=Batch(size=3), delay=0.01, timeout=0.3,
+        handler=Handler(
+            retry=Retry(exceptions=[ConnectionError], attempts=3, base=0.01, cap=0.01)
+        )
+    )
+
+    executor = None if workers is None else Executor(workers=workers)
+
+    operator.run(executor=executor)
+
+    assert operator.join(5)
+    assert calls[:3] == [[0, 1, 2], [0, 1, 2], [3, 4, 5]]
+
+    if executor is not None:
+        executor.stop()
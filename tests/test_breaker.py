@@ -0,0 +1,73 @@
+# test_breaker.py
+
+import time
+
+from looperation import Operator, Handler, Breaker
+
+def test_collections_do_not_close_the_breaker() -> None:
+    """Checks that the collecting stage does not record successes into the breaker."""
+
+    def operation(value: int) -> None:
+        raise ConnectionError("refused")
+
+    breaker = Breaker(threshold=0.6, window=10, minimum=5, cooldown=10)
+
+    operator = Operator(
+        operation=operation, args_collector=lambda: (1,), queue=10,
+        delay=0.01, timeout=0.3, handler=Handler(
+            breaker=breaker, exception_handler=lambda h, e: h.make_proceed()
+        )
+    )
+
+    operator.run(block=True)
+
+    assert breaker.state == Breaker.OPEN
+
+def test_breaker_opens_and_probes() -> None:
+    """Checks that a breaker opens on failures, rejects calls and closes after a probe."""
+
+    breaker = Breaker(threshold=0.5, window=4, minimum=4, cooldown=0.05)
+
+    for _ in range(3):
+        breaker.success()
+
+    breaker.failure()
+
+    assert breaker.state == Breaker.CLOSED
+
+    for _ in range(2):
+        breaker.failure()
+
+    assert breaker.state == Breaker.OPEN
+    assert breaker.opened == 1
+    assert not breaker.allow()
+    assert breaker.rejected == 1
+    assert 0 < breaker.remaining() <= 0.05
+
+    time.sleep(0.06)
+
+    assert breaker.allow()
+    assert breaker.state == Breaker.HALF_OPEN
+    assert not breaker.allow()
+
+    breaker.success()
+
+    assert breaker.state == Breaker.CLOSED
+    assert breaker.failure_rate == 0.0
+
+def test_breaker_reopens_on_failed_probe() -> None:
+    """Checks that a failed probe opens the breaker again."""
+
+    breaker = Breaker(threshold=1.0, window=2, minimum=2, cooldown=0.05)
+
+    breaker.failure()
+    breaker.failure()
+
+    time.sleep(0.06)
+
+    assert breaker.allow()
+
+    breaker.failure()
+
+    assert breaker.state == Breaker.OPEN
+    assert breaker.opened == 2
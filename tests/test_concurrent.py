@@ -0,0 +1,73 @@
+# test_concurrent.py
+
+import asyncio
+import threading
+
+from looperation import Operator
+
+def test_calls_run_concurrently() -> None:
+    """Checks that an async operation runs up to max_in_flight calls at once."""
+
+    active = []
+    peak = []
+
+    async def operation() -> None:
+        active.append(1)
+        peak.append(len(active))
+
+        await asyncio.sleep(0.05)
+
+        active.pop()
+
+    operator = Operator(operation=operation, max_in_flight=4, timeout=0.3)
+
+    operator.run(block=True)
+
+    assert max(peak) == 4
+
+def test_stop_cancels_calls_at_capacity() -> None:
+    """Checks that stopping with cancel ends the calls in flight while the loop waits for capacity."""
+
+    cancelled = []
+    in_flight = []
+
+    async def operation() -> None:
+        try:
+            await asyncio.sleep(10)
+
+        except asyncio.CancelledError:
+            cancelled.append(1)
+
+            raise
+
+    operator = Operator(operation=operation, max_in_flight=2)
+
+    def stop() -> None:
+        in_flight.append(operator.in_flight)
+
+        operator.stop(cancel=True)
+
+    threading.Timer(0.1, stop).start()
+
+    operator.run(block=True)
+
+    assert in_flight == [2]
+    assert len(cancelled) == 2
+
+def test_stop_waits_for_calls() -> None:
+    """Checks that stopping without cancel lets the calls in flight finish."""
+
+    finished = []
+
+    async def operation() -> None:
+        await asyncio.sleep(0.2)
+
+        finished.append(1)
+
+    operator = Operator(operation=operation, max_in_flight=2)
+
+    threading.Timer(0.05, operator.stop).start()
+
+    operator.run(block=True)
+
+    assert len(finished) == 2
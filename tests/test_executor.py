@@ -0,0 +1,79 @@
+# test_executor.py
+
+import time
+
+import pytest
+
+from looperation import Operator, Executor
+
+@pytest.mark.parametrize("loop_stopping", [True, False])
+def test_slow_stopping_collector_does_not_block_the_executor(loop_stopping: bool) -> None:
+    """
+    Checks that a slow stopping collector runs off the event loop of the executor.
+
+    :param loop_stopping: The value to evaluate stopping during the loop.
+    """
+
+    def collect() -> bool:
+        time.sleep(0.1)
+
+        return False
+
+    counts = []
+
+    executor = Executor(workers=4)
+
+    slow = Operator(
+        operation=lambda: None, stopping_collector=collect,
+        loop_stopping=loop_stopping, delay=0.01
+    )
+    fast = Operator(operation=lambda: counts.append(1), delay=0.01)
+
+    slow.run(executor=executor)
+    fast.run(executor=executor)
+
+    time.sleep(0.5)
+
+    slow.stop()
+    fast.stop()
+
+    assert slow.join(1)
+    assert fast.join(1)
+
+    executor.stop()
+
+    assert len(counts) > 25
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_queued_operators_in_executor(workers: int) -> None:
+    """
+    Checks that operators with a queue advance without holding the threads of the executor.
+
+    :param workers: The amount of threads in the executor.
+    """
+
+    calls = [[], []]
+
+    executor = Executor(workers=workers)
+
+    operators = [
+        Operator(
+            operation=calls[i].append, args_collector=lambda: (1,),
+            queue=10, delay=0.01
+        )
+        for i in range(2)
+    ]
+
+    for operator in operators:
+        operator.run(executor=executor)
+
+    time.sleep(0.5)
+
+    for operator in operators:
+        operator.stop()
+
+    assert all(operator.join(1) for operator in operators)
+
+    executor.stop()
+
+    assert all(len(values) > 5 for values in calls)
@@ -0,0 +1,76 @@
+# test_handler.py
+
+import time
+import warnings
+
+import pytest
+
+from looperation import Handler, Retry, Reporter
+
+def test_assigned_exceptions_take_effect() -> None:
+    """Checks that exceptions assigned or added in place at runtime are handled."""
+
+    handler = Handler(exceptions=[ZeroDivisionError], silence=True)
+
+    with pytest.raises(KeyError):
+        with handler:
+            raise KeyError("key")
+
+    handler.exceptions = [*handler.exceptions, KeyError]
+
+    with handler:
+        raise KeyError("key")
+
+    assert handler.caught
+
+    handler.exceptions.append(ValueError)
+
+    with handler:
+        raise ValueError("value")
+
+    assert handler.caught
+    assert handler().types == (ZeroDivisionError, KeyError, ValueError)
+
+def test_retry_exceptions_take_effect() -> None:
+    """Checks that the exceptions of a retry are read when matching."""
+
+    retry = Retry(exceptions=[ConnectionError])
+
+    assert not retry.matches(TimeoutError())
+
+    retry.exceptions.append(TimeoutError)
+
+    assert retry.matches(TimeoutError())
+
+    retry.exceptions = None
+
+    assert retry.matches(KeyError())
+
+def test_reporter_summarizes_repeated_exceptions() -> None:
+    """Checks that repeated exceptions are reported once, and summarized after the interval."""
+
+    reporter = Reporter(interval=0.05, warn=False)
+
+    handler = Handler(reporter=reporter)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+
+        for _ in range(5):
+            with handler:
+                raise ConnectionError("refused")
+
+        with handler:
+            raise KeyError("key")
+
+    assert reporter.reported == 2
+    assert reporter.suppressed == 4
+
+    time.sleep(0.2)
+
+    assert reporter.reported == 3
+
+    with handler:
+        raise ConnectionError("refused")
+
+    assert reporter.reported == 4
@@ -0,0 +1,66 @@
+# test_history.py
+
+import itertools
+
+import pytest
+
+from looperation import Operator, History
+
+def test_last_history_is_bounded() -> None:
+    """Checks that the last mode keeps only the latest calls, in order."""
+
+    counter = itertools.count()
+    history = History(3)
+
+    operator = Operator(
+        operation=lambda value: value * 2, history=history,
+        args_collector=lambda: (next(counter),),
+        stopping_collector=lambda: history.calls >= 10, loop_stopping=True
+    )
+
+    operator.run(block=True)
+
+    assert history.calls == 10
+    assert len(history) == 3
+
+    operations = history.operations()
+
+    assert [operation.inputs.args for operation in operations] == [(7,), (8,), (9,)]
+    assert [operation.outputs.returns for operation in operations] == [14, 16, 18]
+
+    starts, ends = history.times()
+
+    assert list(starts) == sorted(starts)
+    assert all(start <= end for start, end in zip(starts, ends))
+
+def test_sampled_history_is_bounded() -> None:
+    """Checks that the every and reservoir modes sample into a fixed size."""
+
+    every = History(4, mode=History.EVERY, every=3)
+    reservoir = History(4, mode=History.RESERVOIR, seed=0)
+
+    for i in range(100):
+        every.record(i, i, (i,), {}, i)
+        reservoir.record(i, i, (i,), {}, i)
+
+    assert len(every) == 4
+    assert [operation.outputs.returns for operation in every.operations()] == [90, 93, 96, 99]
+
+    returns = [operation.outputs.returns for operation in reservoir.operations()]
+
+    assert len(returns) == 4
+    assert returns == sorted(set(returns))
+    assert len(reservoir._args) == 4
+
+    reservoir.clear()
+
+    assert len(reservoir) == 0
+
+def test_invalid_history() -> None:
+    """Checks that invalid sizes and modes are rejected."""
+
+    with pytest.raises(ValueError):
+        History(0)
+
+    with pytest.raises(ValueError):
+        History(1, mode="first")
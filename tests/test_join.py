@@ -0,0 +1,75 @@
+# test_join.py
+
+import asyncio
+
+import pytest
+
+from looperation import Operator, Superator
+
+def test_join_and_done_after_stop() -> None:
+    """Checks that joining and the done future wait for the loop to exit."""
+
+    operator = Operator(operation=lambda: None, delay=0.01)
+
+    operator.run()
+
+    assert not operator.join(0.05)
+    assert not operator.done.done()
+
+    operator.stop()
+
+    assert operator.join(1)
+    assert operator.done.result(1) is None
+    assert operator.wait_until(Operator.FINISHED, 0)
+
+def test_wait_until_states() -> None:
+    """Checks that waiting for states returns when the states are reached."""
+
+    operator = Operator(operation=lambda: None, delay=0.01)
+
+    operator.run()
+
+    assert operator.wait_until(Operator.RUNNING, 1)
+
+    operator.pause()
+
+    assert operator.wait_until(Operator.PAUSED, 1)
+    assert not operator.wait_until(Operator.RUNNING, 0.05)
+
+    operator.unpause()
+    operator.stop()
+
+    assert operator.wait_until(Operator.STOPPED, 1)
+
+    with pytest.raises(ValueError):
+        operator.wait_until("sleeping")
+
+def test_async_join() -> None:
+    """Checks that an operator is joined from an event loop."""
+
+    async def main() -> bool:
+        operator = Operator(operation=lambda: None, delay=0.01)
+
+        operator.run()
+
+        asyncio.get_running_loop().call_later(0.05, operator.stop)
+
+        return await operator.async_join(1)
+
+    assert asyncio.run(main())
+
+def test_superator_join() -> None:
+    """Checks that a superator is joined after its operators finish."""
+
+    operators = [Operator(operation=lambda: None, delay=0.01) for _ in range(3)]
+
+    superator = Superator(operators)
+
+    superator.run()
+
+    assert not superator.join(0.05)
+
+    superator.stop()
+
+    assert superator.join(1)
+    assert all(operator.done.done() for operator in operators)
@@ -0,0 +1,91 @@
+# test_limit.py
+
+import time
+import datetime as dt
+
+import pytest
+
+from looperation import Operator, Handler, TokenBucket, Adaptive
+
+def test_token_bucket_reserves_in_advance() -> None:
+    """Checks that a token bucket allows its burst and then waits for the rate."""
+
+    bucket = TokenBucket(rate=10, burst=2)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+def test_shared_limiter_bounds_the_rate() -> None:
+    """Checks that operators sharing a token bucket run at its rate together."""
+
+    calls = []
+
+    limiter = TokenBucket(rate=50, burst=1)
+
+    operators = [
+        Operator(
+            operation=lambda: calls.append(time.monotonic()),
+            limiter=limiter, timeout=0.5
+        )
+        for _ in range(2)
+    ]
+
+    operators[0].run()
+    operators[1].run(block=True)
+
+    assert 15 <= len(calls) <= 30
+
+def test_adaptive_delay() -> None:
+    """Checks that the adaptive delay grows on failures and shrinks after successes."""
+
+    adaptive = Adaptive(step=dt.timedelta(seconds=0.1), maximum=0.3, successes=2)
+
+    adaptive.failure()
+
+    assert adaptive.delay == pytest.approx(0.1)
+
+    adaptive.failure()
+    adaptive.failure()
+
+    assert adaptive.delay == pytest.approx(0.3)
+
+    adaptive.success()
+
+    assert adaptive.delay == pytest.approx(0.3)
+
+    adaptive.success()
+
+    assert adaptive.delay == pytest.approx(0.15)
+
+    adaptive.success()
+    adaptive.success()
+
+    assert adaptive.delay == 0.0
+
+def test_adaptive_slows_failing_operator() -> None:
+    """Checks that caught exceptions slow down the iterations of an operator."""
+
+    calls = []
+
+    def operation() -> None:
+        calls.append(time.monotonic())
+
+        raise ConnectionError("refused")
+
+    adaptive = Adaptive(step=0.05, maximum=0.05)
+
+    operator = Operator(
+        operation=operation, adaptive=adaptive, timeout=0.3,
+        handler=Handler(silence=True, exception_handler=lambda h, e: h.make_proceed())
+    )
+
+    operator.run(block=True)
+
+    assert adaptive.delay == pytest.approx(0.05)
+    assert 3 <= len(calls) <= 8
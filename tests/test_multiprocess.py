@@ -0,0 +1,78 @@
+# test_multiprocess.py
+
+import time
+from collections import Counter
+
+import pytest
+
+from looperation import Operator, Handler
+from looperation.multiprocess import ProcessSuperator
+
+def work() -> int:
+    """
+    Runs a short synchronous operation.
+
+    :return: The returned value.
+    """
+
+    return sum(range(100))
+
+@pytest.mark.parametrize("workers", [None, 0])
+def test_every_operator_advances(workers: int | None) -> None:
+    """
+    Checks that all operators in a worker process get to run.
+
+    :param workers: The amount of threads in each process.
+    """
+
+    counts = Counter()
+
+    operators = [Operator(operation=work) for _ in range(4)]
+
+    superator = ProcessSuperator(
+        operators,
+        processes=2,
+        workers=workers,
+        results=True,
+        handler=Handler(success_callback=lambda h: counts.update([id(h.data[0])]))
+    )
+
+    superator.run()
+    time.sleep(1)
+    superator.stop()
+
+    superator.join(5)
+    assert all(counts[id(operator)] > 0 for operator in operators)
+
+def fail() -> None:
+    """Runs a failing synchronous operation."""
+
+    raise ValueError("failure")
+
+def test_exceptions_skip_the_success_callback() -> None:
+    """Checks that forwarded exceptions reach the exception handler without the success callback."""
+
+    successes = []
+    exceptions = []
+
+    operators = [Operator(operation=work), Operator(operation=fail, delay=0.01)]
+
+    superator = ProcessSuperator(
+        operators,
+        processes=1,
+        results=True,
+        handler=Handler(
+            success_callback=lambda h: successes.append(h.data[1]),
+            exception_handler=lambda h, e: exceptions.append((h.data, e))
+        )
+    )
+
+    superator.run()
+    time.sleep(1)
+    superator.stop()
+
+    superator.join(5)
+    assert successes and set(successes) == {work()}
+    assert exceptions
+    assert all(data is operators[1] for data, _ in exceptions)
+    assert all(isinstance(e, ValueError) for _, e in exceptions)
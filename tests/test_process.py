@@ -0,0 +1,107 @@
+# test_process.py
+
+import time
+import datetime as dt
+
+import pytest
+
+from looperation import ProcessTime, ProcessTimeArray, to_datetimes
+
+np = pytest.importorskip("numpy")
+
+@pytest.fixture
+def new_york(monkeypatch) -> None:
+    """Sets the local time zone to one with daylight saving changes."""
+
+    if not hasattr(time, "tzset"):
+        pytest.skip("Time zones can not be changed on this platform.")
+
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+
+    yield
+
+    monkeypatch.undo()
+    time.tzset()
+
+def test_to_datetimes() -> None:
+    """Checks that bulk conversion matches the scalar conversion."""
+
+    epochs = [1767268800, 1767268801]
+
+    expected = np.array([dt.datetime.fromtimestamp(epoch) for epoch in epochs], dtype="datetime64[ns]")
+
+    assert (to_datetimes(epochs) == expected).all()
+    assert (to_datetimes([epoch + 0.5 for epoch in epochs]) == expected + np.timedelta64(500, "ms")).all()
+    assert (to_datetimes([value.isoformat() for value in expected.astype("datetime64[us]").tolist()]) == expected).all()
+    assert (to_datetimes(expected) == expected).all()
+
+def test_to_datetimes_pandas() -> None:
+    """Checks the conversion of pandas columns of naive and aware timestamps."""
+
+    pd = pytest.importorskip("pandas")
+
+    epochs = [1767268800, 1767268801]
+
+    expected = to_datetimes(epochs)
+
+    assert (to_datetimes(pd.Series(expected)) == expected).all()
+    assert (to_datetimes(pd.to_datetime(epochs, unit="s", utc=True)) == expected).all()
+
+def test_process_time_array_round_trip() -> None:
+    """Checks that columns convert back to the data and objects of the scalar path."""
+
+    data = [{"start": 1767268800.25, "end": 1767268801.5}, {"start": 1767268802.0, "end": 1767268803.75}]
+
+    times = ProcessTimeArray.load(data)
+
+    assert len(times) == 2
+    assert times.json() == data
+    assert list(times) == [ProcessTime.load(record) for record in data]
+    assert times[1:].json() == data[1:]
+    assert (times.time == np.array([1250, 1750], dtype="timedelta64[ms]")).all()
+    assert ProcessTimeArray.from_times(times).json() == data
+
+    with pytest.raises(ValueError):
+        ProcessTimeArray(start=[1, 2], end=[1])
+
+def test_repeated_hour_round_trip(new_york) -> None:
+    """Checks that times in the repeated hour of a daylight saving change keep their epoch times."""
+
+    epochs = [1730610000, 1730613600, 1730615400]  # 01:00 EDT, 01:00 EST, 01:30 EST.
+
+    data = [{"start": float(epoch), "end": float(epoch + 1)} for epoch in epochs]
+
+    times = ProcessTimeArray.load(data)
+
+    assert times.json() == data
+    assert [time.json() for time in times] == data
+    assert [time.json() for time in times[1:]] == data[1:]
+    assert ProcessTimeArray.from_times(times).json() == data
+
+    nanoseconds = np.array(epochs, dtype=np.int64) * 1_000_000_000
+
+    assert ProcessTimeArray.from_nanoseconds(nanoseconds, nanoseconds).epochs()[0].tolist() == nanoseconds.tolist()
+
+    local = ProcessTimeArray(start=times.start, end=times.end)
+
+    assert local.json()[1]["start"] == float(epochs[0])
+
+def test_epochs_follow_the_columns(new_york) -> None:
+    """Checks that kept epoch times follow the values of the columns, not the column objects."""
+
+    epochs = [1730610000, 1730613600]  # 01:00 EDT, 01:00 EST.
+
+    data = [{"start": float(epoch), "end": float(epoch + 1)} for epoch in epochs]
+
+    times = ProcessTimeArray.load(data)
+
+    times.start = times.start.copy()
+
+    assert times.json() == data
+    assert times[1].json() == data[1]
+
+    times.end[0] += np.timedelta64(1, "s")
+
+    assert times.json()[0]["end"] == float(epochs[0] + 2)
+    assert times[1:].json() == data[1:]
@@ -0,0 +1,78 @@
+# test_results.py
+
+import time
+import asyncio
+import itertools
+
+from looperation import Operator
+
+def test_stop_wakes_blocked_subscriber() -> None:
+    """Checks that stopping releases a loop blocked on an unread subscriber."""
+
+    operator = Operator(operation=lambda: 1)
+
+    operator.subscribe(size=1, overflow="block")
+
+    operator.run()
+    time.sleep(0.1)
+    operator.stop()
+
+    assert operator.join(1)
+
+def test_block_results_in_the_same_event_loop() -> None:
+    """Checks that a blocking stream read in the event loop of the operator does not deadlock."""
+
+    async def identity(value: int) -> int:
+        return value
+
+    async def main() -> list[int]:
+        counter = itertools.count()
+
+        operator = Operator(
+            operation=identity, args_collector=lambda: (next(counter),),
+            delay=0.01, timeout=0.3
+        )
+
+        results = operator.aresults(size=2, overflow="block")
+
+        operator.start_task()
+
+        values = []
+
+        async for outputs in results:
+            values.append(outputs.returns)
+
+            await asyncio.sleep(0.05)
+
+        return values
+
+    values = asyncio.run(asyncio.wait_for(main(), 5))
+
+    assert values == list(range(len(values)))
+    assert len(values) > 2
+
+def test_results_after_the_run_finished() -> None:
+    """Checks that streaming the results of a finished run ends instead of blocking."""
+
+    operator = Operator(operation=lambda: 1, loop=False)
+
+    operator.run(block=True)
+
+    assert operator.join(1)
+    assert list(operator.results()) == []
+
+    async def main() -> list:
+        return [outputs async for outputs in operator.aresults()]
+
+    assert asyncio.run(asyncio.wait_for(main(), 1)) == []
+
+def test_results_before_the_run() -> None:
+    """Checks that a stream opened before the run receives its results."""
+
+    operator = Operator(operation=lambda: 1, loop=False)
+
+    results = operator.results()
+
+    operator.run()
+
+    assert [outputs.returns for outputs in results] == [1]
@@ -0,0 +1,53 @@
+# test_retry.py
+
+import time
+
+from looperation import Operator, Handler, Retry
+
+def test_retry_until_success() -> None:
+    """Checks that a failed operation is retried with backoff until it succeeds."""
+
+    calls = []
+
+    def operation() -> None:
+        calls.append(time.monotonic())
+
+        if len(calls) < 3:
+            raise ConnectionError("refused")
+
+    retry = Retry(attempts=5, base=0.02, jitter=False)
+
+    operator = Operator(
+        operation=operation, loop=False,
+        handler=Handler(retry=retry, silence=True)
+    )
+
+    operator.run(block=True)
+
+    assert len(calls) == 3
+    assert retry.retries == 2
+    assert retry.exhausted == 0
+    assert calls[2] - calls[1] >= 0.04 - 0.005
+
+def test_retry_exhausted() -> None:
+    """Checks that a retry gives up after its attempts, and other exceptions are not retried."""
+
+    handler = Handler(retry=Retry(exceptions=(ConnectionError,), attempts=2, base=0), silence=True)
+
+    with handler:
+        raise ConnectionError("refused")
+
+    assert handler.retrying
+
+    with handler:
+        raise ConnectionError("refused")
+
+    assert not handler.retrying
+    assert handler.caught
+    assert handler.retry.exhausted == 1
+
+    with handler:
+        raise KeyError("key")
+
+    assert not handler.retrying
+    assert handler.retry.retries == 1
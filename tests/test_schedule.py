@@ -0,0 +1,167 @@
+# test_schedule.py
+
+import time
+import datetime as dt
+
+import pytest
+
+from looperation import Operator, Handler, Retry, Breaker, TokenBucket, Every, Cron
+from looperation.schedule import Schedule, Scheduler
+
+def test_schedule_is_abstract() -> None:
+    """Checks that a schedule without a next fire time cannot be created."""
+
+    with pytest.raises(TypeError):
+        Schedule()
+
+def test_cron_parse() -> None:
+    """Checks the parsing of values, ranges, lists and steps of a cron field."""
+
+    assert Cron.parse("*", 0, 5) == {0, 1, 2, 3, 4, 5}
+    assert Cron.parse("3", 0, 59) == {3}
+    assert Cron.parse("1-4", 0, 59) == {1, 2, 3, 4}
+    assert Cron.parse("*/15", 0, 59) == {0, 15, 30, 45}
+    assert Cron.parse("10-20/5", 0, 59) == {10, 15, 20}
+    assert Cron.parse("50/5", 0, 59) == {50, 55}
+    assert Cron.parse("1,5,7-8", 0, 59) == {1, 5, 7, 8}
+
+    for text in ("60", "5-2", "*/0", "x"):
+        with pytest.raises(ValueError):
+            Cron.parse(text, 0, 59)
+
+def test_cron_fields() -> None:
+    """Checks the fields of a cron expression and its aliases."""
+
+    cron = Cron("@daily")
+
+    assert cron.minutes == {0} and cron.hours == {0}
+    assert Cron("0 0 * * 7").weekdays == {0}
+
+    with pytest.raises(ValueError):
+        Cron("* * *")
+
+def test_cron_next() -> None:
+    """Checks the next fire times of cron expressions."""
+
+    after = dt.datetime(2024, 1, 1, 9, 29, 30)  # a monday.
+
+    assert Cron("30 9 * * 1-5").next(after) == dt.datetime(2024, 1, 1, 9, 30)
+    assert Cron("30 9 * * 1-5").next(
+        dt.datetime(2024, 1, 5, 9, 30)
+    ) == dt.datetime(2024, 1, 8, 9, 30)
+    assert Cron("*/20 * * * *").next(after) == dt.datetime(2024, 1, 1, 9, 40)
+    assert Cron("0 0 1 * *").next(after) == dt.datetime(2024, 2, 1)
+    assert Cron("0 0 29 2 *").next(after) == dt.datetime(2024, 2, 29)
+    assert Cron("0 0 1 1 *").next(dt.datetime(2024, 12, 31, 23, 59)) == dt.datetime(2025, 1, 1)
+
+def test_cron_day_or_weekday() -> None:
+    """Checks that restricted day and weekday fields match either, like cron."""
+
+    cron = Cron("0 0 13 * 5")  # the 13th, or any friday.
+
+    assert cron.next(dt.datetime(2024, 1, 1)) == dt.datetime(2024, 1, 5)
+    assert cron.next(dt.datetime(2024, 1, 12)) == dt.datetime(2024, 1, 13)
+
+    assert Cron("0 0 13 * *").next(dt.datetime(2024, 1, 1)) == dt.datetime(2024, 1, 13)
+    assert Cron("0 0 * * 5").next(dt.datetime(2024, 1, 6)) == dt.datetime(2024, 1, 12)
+
+def test_cron_never_fires() -> None:
+    """Checks that an expression with no matching date is rejected."""
+
+    with pytest.raises(ValueError):
+        Cron("0 0 31 2 *").next(dt.datetime(2024, 1, 1))
+
+def test_every_next() -> None:
+    """Checks that fixed intervals are aligned to the wall clock."""
+
+    every = Every(60, offset=30)
+
+    assert every.next(dt.datetime(2024, 1, 1, 9, 0, 10)) == dt.datetime(2024, 1, 1, 9, 0, 30)
+    assert every.next(dt.datetime(2024, 1, 1, 9, 0, 30)) == dt.datetime(2024, 1, 1, 9, 1, 30)
+
+def test_retries_do_not_hold_the_scheduler(monkeypatch) -> None:
+    """Checks that the backoff of a failing scheduled operator does not block the other operators."""
+
+    monkeypatch.setattr(Scheduler, "_shared", Scheduler(workers=1))
+
+    def fail() -> None:
+        raise ConnectionError("refused")
+
+    counts = []
+
+    failing = Operator(
+        operation=fail, schedule=Every(0.05),
+        handler=Handler(
+            retry=Retry(attempts=100, base=10, cap=10, jitter=False), silence=True
+        )
+    )
+    working = Operator(operation=lambda: counts.append(1), schedule=Every(0.05))
+
+    failing.run()
+    working.run()
+
+    time.sleep(0.5)
+
+    failing.stop()
+    working.stop()
+
+    assert failing.join(1)
+    assert working.join(1)
+    assert len(counts) > 3
+
+def test_async_schedule() -> None:
+    """Checks that asynchronous scheduled operators run in the event loop of the scheduler."""
+
+    counts = []
+
+    async def operation() -> None:
+        counts.append(1)
+
+    operator = Operator(operation=operation, schedule=Every(0.05))
+
+    operator.run()
+
+    time.sleep(0.3)
+
+    operator.stop()
+
+    assert operator.join(1)
+    assert len(counts) > 2
+
+def test_schedule_respects_an_open_breaker() -> None:
+    """Checks that a scheduled operator makes no calls through an open circuit breaker."""
+
+    breaker = Breaker(threshold=0.5, window=2, minimum=1, cooldown=10)
+    breaker.failure()
+
+    counts = []
+
+    operator = Operator(
+        operation=lambda: counts.append(1), schedule=Every(0.02),
+        handler=Handler(breaker=breaker)
+    )
+
+    operator.run()
+    time.sleep(0.3)
+    operator.stop()
+
+    assert operator.join(1)
+    assert breaker.state == Breaker.OPEN
+    assert not counts
+
+def test_schedule_respects_the_limiter() -> None:
+    """Checks that a scheduled operator takes a token of its rate limiter for each iteration."""
+
+    counts = []
+
+    operator = Operator(
+        operation=lambda: counts.append(1), schedule=Every(0.02),
+        limiter=TokenBucket(rate=5, burst=1)
+    )
+
+    operator.run()
+    time.sleep(0.5)
+    operator.stop()
+
+    assert operator.join(1)
+    assert 1 <= len(counts) <= 4
@@ -0,0 +1,36 @@
+# test_shutdown.py
+
+from looperation import Operator, Superator
+
+def fail() -> None:
+    """Raises an exception in a termination callback."""
+
+    raise RuntimeError("termination failed")
+
+def test_shutdown_nested_superator() -> None:
+    """Checks that a superator inside a superator is shut down with the others."""
+
+    inner = Superator([Operator(operation=lambda: None, delay=0.01)])
+    outer = Superator([inner, Operator(operation=lambda: None, delay=0.01)])
+
+    outer.run()
+
+    report = outer.shutdown(deadline=2)
+
+    assert report.clean
+    assert len(report.stopped) == 2
+    assert inner.join(1)
+
+def test_failed_termination_is_reported_once() -> None:
+    """Checks that an operator with a failed termination is reported only as failed."""
+
+    failing = Operator(operation=lambda: None, delay=0.01, termination=fail)
+    superator = Superator([failing, Operator(operation=lambda: None, delay=0.01)])
+
+    superator.run()
+
+    report = superator.shutdown(deadline=2)
+
+    assert [operator for operator, _ in report.failed] == [failing]
+    assert failing not in report.stopped
+    assert len(report.stopped) == 1
@@ -0,0 +1,34 @@
+# test_sink.py
+
+import threading
+
+import pytest
+
+from looperation import Sink
+
+def test_encoding_error_drops_the_record(tmp_path) -> None:
+    """Checks that a record that cannot be encoded is dropped without stopping the writer."""
+
+    path = str(tmp_path / "calls.bin")
+
+    sink = Sink(path, format="binary", size=1, interval=0.05)
+
+    with pytest.warns(UserWarning):
+        sink.record(1, 2, (), {}, 1)
+        sink.record(1, 2, (), {}, threading.Lock())
+        sink.record(1, 2, (), {}, 3)
+
+        assert sink.flush(2)
+
+    assert sink.dropped == 1
+
+    sink.record(1, 2, (), {}, 4)
+
+    assert sink.flush(2)
+
+    sink.close()
+
+    assert [
+        operation.outputs.returns
+        for operation in Sink.read(path, format="binary")
+    ] == [1, 3, 4]
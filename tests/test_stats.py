@@ -0,0 +1,75 @@
+# test_stats.py
+
+import time
+import itertools
+
+from looperation import Operator, Superator, Handler
+from looperation.stats import Histogram
+
+def test_iterations_and_errors_are_counted() -> None:
+    """Checks that the statistics count iterations, errors and the latencies of completed calls."""
+
+    counter = itertools.count()
+
+    def operation(value: int) -> None:
+        if value % 2:
+            raise ValueError(value)
+
+    operator = Operator(
+        operation=operation, stats=True,
+        args_collector=lambda: (next(counter),),
+        handler=Handler(silence=True, exception_handler=lambda h, e: h.make_proceed()),
+        stopping_collector=lambda: operator.statistics.iterations >= 10, loop_stopping=True
+    )
+
+    operator.run(block=True)
+
+    stats = operator.stats()
+
+    assert stats["iterations"] == 10
+    assert stats["errors"] == 5
+    assert stats["operation"]["count"] == 5
+    assert stats["iteration"]["count"] == 10
+    assert stats["active_time"] > 0
+    assert stats["target_rate"] is None
+
+    operator.reset_stats()
+
+    stats = operator.stats()
+
+    assert stats["iterations"] == 0
+    assert stats["errors"] == 0
+
+def test_superator_combines_stats() -> None:
+    """Checks that a superator sums the statistics of its operators."""
+
+    operators = [
+        Operator(operation=lambda: None, stats=True, loop=False)
+        for _ in range(3)
+    ]
+
+    superator = Superator(operators)
+    superator.run()
+
+    time.sleep(0.2)
+
+    assert superator.stats()["iterations"] == 3
+
+    superator.stop()
+
+def test_histogram_percentiles() -> None:
+    """Checks that histogram percentiles stay within the relative error of the buckets."""
+
+    histogram = Histogram()
+
+    for value in range(1, 10_001):
+        histogram.record(value * 1000)
+
+    assert histogram.count == 10_000
+    assert histogram.min == 1000
+    assert histogram.max == 10_000_000
+
+    for percentile in Histogram.PERCENTILES:
+        expected = percentile / 100 * 10_000_000
+
+        assert abs(histogram.percentile(percentile) - expected) <= expected / Histogram.SUB
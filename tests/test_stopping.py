@@ -0,0 +1,75 @@
+# test_stopping.py
+
+import time
+import itertools
+
+from looperation import Operator
+
+def test_stopping_every_iterations() -> None:
+    """Checks that the stopping collector is evaluated only every few iterations."""
+
+    counter = itertools.count(1)
+    checks = []
+
+    def stopping() -> bool:
+        checks.append(iterations[-1])
+
+        return iterations[-1] >= 10
+
+    iterations = [0]
+
+    operator = Operator(
+        operation=lambda: iterations.append(next(counter)),
+        stopping_collector=stopping, loop_stopping=True, stopping_every=5
+    )
+
+    operator.run(block=True)
+
+    assert checks == [0, 5, 10]
+    assert iterations[-1] == 10
+
+def test_stopping_interval() -> None:
+    """Checks that the stopping collector is evaluated at most once per interval."""
+
+    checks = []
+
+    def stopping() -> bool:
+        checks.append(time.monotonic())
+
+        return len(checks) >= 3
+
+    operator = Operator(
+        operation=lambda: None, stopping_collector=stopping,
+        loop_stopping=True, stopping_interval=0.05
+    )
+
+    start = time.monotonic()
+
+    operator.run(block=True)
+
+    assert len(checks) == 3
+    assert time.monotonic() - start >= 0.1 - 0.005
+    assert all(
+        second - first >= 0.05 - 0.005
+        for first, second in zip(checks, checks[1:])
+    )
+
+def test_background_stopping_interval() -> None:
+    """Checks that stopping outside the loop is evaluated in the interval."""
+
+    checks = []
+
+    def stopping() -> bool:
+        checks.append(time.monotonic())
+
+        return len(checks) >= 3
+
+    operator = Operator(
+        operation=lambda: None, delay=0.001, stopping_collector=stopping,
+        loop_stopping=False, stopping_interval=0.05
+    )
+
+    operator.run(block=True)
+
+    assert len(checks) == 3
+    assert checks[-1] - checks[0] >= 0.1 - 0.005
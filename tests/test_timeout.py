@@ -0,0 +1,73 @@
+# test_timeout.py
+
+import sys
+import time
+import asyncio
+import threading
+
+from looperation import Operator
+from looperation.timer import Timer
+
+def test_slow_termination_does_not_delay_other_timeouts() -> None:
+    """Checks that a slow termination callback does not hold the shared timer."""
+
+    slow = Operator(
+        operation=lambda: None, delay=0.01, timeout=0.1,
+        termination=lambda: time.sleep(1)
+    )
+    fast = Operator(operation=lambda: None, delay=0.01, timeout=0.2)
+
+    start = time.monotonic()
+
+    slow.run()
+    fast.run(block=True)
+
+    assert time.monotonic() - start < 0.6
+
+def test_task_timeout_stops_in_the_event_loop(monkeypatch) -> None:
+    """Checks that the timeout of a task stops it in its event loop, without timer workers."""
+
+    timer = Timer()
+
+    monkeypatch.setattr(Timer, "_shared", timer)
+
+    threads = []
+
+    async def main() -> None:
+        operator = Operator(
+            operation=lambda: None, delay=0.01,
+            termination=lambda: threads.append(threading.current_thread())
+        )
+
+        await asyncio.wait_for(operator.start_task(timeout=0.1), 5)
+
+    asyncio.run(main())
+
+    assert threads
+    assert all(thread is threading.main_thread() for thread in threads)
+    assert timer._pool is None
+
+def test_cancel_racing_the_timer() -> None:
+    """Checks that cancelling callbacks while they become due keeps the count of the timer."""
+
+    interval = sys.getswitchinterval()
+
+    timer = Timer()
+
+    called = []
+    handles = [timer.schedule(0, lambda i=i: called.append(i)) for i in range(20_000)]
+
+    sys.setswitchinterval(1e-6)
+
+    try:
+        for handle in handles:
+            handle.cancel()
+
+    finally:
+        sys.setswitchinterval(interval)
+
+    time.sleep(0.1)
+
+    assert len(timer) == 0
+    assert timer._cancelled == 0
+    assert len(set(called)) == len(called)